@@ -25,9 +25,17 @@ Usage:
     python -m evals tasks                                    # Run all tasks
     python -m evals tasks --task investigation_tasks         # Run all investigation tasks
     python -m evals tasks --task-id <task_id>                # Run specific task
+    python -m evals tasks --task-ids <id1> <id2>             # Run several tasks
     python -m evals tasks --task investigation_tasks --task-id <task_id>  # Combine filters
+    python -m evals tasks --shard 2/4 --durations prev.jsonl # Run one of 4 balanced shards
+    python -m evals tasks --output results.jsonl             # Export results (JSON Lines)
+    python -m evals tasks --concurrency 4                    # Run up to 4 tasks at once
+    python -m evals tasks --trials 10 --pass-threshold 0.8   # Pass rate with confidence interval
+    python -m evals tasks --profile profiles/                # CPU profiles per task
+    python -m evals tasks --record recordings/               # Record real boto3 calls as mocks
     python -m evals tasks -v                                 # Verbose output
     python -m evals tasks --no-cleanup                       # Skip cleanup after eval
+    python -m evals compare baseline.jsonl candidate.jsonl   # Compare two --output runs
 
 Example:
     export MCP_SERVER_ROOT=/path/to/mcp
@@ -36,16 +44,19 @@ Example:
 
 import argparse
 import asyncio
-import importlib
-import os
+import json
 import sys
 import traceback
-from evals.core import EvalRunner, TaskResult
 from evals.core.eval_config import MCP_SERVER_ROOT
-from evals.core.task import Task
+from evals.core.scheduling import load_task_durations, parse_shard, partition_tasks
+from evals.core.task_index import TaskIndex
 from loguru import logger
 from pathlib import Path
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
+
+
+if TYPE_CHECKING:
+    from evals.core.task_result import TaskResult
 
 
 # TODO: Review print() vs logger usage pattern for consistency.
@@ -55,80 +66,130 @@ from typing import Dict, List
 logger.remove()
 
 
-def _discover_tasks(task_dir: Path) -> tuple[List[Task], Dict[str, List[Task]]]:
-    """Auto-discover all tasks from *_tasks.py files in the specified directory.
+def _report_task_results(result: 'TaskResult', verbose: bool = False) -> None:
+    """Report results for a single task run.
 
     Args:
-        task_dir: Path to directory containing task modules
-
-    Returns:
-        Tuple of (all_tasks, tasks_by_module)
+        result: TaskResult from EvalRunner
+        verbose: If True, include captured data in output
     """
-    all_tasks = []
-    tasks_by_module = {}
+    # TODO: Export detailed results to file and print only brief summary (pass/fail).
+    # Need more usage/feedback to determine what belongs in summary vs detailed report.
+    print(result)
 
-    # Add task directories to sys.path to enable bare module imports with importlib.import_module().
-    # Alternative: require task directories to be proper packages (with __init__.py) and use fully qualified imports.
-    evals_dir = task_dir.parent
-    evals_dir_str = str(evals_dir.absolute())
-    if evals_dir_str not in sys.path:
-        sys.path.insert(0, evals_dir_str)
+    if verbose:
+        print('\n')
+        print(result.get_captured_data_str())
+        print('\n')
 
-    task_dir_str = str(task_dir.absolute())
-    if task_dir_str not in sys.path:
-        sys.path.insert(0, task_dir_str)
 
-    task_files = list(task_dir.rglob('*_tasks.py'))
-    logger.debug(f'Discovered task files in {task_dir}: {task_files}')
+def _report_trial_summaries(results: List['TaskResult'], trials: int, confidence: float) -> None:
+    """Print pass rate and latency statistics per task across trials."""
+    from evals.core.trials import TrialSummary
 
-    for task_file in task_files:
-        # Convert file path to module name relative to task_dir
-        rel_path = task_file.relative_to(task_dir)
-        module_name = str(rel_path.with_suffix('')).replace('/', '.')
+    results_by_task: Dict[str, List['TaskResult']] = {}
+    for result in results:
+        results_by_task.setdefault(result.task_id, []).append(result)
 
-        try:
-            module = importlib.import_module(module_name)
+    print('=' * 60)
+    print(f'TRIAL SUMMARY ({trials} trials per task, {confidence:.0%} confidence intervals)')
+    print('=' * 60)
+    for task_id, task_results in results_by_task.items():
+        summary = TrialSummary.from_results(
+            task_id, task_results, confidence, stopped_early=len(task_results) < trials
+        )
+        print(f'  {summary}')
+    print('=' * 60)
 
-            if hasattr(module, 'TASKS'):
-                tasks = module.TASKS
-                # Validate that all items in TASKS are Task instances
-                valid_tasks = []
-                for task in tasks:
-                    if isinstance(task, Task):
-                        valid_tasks.append(task)
-                    else:
-                        logger.warning(
-                            f'Skipping non-Task object in {module_name}.TASKS: {task} '
-                            f'(type: {type(task).__name__})'
-                        )
 
-                if valid_tasks:
-                    all_tasks.extend(valid_tasks)
-                    tasks_by_module[module_name] = valid_tasks
-                    logger.debug(f'Loaded {len(valid_tasks)} tasks from {module_name}')
+def _report_tool_latency(results: List['TaskResult']) -> None:
+    """Print per-tool latency merged across all task runs, slowest total first."""
+    from evals.core.latency_histogram import format_latency_line, merge_tool_latencies
 
-        except Exception as e:
-            logger.warning(f'Failed to load tasks from {module_name}: {e}')
+    merged = merge_tool_latencies(
+        r.metrics['tool_latency'] for r in results if r.metrics and r.metrics.get('tool_latency')
+    )
+    if not merged:
+        return
 
-    return all_tasks, tasks_by_module
+    print('=' * 60)
+    print(f'TOOL LATENCY (all {len(results)} task runs)')
+    print('=' * 60)
+    for tool_name, histogram in sorted(merged.items(), key=lambda item: -item[1].total):
+        print(format_latency_line(tool_name, histogram.summary()))
+    print('=' * 60)
 
 
-def _report_task_results(task: Task, result: TaskResult, verbose: bool = False) -> None:
-    """Report results for a single task.
+def _report_phase_summary(results: List['TaskResult']) -> None:
+    """Print time per phase across all task runs, with each phase's share of all phase time.
 
-    Args:
-        task: Task instance
-        result: TaskResult from EvalRunner
-        verbose: If True, include captured data in output
+    Shares are of summed phase time, not sweep wall time: runs overlap with --concurrency,
+    and time between phases (e.g., building prompts and metrics) is not timed.
     """
-    # TODO: Export detailed results to file and print only brief summary (pass/fail).
-    # Need more usage/feedback to determine what belongs in summary vs detailed report.
-    print(result)
+    from evals.core.phase_timer import summarize_phases
 
-    if verbose:
-        print('\n')
-        print(result.get_captured_data_str())
-        print('\n')
+    phase_maps = [r.metrics['phases'] for r in results if r.metrics and r.metrics.get('phases')]
+    if not phase_maps:
+        return
+
+    print('=' * 60)
+    print(f'PHASE SUMMARY ({len(phase_maps)} task runs)')
+    print('=' * 60)
+    print(f'  {"Phase":<16} {"Total":>10} {"Mean":>10} {"% of phase time":>16}')
+    for phase, total, share in summarize_phases(phase_maps):
+        print(f'  {phase:<16} {total:>9.2f}s {total / len(phase_maps):>9.2f}s {share:>16.1%}')
+    print('=' * 60)
+
+
+def _shard_arg(value: str) -> tuple[int, int]:
+    """Parse --shard for argparse."""
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _write_results(output_path: Path, results: List['TaskResult']) -> None:
+    """Write task results as JSON Lines (readable by --durations)."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w') as f:
+        for result in results:
+            f.write(json.dumps(result.to_dict(), default=str) + '\n')
+    print(f'Wrote results for {len(results)} task(s) to {output_path}')
+
+
+def compare_main(argv: List[str]) -> None:
+    """Entry point for comparing two results files written with --output."""
+    from evals.core.run_comparison import DEFAULT_REGRESSION_THRESHOLD, compare_runs
+
+    parser = argparse.ArgumentParser(
+        prog='python -m evals compare', description='Compare two eval runs'
+    )
+    parser.add_argument('baseline', type=Path, help='Results file of the reference run')
+    parser.add_argument('candidate', type=Path, help='Results file of the run to evaluate')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        help='Relative change for a metric to count as a regression (default: 0.1, i.e., 10%%)',
+    )
+    parser.add_argument(
+        '--fail-on-regression',
+        action='store_true',
+        help='Exit with status 1 if a task starts failing or a metric regresses past --threshold',
+    )
+    args = parser.parse_args(argv)
+
+    logger.add(sys.stderr, level='WARNING', format='<level>{message}</level>')
+    for path in (args.baseline, args.candidate):
+        if not path.is_file():
+            logger.error(f'Results file not found: {path}')
+            sys.exit(1)
+
+    comparison = compare_runs(args.baseline, args.candidate)
+    print(comparison.format_report(args.threshold))
+    if args.fail_on_regression and comparison.has_regressions(args.threshold):
+        sys.exit(1)
 
 
 async def main():
@@ -141,14 +202,84 @@ async def main():
     parser.add_argument(
         '--verbose', '-v', action='store_true', help='Enable verbose/debug logging'
     )
-    # TODO: Support multiple values (--tasks, --task-ids with nargs='+')
     parser.add_argument(
         '--task',
-        help='Run all tasks from specific task file (e.g., investigation_tasks). Can be combined with --task-id',
+        '--tasks',
+        dest='tasks',
+        nargs='+',
+        action='extend',
+        metavar='TASK_MODULE',
+        help='Run all tasks from specific task files (e.g., investigation_tasks). Can be combined with --task-id',
     )
     parser.add_argument(
         '--task-id',
-        help='Run specific task by ID (e.g., petclinic_scheduling_rca). Can be combined with --task to limit scope',
+        '--task-ids',
+        dest='task_ids',
+        nargs='+',
+        action='extend',
+        metavar='TASK_ID',
+        help='Run specific tasks by ID (e.g., petclinic_scheduling_rca). Can be combined with --task to limit scope',
+    )
+    parser.add_argument(
+        '--shard',
+        type=_shard_arg,
+        metavar='I/N',
+        help='Run only shard I of N (1-based) of the selected tasks, e.g., 2/4 on the second of four CI runners',
+    )
+    parser.add_argument(
+        '--durations',
+        type=Path,
+        metavar='RESULTS_FILE',
+        help='Results file from a previous --output run, used to balance --shard by task duration',
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=1,
+        help='Number of tasks to run at once (longest expected tasks start first, default: 1)',
+    )
+    parser.add_argument(
+        '--trials',
+        type=int,
+        default=1,
+        help='Run each task this many times and report pass rate and latency statistics',
+    )
+    parser.add_argument(
+        '--pass-threshold',
+        type=float,
+        metavar='RATE',
+        help='With --trials, stop running a task once its pass rate interval is entirely above or below RATE (e.g., 0.8)',
+    )
+    parser.add_argument(
+        '--confidence',
+        type=float,
+        default=0.95,
+        help='Confidence level of pass rate intervals (default: 0.95)',
+    )
+    parser.add_argument(
+        '--profile',
+        type=Path,
+        metavar='DIR',
+        help='Profile CPU use of each task run and its MCP server, writing profiles to DIR',
+    )
+    parser.add_argument(
+        '--profiler',
+        choices=['sampling', 'pyinstrument'],
+        default='sampling',
+        help='Profiler for --profile: stdlib sampling (collapsed stacks) or pyinstrument (HTML)',
+    )
+    parser.add_argument(
+        '--record',
+        type=Path,
+        metavar='DIR',
+        help='Let real boto3 calls through and record them as mock_config.json and fixtures '
+        'in DIR/<task id> for offline replay',
+    )
+    parser.add_argument(
+        '--output',
+        type=Path,
+        metavar='RESULTS_FILE',
+        help='Write one JSON result per task to this file (JSON Lines)',
     )
     parser.add_argument('--list', action='store_true', help='List all available tasks and exit')
     parser.add_argument(
@@ -158,6 +289,16 @@ async def main():
     )
 
     args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error('--concurrency must be at least 1')
+    if args.trials < 1:
+        parser.error('--trials must be at least 1')
+    if not 0 < args.confidence < 1:
+        parser.error('--confidence must be between 0 and 1')
+    if args.pass_threshold is not None and not 0 <= args.pass_threshold <= 1:
+        parser.error('--pass-threshold must be between 0 and 1')
+    if args.record and args.trials > 1:
+        parser.error('--record cannot be combined with --trials')
 
     # Validate MCP_SERVER_ROOT environment variable
     if not MCP_SERVER_ROOT:
@@ -197,56 +338,124 @@ async def main():
 
     print(f'Starting MCP tool evaluation for {args.task_dir}\n')
 
-    all_tasks, tasks_by_module = _discover_tasks(task_dir)
+    # Listing and filtering use the cached index; only selected modules are imported
+    task_index = TaskIndex(task_dir)
+    task_ids_by_module = task_index.get_task_ids()
 
-    if not all_tasks:
+    if not task_ids_by_module:
         logger.error('No tasks found in *_tasks.py files')
         sys.exit(1)
 
     if args.list:
         print('Available task modules and tasks:\n')
-        for module_name, module_tasks in tasks_by_module.items():
+        for module_name, task_ids in task_ids_by_module.items():
             print(f'{module_name}:')
-            for task in module_tasks:
-                print(f'  - {task.id}')
+            for task_id in task_ids:
+                print(f'  - {task_id}')
             print('')
         sys.exit(0)
 
     # Filter by task module if specified
-    if args.task:
-        if args.task not in tasks_by_module:
-            logger.error(f"Task module '{args.task}' not found")
-            print(f'Available modules: {", ".join(tasks_by_module.keys())}')
+    if args.tasks:
+        unknown_modules = [m for m in args.tasks if m not in task_ids_by_module]
+        if unknown_modules:
+            logger.error(f"Task module(s) not found: {', '.join(unknown_modules)}")
+            print(f'Available modules: {", ".join(task_ids_by_module.keys())}')
             sys.exit(1)
-        tasks = tasks_by_module[args.task]
+        module_names = list(dict.fromkeys(args.tasks))
     else:
-        tasks = all_tasks
+        module_names = list(task_ids_by_module)
+
+    selected = [
+        (module_name, task_id)
+        for module_name in module_names
+        for task_id in task_ids_by_module[module_name]
+    ]
 
     # Filter by task ID if specified
-    if args.task_id:
-        filtered_tasks = [t for t in tasks if t.id == args.task_id]
-        if not filtered_tasks:
-            logger.error(f"Task ID '{args.task_id}' not found")
-            if args.task:
-                print(f'Available tasks in {args.task}: {", ".join(t.id for t in tasks)}')
+    if args.task_ids:
+        available_ids = [task_id for _, task_id in selected]
+        unknown_ids = [t for t in args.task_ids if t not in available_ids]
+        if unknown_ids:
+            logger.error(f"Task ID(s) not found: {', '.join(unknown_ids)}")
+            if args.tasks:
+                print(f'Available tasks in {", ".join(module_names)}: {", ".join(available_ids)}')
             else:
-                print(f'Available task IDs: {", ".join(t.id for t in all_tasks)}')
+                print(f'Available task IDs: {", ".join(available_ids)}')
             sys.exit(1)
-        tasks = filtered_tasks
+        selected = [(m, t) for m, t in selected if t in args.task_ids]
+
+    # Keep only this runner's shard (computed from task IDs, before importing task modules)
+    if args.shard:
+        shard_index, shard_count = args.shard
+        durations = load_task_durations(args.durations) if args.durations else {}
+        shards = partition_tasks(
+            selected,
+            {key: durations[key[1]] for key in selected if key[1] in durations},
+            shard_count,
+        )
+        selected = shards[shard_index - 1]
+        print(f'Shard {shard_index}/{shard_count}: {len(selected)} task(s)')
+        if not selected:
+            sys.exit(0)
+
+    tasks_by_module = task_index.load_tasks(list(dict.fromkeys(m for m, _ in selected)))
+    selected_set = set(selected)
+    tasks = [
+        task
+        for module_name, module_tasks in tasks_by_module.items()
+        for task in module_tasks
+        if (module_name, task.id) in selected_set
+    ]
+    if not tasks:
+        logger.error('Failed to load selected tasks')
+        sys.exit(1)
 
     print(f'Loaded {len(tasks)} task(s)')
     for task in tasks:
         print(f'  - {task.id}')
     print('')
 
-    # Create runner and execute tasks
+    # Create runner and execute tasks (imported here to keep --list and --help fast)
+    from evals.core.eval_runner import EvalRunner
+
+    profiler = None
+    if args.profile:
+        from evals.core.profiling import EvalProfiler
+
+        try:
+            profiler = EvalProfiler(args.profile, args.profiler)
+        except ImportError:
+            logger.error('--profiler pyinstrument requires pyinstrument (pip install pyinstrument)')
+            sys.exit(1)
+
     try:
-        runner = EvalRunner(tasks=tasks)
-        results = await runner.run_all(args.verbose, skip_cleanup=args.no_cleanup)
+        runner = EvalRunner(tasks=tasks, profiler=profiler, record_dir=args.record)
+        results = await runner.run_all(
+            args.verbose,
+            skip_cleanup=args.no_cleanup,
+            concurrency=args.concurrency,
+            trials=args.trials,
+            pass_threshold=args.pass_threshold,
+            confidence=args.confidence,
+        )
 
-        # Report results
-        for task, result in zip(tasks, results):
-            _report_task_results(task, result, verbose=args.verbose)
+        # Report results (with --trials, individual runs only in verbose mode)
+        if args.trials == 1 or args.verbose:
+            for result in results:
+                _report_task_results(result, verbose=args.verbose)
+        if args.trials > 1:
+            _report_trial_summaries(results, args.trials, args.confidence)
+        if len(results) > 1:
+            _report_phase_summary(results)
+            _report_tool_latency(results)
+
+        if args.output:
+            _write_results(args.output, results)
+        if args.profile:
+            print(f'Wrote profiles to {args.profile} (merged profile: merged.*)')
+        if args.record:
+            print(f'Recorded boto3 calls to {args.record}/<task id>/mock_config.json')
 
         # TODO: Investigate more reliable subprocess cleanup mechanism
         # Give subprocess time to clean up before event loop closes (Python < 3.11)
@@ -261,6 +470,9 @@ async def main():
 
 
 if __name__ == '__main__':
+    if sys.argv[1:2] == ['compare']:
+        compare_main(sys.argv[2:])
+        sys.exit(0)
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
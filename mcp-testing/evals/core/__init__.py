@@ -27,46 +27,163 @@ This framework provides reusable components for evaluating MCP tools:
 # Current structure has inconsistent naming and all modules in single core/ directory.
 # Consider: grouping related modules into subdirectories (validation/, mocking/, execution/, etc.)
 
-# Core abstractions
-from .task import Task
-from .captor import (
-    Captor,
-    GitDiffCaptor,
-    ToolCallsCaptor,
-    ConversationCaptor,
-    FinalResponseCaptor,
-    ToolResultsCaptor,
-    GIT_DIFF,
-    FINAL_RESPONSE,
-    TOOL_CALLS,
-)
-from .validator import (
-    Validator,
-    LLMJudgeValidator,
-    BuildValidator,
-    ToolCallValidator,
-    ToolPresenceValidator,
-)
-from .validation_prompts import ValidationPromptType
-from .llm_provider import LLMProvider, BedrockLLMProvider
-from .process_executor import ProcessExecutor, SubprocessExecutor
-from .mock_config_path_normalizer import MockConfigPathNormalizer
-from .eval_runner import EvalRunner
-from .task_result import TaskResult
-
-# Mocking system
-from .mcp_dependency_mocking_handler import (
-    McpDependencyMockingHandler,
-    Boto3DependencyMockingHandler,
-    McpDependencyMockingHandlerRegistry,
-    get_registry,
-)
-
-# Lower-level utilities
-from .conversation_runner import execute_tool, run_conversation, convert_mcp_tools_to_bedrock
-from .file_tools import get_file_tools
-from .mcp_client import connect_to_mcp_server
-from .metrics_tracker import MetricsTracker
+import importlib
+from typing import TYPE_CHECKING
+
+
+# Public names are imported on first access (PEP 562), so importing evals.core (e.g., for
+# `python -m evals --list`) does not load mcp, unittest.mock, validators and captors.
+_LAZY_IMPORTS = {
+    # Core abstractions
+    'Task': '.task',
+    'Captor': '.captor',
+    'GitDiffCaptor': '.captor',
+    'ToolCallsCaptor': '.captor',
+    'ConversationCaptor': '.captor',
+    'FinalResponseCaptor': '.captor',
+    'ToolResultsCaptor': '.captor',
+    'GIT_DIFF': '.captor',
+    'FINAL_RESPONSE': '.captor',
+    'TOOL_CALLS': '.captor',
+    'Validator': '.validator',
+    'LLMJudgeValidator': '.validator',
+    'BuildValidator': '.validator',
+    'ToolCallValidator': '.validator',
+    'ToolCallPatternValidator': '.validator',
+    'ToolPresenceValidator': '.validator',
+    'ToolCallPattern': '.tool_call_pattern',
+    'ToolCallPatternError': '.tool_call_pattern',
+    'compile_tool_call_pattern': '.tool_call_pattern',
+    'ValidationPromptType': '.validation_prompts',
+    'BuildResultCache': '.build_cache',
+    'get_default_build_cache': '.build_cache',
+    'BuildSandbox': '.build_sandbox',
+    'get_default_build_sandbox': '.build_sandbox',
+    'OutputExcerpt': '.output_capture',
+    'StreamingOutputCapture': '.output_capture',
+    'TaskIndex': '.task_index',
+    'load_task_durations': '.scheduling',
+    'partition_tasks': '.scheduling',
+    'order_longest_first': '.scheduling',
+    'TaskHistory': '.scheduling',
+    'TrialSummary': '.trials',
+    'wilson_interval': '.trials',
+    'RunComparison': '.run_comparison',
+    'compare_runs': '.run_comparison',
+    'LLMProvider': '.llm_provider',
+    'BedrockLLMProvider': '.llm_provider',
+    'AsyncProcessExecutor': '.process_executor',
+    'ProcessExecutor': '.process_executor',
+    'SubprocessExecutor': '.process_executor',
+    'MockConfigPathNormalizer': '.mock_config_path_normalizer',
+    'EvalRunner': '.eval_runner',
+    'TaskResult': '.task_result',
+    'DEPENDENCY_AND_BUILD_DIRS': '.workspace_snapshot',
+    'WorkspaceChanges': '.workspace_snapshot',
+    'WorkspaceSnapshot': '.workspace_snapshot',
+    'TemplateWorkspaceProvider': '.workspace_provider',
+    'WorkspacePool': '.workspace_provider',
+    'ensure_private_copy': '.workspace_provider',
+    # Mocking system
+    'McpDependencyMockingHandler': '.mcp_dependency_mocking_handler',
+    'Boto3DependencyMockingHandler': '.mcp_dependency_mocking_handler',
+    'BotocoreDependencyMockingHandler': '.mcp_dependency_mocking_handler',
+    'McpDependencyMockingHandlerRegistry': '.mcp_dependency_mocking_handler',
+    'get_registry': '.mcp_dependency_mocking_handler',
+    'RequestMatcher': '.mcp_dependency_mocking_handler',
+    # Lower-level utilities
+    'execute_tool': '.conversation_runner',
+    'run_conversation': '.conversation_runner',
+    'convert_mcp_tools_to_bedrock': '.conversation_runner',
+    'get_file_tools': '.file_tools',
+    'connect_to_mcp_server': '.mcp_client',
+    'MetricsTracker': '.metrics_tracker',
+    'ToolCall': '.metrics_tracker',
+    'LatencyHistogram': '.latency_histogram',
+    'trace_span': '.tracing',
+    'PhaseTimer': '.phase_timer',
+    'EvalProfiler': '.profiling',
+    'SamplingProfiler': '.profiling',
+    'MockRecorder': '.mock_recorder',
+    'FixturePack': '.fixture_pack',
+}
+
+
+def __getattr__(name: str):
+    """Import public names on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily imported names."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+if TYPE_CHECKING:
+    # Core abstractions
+    from .task import Task
+    from .captor import (
+        Captor,
+        GitDiffCaptor,
+        ToolCallsCaptor,
+        ConversationCaptor,
+        FinalResponseCaptor,
+        ToolResultsCaptor,
+        GIT_DIFF,
+        FINAL_RESPONSE,
+        TOOL_CALLS,
+    )
+    from .validator import (
+        Validator,
+        LLMJudgeValidator,
+        BuildValidator,
+        ToolCallValidator,
+        ToolCallPatternValidator,
+        ToolPresenceValidator,
+    )
+    from .tool_call_pattern import ToolCallPattern, ToolCallPatternError, compile_tool_call_pattern
+    from .validation_prompts import ValidationPromptType
+    from .build_cache import BuildResultCache, get_default_build_cache
+    from .build_sandbox import BuildSandbox, get_default_build_sandbox
+    from .output_capture import OutputExcerpt, StreamingOutputCapture
+    from .task_index import TaskIndex
+    from .scheduling import TaskHistory, load_task_durations, order_longest_first, partition_tasks
+    from .trials import TrialSummary, wilson_interval
+    from .run_comparison import RunComparison, compare_runs
+    from .llm_provider import LLMProvider, BedrockLLMProvider
+    from .process_executor import AsyncProcessExecutor, ProcessExecutor, SubprocessExecutor
+    from .mock_config_path_normalizer import MockConfigPathNormalizer
+    from .eval_runner import EvalRunner
+    from .task_result import TaskResult
+    from .workspace_snapshot import DEPENDENCY_AND_BUILD_DIRS, WorkspaceChanges, WorkspaceSnapshot
+    from .workspace_provider import TemplateWorkspaceProvider, WorkspacePool, ensure_private_copy
+
+    # Mocking system
+    from .mcp_dependency_mocking_handler import (
+        McpDependencyMockingHandler,
+        Boto3DependencyMockingHandler,
+        BotocoreDependencyMockingHandler,
+        McpDependencyMockingHandlerRegistry,
+        RequestMatcher,
+        get_registry,
+    )
+
+    # Lower-level utilities
+    from .conversation_runner import execute_tool, run_conversation, convert_mcp_tools_to_bedrock
+    from .file_tools import get_file_tools
+    from .mcp_client import connect_to_mcp_server
+    from .metrics_tracker import MetricsTracker, ToolCall
+    from .latency_histogram import LatencyHistogram
+    from .tracing import trace_span
+    from .phase_timer import PhaseTimer
+    from .profiling import EvalProfiler, SamplingProfiler
+    from .mock_recorder import MockRecorder
+    from .fixture_pack import FixturePack
 
 
 __all__ = [
@@ -86,8 +203,28 @@ __all__ = [
     'LLMJudgeValidator',
     'BuildValidator',
     'ToolCallValidator',
+    'ToolCallPatternValidator',
     'ToolPresenceValidator',
     'ValidationPromptType',
+    'BuildResultCache',
+    'get_default_build_cache',
+    'BuildSandbox',
+    'get_default_build_sandbox',
+    'OutputExcerpt',
+    'StreamingOutputCapture',
+    'TaskIndex',
+    'load_task_durations',
+    'partition_tasks',
+    'order_longest_first',
+    'TaskHistory',
+    'TrialSummary',
+    'wilson_interval',
+    'RunComparison',
+    'compare_runs',
+    # Tool call patterns
+    'ToolCallPattern',
+    'ToolCallPatternError',
+    'compile_tool_call_pattern',
     # Captured data constants
     'GIT_DIFF',
     'FINAL_RESPONSE',
@@ -97,16 +234,34 @@ __all__ = [
     'BedrockLLMProvider',
     # Process executors
     'ProcessExecutor',
+    'AsyncProcessExecutor',
     'SubprocessExecutor',
+    # Workspace snapshots
+    'WorkspaceSnapshot',
+    'WorkspaceChanges',
+    'DEPENDENCY_AND_BUILD_DIRS',
+    'TemplateWorkspaceProvider',
+    'WorkspacePool',
+    'ensure_private_copy',
     # Mock config path normalization
     'MockConfigPathNormalizer',
     # Mocking
     'McpDependencyMockingHandler',
     'Boto3DependencyMockingHandler',
+    'BotocoreDependencyMockingHandler',
     'McpDependencyMockingHandlerRegistry',
     'get_registry',
+    'RequestMatcher',
     # Utilities
     'MetricsTracker',
+    'ToolCall',
+    'LatencyHistogram',
+    'trace_span',
+    'PhaseTimer',
+    'EvalProfiler',
+    'SamplingProfiler',
+    'MockRecorder',
+    'FixturePack',
     'connect_to_mcp_server',
     'convert_mcp_tools_to_bedrock',
     'get_file_tools',
@@ -0,0 +1,185 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Content-addressed cache of build command results.
+
+Results are keyed on the build command and a hash of every file under the build
+working directory (excluding dependency and build output directories), so identical
+agent output skips the build. When the working directory is in a git repository,
+files inside excluded directories that git tracks or does not ignore are hashed too,
+so no source file is left out of the key. Entries are JSON files evicted least-recently-used
+first once the cache exceeds its size bound.
+
+Only successful builds are cached (see BuildValidator), so a failure caused by a
+transient network or registry error is not replayed for later runs.
+
+Toolchain versions are not part of the key; clear the cache after upgrading them.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from .process_executor import ProcessExecutor, SubprocessExecutor
+from .workspace_snapshot import DEPENDENCY_AND_BUILD_DIRS, WorkspaceSnapshot
+from loguru import logger
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional
+
+
+# Timeout in seconds for listing git source files when computing a key
+GIT_LS_FILES_TIMEOUT = 30
+
+class BuildResultCache:
+    """Size-bounded on-disk cache of build results."""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_bytes: int,
+        excluded_dirs: FrozenSet[str] = DEPENDENCY_AND_BUILD_DIRS,
+        process_executor: Optional[ProcessExecutor] = None,
+    ):
+        """Initialize build result cache.
+
+        Args:
+            cache_dir: Directory for cache entries (created on first write)
+            max_bytes: Maximum total size of cache entries
+            excluded_dirs: Directory names ignored when hashing the working directory
+            process_executor: ProcessExecutor for git (default: SubprocessExecutor, since
+                              make_key runs in a worker thread)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.excluded_dirs = excluded_dirs
+        self.process_executor = (
+            process_executor if process_executor is not None else SubprocessExecutor()
+        )
+        self._lock = threading.Lock()
+
+    def make_key(self, command: str, working_dir: Path) -> str:
+        """Compute the cache key for running command in working_dir.
+
+        Args:
+            command: Build command
+            working_dir: Build working directory
+
+        Returns:
+            Hex digest identifying the command and working directory contents
+        """
+        snapshot = WorkspaceSnapshot.capture(
+            Path(working_dir), excluded_dirs=self.excluded_dirs, max_diff_file_size=0
+        )
+        hasher = hashlib.sha256()
+        hasher.update(command.encode('utf-8'))
+        hasher.update(b'\0')
+        hasher.update(snapshot.digest.encode('ascii'))
+        for rel_path in _git_source_files(Path(working_dir), self.process_executor):
+            full_path = Path(working_dir) / rel_path
+            if rel_path in snapshot.files or not full_path.is_file():
+                continue
+            hasher.update(b'\0')
+            hasher.update(rel_path.encode('utf-8'))
+            hasher.update(b'\0')
+            hasher.update(hashlib.sha256(full_path.read_bytes()).digest())
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for key, or None on a miss."""
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'r') as f:
+                result = json.load(f)
+            # Refresh mtime so eviction is least-recently-used
+            os.utime(entry_path)
+            return result
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f'Ignoring unreadable build cache entry {entry_path}: {e}')
+            return None
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a result and evict old entries if the cache is over its size bound."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.tmp_', suffix='.json')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(result, f)
+            os.replace(tmp_path, self._entry_path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        self._evict()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f'{key}.json'
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries = []
+            total = 0
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith('.json') and not entry.name.startswith('.'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total += stat.st_size
+
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.unlink(path)
+                    total -= size
+                except OSError:
+                    pass
+
+
+def _git_source_files(working_dir: Path, process_executor: ProcessExecutor) -> List[str]:
+    """Return tracked and untracked, non-ignored files under working_dir, sorted.
+
+    Returns an empty list if working_dir is not in a git repository or git is missing.
+
+    Raises:
+        subprocess.TimeoutExpired: If git does not finish within GIT_LS_FILES_TIMEOUT
+    """
+    try:
+        result = process_executor.run(
+            ['git', 'ls-files', '-z', '--cached', '--others', '--exclude-standard'],
+            cwd=str(working_dir),
+            timeout=GIT_LS_FILES_TIMEOUT,
+        )
+    except OSError:
+        return []
+    if result.returncode != 0:
+        return []
+    return sorted(set(path for path in result.stdout.split('\0') if path))
+
+
+_default_cache: Optional[BuildResultCache] = None
+
+
+def get_default_build_cache() -> Optional[BuildResultCache]:
+    """Return the process-wide build cache, or None if disabled via MCP_EVAL_BUILD_CACHE."""
+    global _default_cache
+    from .eval_config import BUILD_CACHE_ENABLED, BUILD_CACHE_MAX_BYTES, CACHE_DIR
+
+    if not BUILD_CACHE_ENABLED:
+        return None
+    if _default_cache is None:
+        _default_cache = BuildResultCache(Path(CACHE_DIR) / 'builds', BUILD_CACHE_MAX_BYTES)
+    return _default_cache
@@ -0,0 +1,236 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared dependency caches and warm node_modules for build validation.
+
+Each task builds in a fresh workspace, so without shared caches every build
+re-downloads its dependencies. A BuildSandbox provides:
+
+- Environment variables pointing npm, Terraform, Maven, Gradle, NuGet and pip at
+  persistent cache directories, preferring cached packages over the network
+- Snapshots of node_modules keyed by lockfile hash, saved after a successful build
+  and cloned into later workspaces with the same lockfile before the build runs
+
+npm rewrites files in node_modules in place, so snapshots are reflinked or copied
+into workspaces, never hardlinked. Lockfiles are hashed once before the build, since
+the build may rewrite them; pass the result of find_node_projects() to both prepare()
+and save().
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from .workspace_provider import FileCloner
+from .workspace_snapshot import DEPENDENCY_AND_BUILD_DIRS
+from loguru import logger
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+# Lockfiles that pin the contents of node_modules, in order of preference
+NODE_LOCKFILES = ('package-lock.json', 'npm-shrinkwrap.json', 'yarn.lock', 'pnpm-lock.yaml')
+
+NODE_MODULES = 'node_modules'
+
+
+class BuildSandbox:
+    """Shared dependency caches for build commands. Thread-safe."""
+
+    def __init__(
+        self,
+        cache_root: Path,
+        offline: bool = False,
+        warm_node_modules: bool = True,
+        max_node_modules_snapshots: int = 16,
+        allow_hardlinks: bool = False,
+    ):
+        """Initialize build sandbox.
+
+        Args:
+            cache_root: Directory holding the per-tool dependency caches
+            offline: If True, fail instead of downloading dependencies missing from the
+                     caches (for tools that support it through environment variables)
+            warm_node_modules: If True, save and restore node_modules snapshots
+            max_node_modules_snapshots: Number of node_modules snapshots kept (least
+                                        recently used are removed first)
+            allow_hardlinks: If True, snapshots may be hardlinked into workspaces when
+                             reflinks are unavailable. Only safe if builds never modify
+                             node_modules in place (npm install and npm ci do).
+        """
+        self.cache_root = Path(cache_root)
+        self.offline = offline
+        self.warm_node_modules = warm_node_modules
+        self.max_node_modules_snapshots = max_node_modules_snapshots
+        self._cloner = FileCloner(allow_hardlinks=allow_hardlinks)
+        self._lock = threading.Lock()
+
+    @property
+    def node_modules_dir(self) -> Path:
+        """Return the directory holding node_modules snapshots."""
+        return self.cache_root / 'node_modules'
+
+    def get_env(self, base: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """Return environment variables for a build command.
+
+        Args:
+            base: Environment to extend (default: os.environ)
+
+        Returns:
+            New environment dict
+        """
+        env = dict(os.environ if base is None else base)
+        terraform_plugins = self.cache_root / 'terraform' / 'plugins'
+        # Terraform ignores the plugin cache if the directory does not exist
+        terraform_plugins.mkdir(parents=True, exist_ok=True)
+
+        env.update(
+            {
+                'npm_config_cache': str(self.cache_root / 'npm'),
+                'npm_config_audit': 'false',
+                'npm_config_fund': 'false',
+                'npm_config_update_notifier': 'false',
+                'TF_PLUGIN_CACHE_DIR': str(terraform_plugins),
+                # Sample apps do not commit .terraform.lock.hcl, which disables the cache otherwise
+                'TF_PLUGIN_CACHE_MAY_BREAK_DEPENDENCY_LOCK_FILE': 'true',
+                'GRADLE_USER_HOME': str(self.cache_root / 'gradle'),
+                'NUGET_PACKAGES': str(self.cache_root / 'nuget' / 'packages'),
+                'DOTNET_CLI_TELEMETRY_OPTOUT': '1',
+                'DOTNET_SKIP_FIRST_TIME_EXPERIENCE': '1',
+                'PIP_CACHE_DIR': str(self.cache_root / 'pip'),
+                'PIP_DISABLE_PIP_VERSION_CHECK': '1',
+            }
+        )
+        maven_repo = f'-Dmaven.repo.local={self.cache_root / "m2" / "repository"}'
+        env['MAVEN_OPTS'] = f'{env.get("MAVEN_OPTS", "")} {maven_repo}'.strip()
+
+        if self.offline:
+            env['npm_config_offline'] = 'true'
+            env['MAVEN_ARGS'] = f'{env.get("MAVEN_ARGS", "")} --offline'.strip()
+            env['PIP_NO_INDEX'] = '1'
+        else:
+            env['npm_config_prefer_offline'] = 'true'
+        return env
+
+    def find_node_projects(self, working_dir: Path) -> List[Tuple[Path, str]]:
+        """Return (project directory, lockfile hash) for each locked Node.js project.
+
+        Call before the build, which may rewrite lockfiles.
+        """
+        return _find_node_projects(Path(working_dir))
+
+    def prepare(
+        self, working_dir: Path, node_projects: Optional[List[Tuple[Path, str]]] = None
+    ) -> Dict[str, str]:
+        """Restore warm node_modules into working_dir and return the build environment.
+
+        Projects that already have node_modules are left untouched.
+
+        Args:
+            working_dir: Build working directory
+            node_projects: Result of find_node_projects() (default: computed now)
+
+        Returns:
+            Environment for the build command
+        """
+        if self.warm_node_modules:
+            if node_projects is None:
+                node_projects = _find_node_projects(Path(working_dir))
+            for project_dir, key in node_projects:
+                target = project_dir / NODE_MODULES
+                snapshot = self.node_modules_dir / key
+                if target.exists() or not snapshot.is_dir():
+                    continue
+                self._cloner.clone_tree(snapshot, target)
+                # Refresh mtime so eviction is least-recently-used
+                os.utime(snapshot)
+                logger.debug(f'Restored warm node_modules into {project_dir}')
+        return self.get_env()
+
+    def save(
+        self, working_dir: Path, node_projects: Optional[List[Tuple[Path, str]]] = None
+    ) -> None:
+        """Snapshot node_modules of projects under working_dir after a successful build.
+
+        Args:
+            working_dir: Build working directory
+            node_projects: find_node_projects() result from before the build, so
+                           snapshots are saved under the keys prepare() looks up
+                           (default: computed now)
+        """
+        if not self.warm_node_modules:
+            return
+        if node_projects is None:
+            node_projects = _find_node_projects(Path(working_dir))
+        for project_dir, key in node_projects:
+            source = project_dir / NODE_MODULES
+            snapshot = self.node_modules_dir / key
+            if not source.is_dir() or snapshot.exists():
+                continue
+
+            self.node_modules_dir.mkdir(parents=True, exist_ok=True)
+            staging = Path(tempfile.mkdtemp(dir=self.node_modules_dir, prefix='.tmp_'))
+            try:
+                shutil.copytree(source, staging, symlinks=True, dirs_exist_ok=True)
+                os.rename(staging, snapshot)
+                logger.debug(f'Saved node_modules snapshot for {project_dir}')
+            except OSError as e:
+                # Another process saved the same snapshot first, or the copy failed
+                logger.debug(f'Skipped node_modules snapshot for {project_dir}: {e}')
+                shutil.rmtree(staging, ignore_errors=True)
+        self._evict()
+
+    def _evict(self) -> None:
+        with self._lock:
+            snapshots = [
+                (entry.stat().st_mtime_ns, entry.path)
+                for entry in os.scandir(self.node_modules_dir)
+                if entry.is_dir() and not entry.name.startswith('.')
+            ]
+            snapshots.sort()
+            for _, path in snapshots[: max(len(snapshots) - self.max_node_modules_snapshots, 0)]:
+                shutil.rmtree(path, ignore_errors=True)
+
+
+def _find_node_projects(working_dir: Path) -> List[Tuple[Path, str]]:
+    """Return (project directory, lockfile hash) for each locked Node.js project."""
+    projects = []
+    for dir_path, dir_names, file_names in os.walk(working_dir):
+        dir_names[:] = [d for d in dir_names if d not in DEPENDENCY_AND_BUILD_DIRS]
+        if 'package.json' not in file_names:
+            continue
+        for lockfile in NODE_LOCKFILES:
+            if lockfile in file_names:
+                hasher = hashlib.sha256(lockfile.encode('utf-8'))
+                hasher.update(b'\0')
+                hasher.update(Path(dir_path, lockfile).read_bytes())
+                projects.append((Path(dir_path), hasher.hexdigest()))
+                break
+    return projects
+
+
+_default_sandbox: Optional[BuildSandbox] = None
+
+
+def get_default_build_sandbox() -> Optional[BuildSandbox]:
+    """Return the process-wide build sandbox, or None if disabled via MCP_EVAL_BUILD_SANDBOX."""
+    global _default_sandbox
+    from .eval_config import BUILD_OFFLINE, BUILD_SANDBOX_ENABLED, CACHE_DIR
+
+    if not BUILD_SANDBOX_ENABLED:
+        return None
+    if _default_sandbox is None:
+        _default_sandbox = BuildSandbox(Path(CACHE_DIR) / 'deps', offline=BUILD_OFFLINE)
+    return _default_sandbox
@@ -14,8 +14,11 @@
 
 """Captors for extracting data from agent execution."""
 
-from .process_executor import ProcessExecutor, SubprocessExecutor
+import asyncio
+from .process_executor import AsyncProcessExecutor, ProcessExecutor
+from .workspace_snapshot import WorkspaceSnapshot
 from abc import ABC, abstractmethod
+from loguru import logger
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -52,26 +55,47 @@ class Captor(ABC):
         """
         pass
 
+    async def capture_async(
+        self,
+        messages: List[Dict[str, Any]],
+        metrics_tracker: Any,
+        project_root: Path,
+    ) -> Dict[str, Any]:
+        """Capture output without blocking the event loop.
+
+        The framework calls this instead of capture(). The default calls capture()
+        directly; captors that run processes or read files should override it.
+        """
+        return self.capture(messages, metrics_tracker, project_root)
+
 
 class GitDiffCaptor(Captor):
-    """Captures git diff of file changes made by agent."""
+    """Captures git diff of file changes made by agent.
+
+    If a WorkspaceSnapshot taken before the agent ran is provided, the diff is computed
+    in-process from the snapshot. Otherwise (or if that fails) falls back to `git diff`.
+    """
 
     def __init__(
         self,
         git_paths: Optional[List[str]] = None,
         process_executor: Optional[ProcessExecutor] = None,
+        snapshot: Optional[WorkspaceSnapshot] = None,
     ):
         """Initialize GitDiffCaptor.
 
         Args:
             git_paths: Paths relative to working_directory to capture git diff for.
                        If None or empty, captures diff for all changes.
-            process_executor: ProcessExecutor instance (default: SubprocessExecutor)
+            process_executor: ProcessExecutor instance (default: AsyncProcessExecutor)
+            snapshot: Snapshot of the working directory taken before the agent ran
+                      (should cover the same git_paths)
         """
         self.git_paths = git_paths
         self.process_executor = (
-            process_executor if process_executor is not None else SubprocessExecutor()
+            process_executor if process_executor is not None else AsyncProcessExecutor()
         )
+        self.snapshot = snapshot
 
     def capture(
         self,
@@ -80,25 +104,52 @@ class GitDiffCaptor(Captor):
         project_root: Path,
     ) -> Dict[str, Any]:
         """Capture git diff for configured paths."""
+        if self.snapshot is not None:
+            try:
+                return {GIT_DIFF: self.snapshot.diff(project_root)}
+            except Exception as e:
+                logger.warning(f'Snapshot diff failed, falling back to git diff: {e}')
+
+        try:
+            result = self.process_executor.run(
+                self._git_diff_command(project_root),
+                timeout=10,
+                cwd=str(project_root),
+            )
+            return {GIT_DIFF: result.stdout}
+        except Exception as e:
+            return {GIT_DIFF: '', 'error': str(e)}
+
+    async def capture_async(
+        self,
+        messages: List[Dict[str, Any]],
+        metrics_tracker: Any,
+        project_root: Path,
+    ) -> Dict[str, Any]:
+        """Capture git diff for configured paths without blocking the event loop."""
+        if self.snapshot is not None:
+            try:
+                return {GIT_DIFF: await asyncio.to_thread(self.snapshot.diff, project_root)}
+            except Exception as e:
+                logger.warning(f'Snapshot diff failed, falling back to git diff: {e}')
+
         try:
-            if self.git_paths:
-                full_paths = [str(project_root / path) for path in self.git_paths]
-                result = self.process_executor.run(
-                    ['git', 'diff', '--'] + full_paths,
-                    timeout=10,
-                    cwd=str(project_root),
-                )
-            else:
-                # Capture all changes if no specific paths provided
-                result = self.process_executor.run(
-                    ['git', 'diff'],
-                    timeout=10,
-                    cwd=str(project_root),
-                )
+            result = await self.process_executor.run_async(
+                self._git_diff_command(project_root),
+                timeout=10,
+                cwd=str(project_root),
+            )
             return {GIT_DIFF: result.stdout}
         except Exception as e:
             return {GIT_DIFF: '', 'error': str(e)}
 
+    def _git_diff_command(self, project_root: Path) -> List[str]:
+        if self.git_paths:
+            full_paths = [str(project_root / path) for path in self.git_paths]
+            return ['git', 'diff', '--'] + full_paths
+        # Capture all changes if no specific paths provided
+        return ['git', 'diff']
+
 
 class ToolCallsCaptor(Captor):
     """Captures sequence of tool calls made by agent."""
@@ -112,11 +163,11 @@ class ToolCallsCaptor(Captor):
         """Capture tool call sequence from metrics tracker."""
         tool_calls = [
             {
-                'name': call['tool_name'],
-                'input': call['parameters'],
-                'success': call['success'],
-                'duration': call['duration'],
-                'error': call.get('error'),
+                'name': call.tool_name,
+                'input': call.parameters,
+                'success': call.success,
+                'duration': call.duration,
+                'error': call.error,
             }
             for call in metrics_tracker.tool_calls
         ]
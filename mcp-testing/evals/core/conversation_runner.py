@@ -34,6 +34,8 @@ from .file_tools import (
     get_file_tools,
 )
 from .metrics_tracker import MetricsTracker
+from .tracing import trace_span
+from .workspace_provider import ensure_private_copy
 from loguru import logger
 from mcp import ClientSession
 from pathlib import Path
@@ -84,7 +86,21 @@ async def execute_tool(
     Returns:
         Tool execution result
     """
-    start = time.time()
+    with trace_span('eval.tool', {'eval.tool_name': tool_name}) as span:
+        result = await _execute_tool(tool_name, tool_input, session, project_root, metrics_tracker)
+        span.set_attribute('eval.tool_success', result.get('status') != 'error')
+        return result
+
+
+async def _execute_tool(
+    tool_name: str,
+    tool_input: Dict[str, Any],
+    session: ClientSession,
+    project_root: Path,
+    metrics_tracker: MetricsTracker,
+) -> Dict[str, Any]:
+    """Execute a tool call and record it in the metrics tracker."""
+    start = time.perf_counter()
     success = True
     error = None
 
@@ -134,6 +150,8 @@ async def execute_tool(
                 raise IOError(f'Failed to create parent directory: {file_path.parent}')
 
             try:
+                # Workspaces may share files with their template via hardlinks
+                ensure_private_copy(file_path)
                 file_path.write_text(tool_input[MESSAGE_CONTENT], encoding='utf-8')
                 result = {
                     MESSAGE_CONTENT: [
@@ -157,7 +175,7 @@ async def execute_tool(
         error = str(e)
         return {MESSAGE_CONTENT: [{CONTENT_TEXT: f'Error: {str(e)}'}], 'status': 'error'}
     finally:
-        duration = time.time() - start
+        duration = time.perf_counter() - start
         params_to_log = {k: v for k, v in tool_input.items() if k != 'toolUseId'}
         metrics_tracker.record_tool_call(tool_name, params_to_log, duration, success, error)
 
@@ -203,58 +221,60 @@ async def run_conversation(
         turn += 1
         logger.debug(f'=== Turn {turn}/{max_turns} ===')
 
-        start = time.time()
+        with trace_span('eval.turn', {'eval.turn': turn}) as span:
+            start = time.perf_counter()
 
-        try:
-            response = llm_provider.converse(
-                messages=messages,
-                tools=all_tools,
-            )
+            try:
+                response = await llm_provider.converse_async(
+                    messages=messages,
+                    tools=all_tools,
+                )
 
-            elapsed = time.time() - start
-            logger.debug(f'Claude responded in {elapsed:.2f}s')
-            logger.debug(f'Stop reason: {response["stopReason"]}')
+                elapsed = time.perf_counter() - start
+                logger.debug(f'Claude responded in {elapsed:.2f}s')
+                logger.debug(f'Stop reason: {response["stopReason"]}')
+                span.set_attribute('eval.stop_reason', response['stopReason'])
 
-            messages.append(
-                {
-                    MESSAGE_ROLE: ROLE_ASSISTANT,
-                    MESSAGE_CONTENT: response['output']['message'][MESSAGE_CONTENT],
-                }
-            )
-
-            if response['stopReason'] == 'tool_use':
-                tool_results = []
-
-                for content_block in response['output']['message'][MESSAGE_CONTENT]:
-                    if CONTENT_TOOL_USE in content_block:
-                        tool_use = content_block[CONTENT_TOOL_USE]
-                        tool_name = tool_use['name']
-                        tool_input = tool_use['input']
-                        tool_use_id = tool_use['toolUseId']
-
-                        logger.debug(f'Tool requested: {tool_name} with {tool_input}')
-
-                        tool_input['toolUseId'] = tool_use_id
-                        result = await execute_tool(
-                            tool_name, tool_input, session, project_root, metrics_tracker
-                        )
-
-                        tool_results.append(
-                            {
-                                CONTENT_TOOL_RESULT: {
-                                    'toolUseId': tool_use_id,
-                                    MESSAGE_CONTENT: result[MESSAGE_CONTENT],
+                messages.append(
+                    {
+                        MESSAGE_ROLE: ROLE_ASSISTANT,
+                        MESSAGE_CONTENT: response['output']['message'][MESSAGE_CONTENT],
+                    }
+                )
+
+                if response['stopReason'] == 'tool_use':
+                    tool_results = []
+
+                    for content_block in response['output']['message'][MESSAGE_CONTENT]:
+                        if CONTENT_TOOL_USE in content_block:
+                            tool_use = content_block[CONTENT_TOOL_USE]
+                            tool_name = tool_use['name']
+                            tool_input = tool_use['input']
+                            tool_use_id = tool_use['toolUseId']
+
+                            logger.debug(f'Tool requested: {tool_name} with {tool_input}')
+
+                            tool_input['toolUseId'] = tool_use_id
+                            result = await execute_tool(
+                                tool_name, tool_input, session, project_root, metrics_tracker
+                            )
+
+                            tool_results.append(
+                                {
+                                    CONTENT_TOOL_RESULT: {
+                                        'toolUseId': tool_use_id,
+                                        MESSAGE_CONTENT: result[MESSAGE_CONTENT],
+                                    }
                                 }
-                            }
-                        )
-
-                messages.append({MESSAGE_ROLE: ROLE_USER, MESSAGE_CONTENT: tool_results})
-            else:
-                logger.debug(f'Agent finished: {response["stopReason"]}')
-                break
-        except Exception as e:
-            logger.error(f'Error in agent loop: {e}')
-            raise
+                            )
+
+                    messages.append({MESSAGE_ROLE: ROLE_USER, MESSAGE_CONTENT: tool_results})
+                else:
+                    logger.debug(f'Agent finished: {response["stopReason"]}')
+                    break
+            except Exception as e:
+                logger.error(f'Error in agent loop: {e}')
+                raise
 
     if turn >= max_turns:
         logger.warning(f'Reached max turns ({max_turns})')
@@ -24,9 +24,29 @@ Environment variable overrides:
 - MCP_EVAL_AWS_REGION: Override default AWS region
 - MCP_EVAL_MAX_TURNS: Override default max conversation turns
 - MCP_EVAL_TEMPERATURE: Override default model temperature
+- MCP_EVAL_MAX_SUBPROCESSES: Maximum concurrent helper subprocesses (git, etc.) per event loop
+- MCP_EVAL_CACHE_DIR: Directory for local caches (build results, etc.)
+- MCP_EVAL_BUILD_CACHE: Set to 'false' to disable the BuildValidator result cache
+- MCP_EVAL_BUILD_CACHE_MAX_BYTES: Maximum total size of cached build results
+- MCP_EVAL_BUILD_SANDBOX: Set to 'false' to run builds without shared dependency caches
+- MCP_EVAL_BUILD_OFFLINE: Set to 'true' to resolve build dependencies from local caches only
+- MCP_EVAL_BUILD_LOG_DIR: Directory for full logs of builds whose output was truncated
+- MCP_EVAL_BUILD_LOG_MAX_FILES: Number of most recent build logs kept in MCP_EVAL_BUILD_LOG_DIR
+- MCP_EVAL_MOCK_SEED: Seed for mock latency and fault injection (default: random)
+- MCP_EVAL_TRACING: Trace the eval pipeline with OpenTelemetry: 'otlp' or 'file' (default: off)
+- MCP_EVAL_TRACE_FILE: File that spans are appended to with MCP_EVAL_TRACING=file
 """
 
 import os
+import tempfile
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    """Read a boolean environment variable ('0', 'false' and 'no' are False)."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.lower() not in ('0', 'false', 'no')
 
 
 # Default values (used when environment variables are not set)
@@ -34,6 +54,11 @@ _DEFAULT_MODEL_ID = 'us.anthropic.claude-sonnet-4-20250514-v1:0'
 _DEFAULT_AWS_REGION = 'us-east-1'
 _DEFAULT_MAX_TURNS = 20
 _DEFAULT_TEMPERATURE = 0.0
+_DEFAULT_MAX_SUBPROCESSES = min(32, (os.cpu_count() or 1) + 4)
+_DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'mcp-evals')
+_DEFAULT_BUILD_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_DEFAULT_BUILD_LOG_DIR = os.path.join(tempfile.gettempdir(), 'mcp-eval-build-logs')
+_DEFAULT_BUILD_LOG_MAX_FILES = 50
 
 # Configuration values (can be overridden via environment variables)
 # Used by both the agent being evaluated and the LLM judge
@@ -42,3 +67,29 @@ MODEL_ID = os.environ.get('MCP_EVAL_MODEL_ID', _DEFAULT_MODEL_ID)
 AWS_REGION = os.environ.get('MCP_EVAL_AWS_REGION', _DEFAULT_AWS_REGION)
 MAX_TURNS = int(os.environ.get('MCP_EVAL_MAX_TURNS', str(_DEFAULT_MAX_TURNS)))
 TEMPERATURE = float(os.environ.get('MCP_EVAL_TEMPERATURE', str(_DEFAULT_TEMPERATURE)))
+
+# Execution
+MAX_SUBPROCESSES = int(
+    os.environ.get('MCP_EVAL_MAX_SUBPROCESSES', str(_DEFAULT_MAX_SUBPROCESSES))
+)
+
+# Local caches
+CACHE_DIR = os.environ.get('MCP_EVAL_CACHE_DIR', _DEFAULT_CACHE_DIR)
+BUILD_CACHE_ENABLED = _env_flag('MCP_EVAL_BUILD_CACHE', True)
+BUILD_CACHE_MAX_BYTES = int(
+    os.environ.get('MCP_EVAL_BUILD_CACHE_MAX_BYTES', str(_DEFAULT_BUILD_CACHE_MAX_BYTES))
+)
+BUILD_SANDBOX_ENABLED = _env_flag('MCP_EVAL_BUILD_SANDBOX', True)
+BUILD_OFFLINE = _env_flag('MCP_EVAL_BUILD_OFFLINE', False)
+BUILD_LOG_DIR = os.environ.get('MCP_EVAL_BUILD_LOG_DIR', _DEFAULT_BUILD_LOG_DIR)
+BUILD_LOG_MAX_FILES = int(
+    os.environ.get('MCP_EVAL_BUILD_LOG_MAX_FILES', str(_DEFAULT_BUILD_LOG_MAX_FILES))
+)
+
+# Mocking
+_mock_seed = os.environ.get('MCP_EVAL_MOCK_SEED')
+MOCK_SEED = int(_mock_seed) if _mock_seed else None
+
+# Tracing
+TRACING = os.environ.get('MCP_EVAL_TRACING', '').lower()
+TRACE_FILE = os.environ.get('MCP_EVAL_TRACE_FILE', os.path.join(CACHE_DIR, 'traces.jsonl'))
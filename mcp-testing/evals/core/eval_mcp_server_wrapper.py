@@ -16,14 +16,23 @@
 """Mock server wrapper for MCP evaluation.
 
 This wrapper applies mocks before starting the MCP server subprocess.
-It reads mock configuration from a temporary file and patches libraries
-(boto3, etc.) before importing and running the actual server.
+It reads the mock configuration and patches libraries (boto3, etc.) before
+importing and running the actual server.
+
+connect_to_mcp_server passes the mock configuration, with fixtures inlined, in
+shared memory (MCP_EVAL_MOCK_BUNDLE, see mock_transport.py).
 
 Usage:
-    Set TEMP_SERVER_WRAPPER_MOCK_FILE environment variable to path of mock config JSON,
-    then run this script with the server module path as argument:
+    To run the wrapper by hand, set TEMP_SERVER_WRAPPER_MOCK_FILE to the path of a mock
+    config JSON file, then run this script with the server module path as argument:
 
     TEMP_SERVER_WRAPPER_MOCK_FILE=/tmp/mocks.json python eval_mcp_server_wrapper.py path/to/server.py
+
+    If MCP_EVAL_PROFILE_FILE is set, the wrapper profiles the server (including mock
+    setup) and writes the profile there on exit (see profiling.py).
+
+    If MCP_EVAL_RECORD_DIR is set, boto3 is not mocked; real calls are recorded there as
+    a mock configuration with fixture files instead (see mock_recorder.py).
 """
 
 import importlib.util
@@ -59,11 +68,12 @@ def load_mock_config() -> dict:
         return {}
 
 
-def apply_mocks(mock_config: dict):
+def apply_mocks(mock_config: dict, resolve_fixtures: bool = True):
     """Apply mocks using the mock handler registry.
 
     Args:
         mock_config: Mock configuration dictionary
+        resolve_fixtures: False if fixtures are already inlined (mock bundles)
     """
     if not mock_config:
         return
@@ -73,7 +83,7 @@ def apply_mocks(mock_config: dict):
     registry = get_registry()
 
     try:
-        registry.patch_all(mock_config)
+        registry.patch_all(mock_config, resolve_fixtures=resolve_fixtures)
         logger.debug(f'Applied mocks for: {", ".join(mock_config.keys())}')
     except Exception as e:
         logger.warning(f'Failed to apply mocks: {e}')
@@ -145,10 +155,25 @@ def main():
     mcp_logger = logging.getLogger('mcp')
     mcp_logger.setLevel(getattr(logging, log_level))
 
-    mock_config = load_mock_config()
+    from .profiling import profile_process_from_env
+
+    profile_process_from_env()
+
+    from .mock_transport import read_mock_bundle_from_env
+
+    mock_config = read_mock_bundle_from_env()
+    fixtures_inlined = mock_config is not None
+    if not fixtures_inlined:
+        mock_config = load_mock_config()
+
+    from .mock_recorder import record_from_env
+
+    if record_from_env():
+        # Let real boto3 calls through so they can be recorded
+        mock_config = {k: v for k, v in mock_config.items() if k not in ('boto3', 'botocore')}
 
     if mock_config:
-        apply_mocks(mock_config)
+        apply_mocks(mock_config, resolve_fixtures=not fixtures_inlined)
 
     run_server(args.server_path, args.server_cwd)
 
@@ -14,50 +14,154 @@
 
 """Evaluation runner orchestrating task execution."""
 
+import asyncio
+import contextlib
+import copy
+import time
 from .conversation_runner import run_conversation
 from .eval_config import MAX_TURNS
 from .llm_provider import BedrockLLMProvider
 from .mcp_client import connect_to_mcp_server
 from .metrics_tracker import MetricsTracker
+from .phase_timer import PhaseTimer
+from .profiling import EvalProfiler
+from .scheduling import TaskHistory, order_longest_first
 from .task import Task
 from .task_result import TaskResult
+from .tracing import trace_span
+from .trials import DEFAULT_CONFIDENCE, is_decided
 from .validator import ValidationResult
 from loguru import logger
 from mcp import ClientSession
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 
 class EvalRunner:
     """Orchestrates evaluation of MCP tools using agent-based testing."""
 
-    def __init__(self, tasks: List[Task]):
+    def __init__(
+        self,
+        tasks: List[Task],
+        history: Optional[TaskHistory] = None,
+        profiler: Optional[EvalProfiler] = None,
+        record_dir: Optional[Path] = None,
+    ):
         """Initialize evaluation runner.
 
         Args:
             tasks: List of Task instances to evaluate
+            history: TaskHistory used to schedule concurrent runs and updated with
+                     the metrics of each run (default: history under CACHE_DIR)
+            profiler: If set, each task run is profiled (see profiling.py)
+            record_dir: If set, real boto3 calls of each task are recorded into
+                        record_dir/<task id> instead of mocked (see mock_recorder.py)
         """
         self.tasks = tasks
+        self.history = history if history is not None else TaskHistory()
+        self.profiler = profiler
+        self.record_dir = record_dir
 
     async def run_all(
         self,
         verbose: bool = False,
         skip_cleanup: bool = False,
+        concurrency: int = 1,
+        trials: int = 1,
+        pass_threshold: Optional[float] = None,
+        confidence: float = DEFAULT_CONFIDENCE,
     ) -> List[TaskResult]:
-        """Run all tasks and return results."""
-        results = []
+        """Run all tasks and return results in task order.
 
-        for task in self.tasks:
-            logger.info(f'Running task: {task.id}')
+        Args:
+            verbose: Enable verbose MCP server output
+            skip_cleanup: Skip task cleanup after each run
+            concurrency: Maximum number of tasks run at once. With more than one, tasks
+                         with the longest expected duration (from history) start first,
+                         after tasks without history (in declared order).
+                         Tasks that do not allow concurrent runs still run one at a time.
+            trials: Number of times to run each task (each trial uses a copy of the task)
+            pass_threshold: If set, stop running trials of a task once the confidence
+                            interval of its pass rate lies entirely above or below this
+            confidence: Confidence level of the pass rate interval for pass_threshold
 
-            try:
+        Returns:
+            TaskResults in the same order as self.tasks (one per trial, in trial order)
+        """
+        start_order = list(range(len(self.tasks)))
+        if concurrency > 1:
+            durations = self.history.expected_durations([task.id for task in self.tasks])
+            start_order = order_longest_first(
+                start_order,
+                {i: durations[t.id] for i, t in enumerate(self.tasks) if t.id in durations},
+            )
+
+        results: List[List[Optional[TaskResult]]] = [[None] * trials for _ in self.tasks]
+        passes = [0] * len(self.tasks)
+        completed = [0] * len(self.tasks)
+        decided = set()
+        # Serializes tasks that share a workspace (see Task.allows_concurrent_runs)
+        exclusive_lock = asyncio.Lock()
+        pending = iter([(index, trial) for index in start_order for trial in range(trials)])
+
+        async def worker():
+            for index, trial in pending:
+                if index in decided:
+                    continue
+                task = self.tasks[index] if trials == 1 else copy.copy(self.tasks[index])
+                label = task.id if trials == 1 else f'{task.id}.trial{trial + 1}'
+                if concurrency > 1 and not task.allows_concurrent_runs():
+                    async with exclusive_lock:
+                        result = await self._run_and_record(task, verbose, skip_cleanup, label)
+                else:
+                    result = await self._run_and_record(task, verbose, skip_cleanup, label)
+
+                if trials > 1:
+                    result.trial = trial + 1
+                results[index][trial] = result
+                completed[index] += 1
+                passes[index] += int(result.success)
+                if pass_threshold is not None and is_decided(
+                    passes[index], completed[index], pass_threshold, confidence
+                ):
+                    decided.add(index)
+
+        worker_count = max(1, min(concurrency, len(self.tasks) * trials))
+        if self.profiler:
+            self.profiler.start()
+        try:
+            await asyncio.gather(*[worker() for _ in range(worker_count)])
+        finally:
+            self.history.save()
+            if self.profiler:
+                self.profiler.finish()
+
+        return [result for task_results in results for result in task_results if result]
+
+    async def _run_and_record(
+        self,
+        task: Task,
+        verbose: bool,
+        skip_cleanup: bool,
+        label: str,
+    ) -> TaskResult:
+        """Run a task, converting failures to error results and recording metrics.
+
+        The label names the run's profile when profiling.
+        """
+        logger.info(f'Running task: {task.id}')
+
+        profile = self.profiler.task(label) if self.profiler else contextlib.nullcontext()
+        try:
+            with profile:
                 result = await self.run_task(task, verbose, skip_cleanup)
-                results.append(result)
-            except Exception as e:
-                logger.error(f'Task {task.id} failed: {e}')
-                results.append(TaskResult.from_error(task.id, str(e)))
+        except Exception as e:
+            logger.error(f'Task {task.id} failed: {e}')
+            return TaskResult.from_error(task.id, str(e))
 
-        return results
+        if result.metrics:
+            self.history.record(task.id, result.metrics)
+        return result
 
     async def run_task(
         self,
@@ -69,52 +173,74 @@ class EvalRunner:
 
         Connects to MCP server, executes agent loop, validates results, and cleans up.
         """
+        with trace_span('eval.task', {'eval.task_id': task.id}) as span:
+            result = await self._run_task(task, verbose, skip_cleanup)
+            span.set_attribute('eval.success', result.success)
+            return result
+
+    async def _run_task(self, task: Task, verbose: bool, skip_cleanup: bool) -> TaskResult:
+        """Run a single task (inside the task span)."""
         # Get server paths from task (allows different tasks to use different servers)
         server_root_dir = str(task.get_server_root_directory())
         server_file = str(task.get_server_file())
         mock_config = task.resolved_mock_config
         working_directory = task.get_working_directory() or Path.cwd()
 
-        async with connect_to_mcp_server(
-            server_file=server_file,
-            server_root_dir=server_root_dir,
-            verbose=verbose,
-            mock_config=mock_config,
-        ) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
+        timer = PhaseTimer()
+        async with contextlib.AsyncExitStack() as stack:
+            completed = False
+            try:
+                with timer.phase('server_start'):
+                    read, write = await stack.enter_async_context(
+                        connect_to_mcp_server(
+                            server_file=server_file,
+                            server_root_dir=server_root_dir,
+                            verbose=verbose,
+                            mock_config=mock_config,
+                            record_dir=self.record_dir / task.id if self.record_dir else None,
+                        )
+                    )
+                    session = await stack.enter_async_context(ClientSession(read, write))
+
+                with timer.phase('initialize'):
+                    await session.initialize()
 
-                tools_response = await session.list_tools()
+                with timer.phase('list_tools'):
+                    tools_response = await session.list_tools()
                 logger.debug(f'Connected to MCP server with {len(tools_response.tools)} tools')
 
-                task.setup(working_directory)
+                with timer.phase('setup'):
+                    await task.setup_async(working_directory)
 
                 prompt = task.get_prompt(working_directory)
 
                 logger.debug(f'Running eval for task {task.id}')
 
                 # Execute agent loop
-                llm_provider = BedrockLLMProvider()
-                metrics_tracker = MetricsTracker()
-                messages = await run_conversation(
-                    llm_provider=llm_provider,
-                    session=session,
-                    prompt=prompt,
-                    project_root=working_directory,
-                    mcp_tools=tools_response.tools,
-                    metrics_tracker=metrics_tracker,
-                    max_turns=MAX_TURNS,
-                )
+                with timer.phase('agent'):
+                    llm_provider = BedrockLLMProvider()
+                    metrics_tracker = MetricsTracker()
+                    messages = await run_conversation(
+                        llm_provider=llm_provider,
+                        session=session,
+                        prompt=prompt,
+                        project_root=working_directory,
+                        mcp_tools=tools_response.tools,
+                        metrics_tracker=metrics_tracker,
+                        max_turns=MAX_TURNS,
+                    )
 
                 # Execute captors
-                captured_data = await self._execute_captors(
-                    task, working_directory, messages, metrics_tracker, prompt
-                )
+                with timer.phase('captors'):
+                    captured_data = await self._execute_captors(
+                        task, working_directory, messages, metrics_tracker, prompt
+                    )
 
                 # Execute validators
-                validation_results = await self._execute_validators(
-                    task, working_directory, captured_data
-                )
+                with timer.phase('validators'):
+                    validation_results = await self._execute_validators(
+                        task, working_directory, captured_data
+                    )
 
                 # Gather metrics
                 metrics = metrics_tracker.get_metrics_report(expected_tools=task.expected_tools)
@@ -128,12 +254,30 @@ class EvalRunner:
                     metrics=metrics,
                     captured_data=captured_data,
                 )
-
-                # Cleanup task changes
+                completed = True
+            finally:
+                # Cleanup task changes, also after a failure so workspaces are not leaked
                 if not skip_cleanup:
-                    task.cleanup(working_directory)
+                    with timer.phase('cleanup'):
+                        await self._cleanup_task(task, working_directory, completed)
+
+            shutdown_start = time.perf_counter()
+
+        timer.record('server_shutdown', time.perf_counter() - shutdown_start)
+        result.metrics['phases'] = timer.phases
+        return result
 
-                return result
+    async def _cleanup_task(self, task: Task, working_directory: Path, completed: bool) -> None:
+        """Run task cleanup.
+
+        After a failed run, cleanup errors are logged so the original error is reported.
+        """
+        try:
+            await task.cleanup_async(working_directory)
+        except Exception as e:
+            if completed:
+                raise
+            logger.warning(f'Cleanup of task {task.id} failed: {e}')
 
     async def _execute_captors(
         self,
@@ -148,7 +292,10 @@ class EvalRunner:
         captors = task.get_captors(working_directory)
 
         for captor in captors:
-            captor_output = captor.capture(messages, metrics_tracker, working_directory)
+            with trace_span('eval.captor', {'eval.captor': type(captor).__name__}):
+                captor_output = await captor.capture_async(
+                    messages, metrics_tracker, working_directory
+                )
             captured_data.update(captor_output)
 
         return captured_data
@@ -164,7 +311,10 @@ class EvalRunner:
         validators = task.get_validators(working_directory)
 
         for validator in validators:
-            validation_result = await validator.validate(captured_data)
+            span_attributes = {'eval.validator': type(validator).__name__}
+            with trace_span('eval.validator', span_attributes) as span:
+                validation_result = await validator.validate(captured_data)
+                span.set_attribute('eval.success', validation_result.get('overall_pass', False))
             validation_results.append(validation_result)
 
         return validation_results
@@ -0,0 +1,252 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compressed, content-addressed fixture packs.
+
+A fixture pack is a directory holding manifest.json and compressed blobs:
+
+    fixtures.pack/
+        manifest.json    {'version': 1, 'compression': 'gzip',
+                          'fixtures': {'bug-1-list-services.json': '<sha256>', ...}}
+        blobs/<sha256>.gz
+
+Fixtures are referenced like files in the pack directory, e.g. response
+'fixtures.pack/bug-1-list-services.json' with the task's fixtures_dir as parent.
+load_fixture() reads such references from the pack when no file exists at that path.
+
+Blobs are named by the hash of their content, so identical fixtures are stored once.
+JSON fixtures are stored in compact canonical form, so copies that differ only in
+formatting or key order are stored once too. Manifests are read on first use and blobs
+are decompressed on first reference, then cached for the life of the process.
+
+Compression is 'gzip' (stdlib) or 'zstd' (requires Python 3.14+ or zstandard).
+
+Build a pack from a fixture directory:
+
+    python -m evals.core.fixture_pack path/to/fixtures path/to/fixtures.pack [--zstd]
+"""
+
+import gzip
+import hashlib
+import json
+from loguru import logger
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+MANIFEST_FILE = 'manifest.json'
+BLOBS_DIR = 'blobs'
+PACK_VERSION = 1
+
+COMPRESSIONS = ('gzip', 'zstd')
+_BLOB_SUFFIXES = {'gzip': '.gz', 'zstd': '.zst'}
+
+# Fixture file extensions stored in packs (see MockConfigPathNormalizer)
+_FIXTURE_EXTENSIONS = ('.json', '.txt')
+
+# Process-level caches: pack directory -> manifest, (pack directory, digest) -> content
+_manifests: Dict[Path, Dict[str, Any]] = {}
+_contents: Dict[Tuple[Path, str], str] = {}
+
+
+class FixturePack:
+    """Read access to a fixture pack (manifest loaded once, blobs decompressed lazily)."""
+
+    def __init__(self, pack_dir: Path):
+        """Open a fixture pack.
+
+        Args:
+            pack_dir: Pack directory containing manifest.json
+
+        Raises:
+            FileNotFoundError: If the directory has no manifest
+            ValueError: If the manifest version or compression is unsupported
+        """
+        self.pack_dir = Path(pack_dir).resolve()
+        manifest = _manifests.get(self.pack_dir)
+        if manifest is None:
+            manifest = _manifests[self.pack_dir] = _read_manifest(self.pack_dir)
+        self.compression = manifest['compression']
+        self.fixtures: Dict[str, str] = manifest['fixtures']
+
+    def __contains__(self, name: str) -> bool:
+        """Return whether the pack holds a fixture with this name."""
+        return name in self.fixtures
+
+    def read_text(self, name: str) -> str:
+        """Return the content of a fixture.
+
+        Raises:
+            FileNotFoundError: If the pack has no fixture with this name
+        """
+        digest = self.fixtures.get(name)
+        if digest is None:
+            raise FileNotFoundError(f"Fixture '{name}' not found in pack {self.pack_dir}")
+        key = (self.pack_dir, digest)
+        content = _contents.get(key)
+        if content is None:
+            blob_path = self.pack_dir / BLOBS_DIR / f'{digest}{_BLOB_SUFFIXES[self.compression]}'
+            data = _decompress(blob_path.read_bytes(), self.compression)
+            content = _contents[key] = data.decode('utf-8')
+        return content
+
+
+def is_fixture_pack(path: Path) -> bool:
+    """Return whether path is a fixture pack directory."""
+    return (Path(path) / MANIFEST_FILE).is_file()
+
+
+def load_fixture(path: Path) -> Any:
+    """Load a fixture from a file, or from the pack its parent directory is.
+
+    .json fixtures are parsed; others are returned as text. Each call returns a new
+    object, so callers may modify it.
+
+    Args:
+        path: Fixture file path, or '<pack directory>/<fixture name>'
+
+    Raises:
+        FileNotFoundError: If neither a file nor a packed fixture exists at path
+    """
+    path = Path(path)
+    if path.exists():
+        with open(path, 'r') as f:
+            content = f.read()
+    elif is_fixture_pack(path.parent):
+        content = FixturePack(path.parent).read_text(path.name)
+    else:
+        raise FileNotFoundError(f'Fixture file not found: {path}')
+    return json.loads(content) if path.suffix == '.json' else content
+
+
+def build_fixture_pack(
+    source_dir: Path, pack_dir: Path, compression: str = 'gzip'
+) -> Dict[str, Any]:
+    """Pack the fixture files of a directory (adds to an existing pack).
+
+    Args:
+        source_dir: Directory with .json and .txt fixture files
+        pack_dir: Pack directory to create or update
+        compression: 'gzip' or 'zstd'
+
+    Returns:
+        Stats: fixtures, blobs (distinct contents), source_bytes and packed_bytes
+
+    Raises:
+        ValueError: If the compression differs from the existing pack's
+    """
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression '{compression}' (expected one of {COMPRESSIONS})")
+    source_dir, pack_dir = Path(source_dir), Path(pack_dir)
+    manifest = {'version': PACK_VERSION, 'compression': compression, 'fixtures': {}}
+    if is_fixture_pack(pack_dir):
+        manifest = _read_manifest(pack_dir)
+        if manifest['compression'] != compression:
+            raise ValueError(
+                f"Pack {pack_dir} uses {manifest['compression']} compression, not {compression}"
+            )
+    blobs_dir = pack_dir / BLOBS_DIR
+    blobs_dir.mkdir(parents=True, exist_ok=True)
+
+    stats = {'fixtures': 0, 'blobs': 0, 'source_bytes': 0, 'packed_bytes': 0}
+    for path in sorted(source_dir.iterdir()):
+        if not path.is_file() or path.suffix not in _FIXTURE_EXTENSIONS:
+            continue
+        content = path.read_text()
+        stats['fixtures'] += 1
+        stats['source_bytes'] += len(content.encode('utf-8'))
+        if path.suffix == '.json':
+            content = json.dumps(json.loads(content), sort_keys=True, separators=(',', ':'))
+        data = content.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        manifest['fixtures'][path.name] = digest
+        blob_path = blobs_dir / f'{digest}{_BLOB_SUFFIXES[compression]}'
+        if not blob_path.exists():
+            blob_path.write_bytes(_compress(data, compression))
+
+    digests = set(manifest['fixtures'].values())
+    stats['blobs'] = len(digests)
+    stats['packed_bytes'] = sum(
+        (blobs_dir / f'{digest}{_BLOB_SUFFIXES[compression]}').stat().st_size
+        for digest in digests
+    )
+    with open(pack_dir / MANIFEST_FILE, 'w') as f:
+        json.dump(manifest, f, indent=4, sort_keys=True)
+        f.write('\n')
+    _manifests.pop(pack_dir.resolve(), None)
+    return stats
+
+
+def _read_manifest(pack_dir: Path) -> Dict[str, Any]:
+    with open(pack_dir / MANIFEST_FILE, 'r') as f:
+        manifest = json.load(f)
+    if manifest.get('version') != PACK_VERSION:
+        raise ValueError(f"Unsupported fixture pack version {manifest.get('version')!r}")
+    if manifest.get('compression') not in COMPRESSIONS:
+        raise ValueError(f"Unsupported fixture pack compression {manifest.get('compression')!r}")
+    return manifest
+
+
+def _zstd_module():
+    try:
+        from compression import zstd  # Python 3.14+
+
+        return zstd
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError('zstd fixture packs require Python 3.14+ or zstandard') from None
+    return zstandard
+
+
+def _compress(data: bytes, compression: str) -> bytes:
+    if compression == 'gzip':
+        # mtime=0 keeps blobs byte-identical across builds
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    zstd = _zstd_module()
+    if zstd.__name__ == 'zstandard':
+        return zstd.ZstdCompressor(level=19).compress(data)
+    return zstd.compress(data, level=19)
+
+
+def _decompress(data: bytes, compression: str) -> bytes:
+    if compression == 'gzip':
+        return gzip.decompress(data)
+    zstd = _zstd_module()
+    if zstd.__name__ == 'zstandard':
+        return zstd.ZstdDecompressor().decompress(data)
+    return zstd.decompress(data)
+
+
+def main(argv: Optional[list] = None) -> None:
+    """Build a fixture pack from a fixture directory."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Build a compressed fixture pack')
+    parser.add_argument('source_dir', type=Path, help='Directory with fixture files')
+    parser.add_argument('pack_dir', type=Path, help='Pack directory to create or update')
+    parser.add_argument('--zstd', action='store_true', help='Use zstd instead of gzip')
+    args = parser.parse_args(argv)
+
+    stats = build_fixture_pack(args.source_dir, args.pack_dir, 'zstd' if args.zstd else 'gzip')
+    logger.info(
+        f"Packed {stats['fixtures']} fixtures into {stats['blobs']} blobs: "
+        f"{stats['source_bytes']:,} -> {stats['packed_bytes']:,} bytes"
+    )
+
+
+if __name__ == '__main__':
+    main()
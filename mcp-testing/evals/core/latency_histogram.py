@@ -0,0 +1,165 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Log-bucketed latency histograms.
+
+Durations are counted in buckets whose bounds grow geometrically (by 2% by default),
+so percentiles have a bounded relative error at any scale, from sub-millisecond file
+tools to multi-second MCP calls. Only non-empty buckets are stored. Histograms with the
+same bucket growth merge by adding counts, which makes them cheap to combine across
+tool calls, tasks and trials, and they round-trip through JSON (see to_dict).
+"""
+
+import math
+from typing import Any, Dict, Iterable, Optional
+
+
+# Relative width of each bucket (percentiles are accurate to within this fraction)
+DEFAULT_BUCKET_GROWTH = 0.02
+
+# Durations at or below this (seconds) share the first bucket
+MIN_TRACKED_DURATION = 1e-6
+
+REPORTED_PERCENTILES = (50, 90, 99)
+
+
+class LatencyHistogram:
+    """Histogram of durations in seconds with geometrically growing buckets."""
+
+    def __init__(self, bucket_growth: float = DEFAULT_BUCKET_GROWTH):
+        """Initialize an empty histogram.
+
+        Args:
+            bucket_growth: Relative width of each bucket (e.g., 0.02 for 2%)
+        """
+        self.bucket_growth = bucket_growth
+        self._log_base = math.log1p(bucket_growth)
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def record(self, duration: float) -> None:
+        """Add a duration in seconds."""
+        index = self._bucket_index(duration)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += duration
+        self.min = duration if self.min is None else min(self.min, duration)
+        self.max = duration if self.max is None else max(self.max, duration)
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """Add the counts of another histogram with the same bucket growth.
+
+        Raises:
+            ValueError: If the histograms use different bucket growth
+        """
+        if other.bucket_growth != self.bucket_growth:
+            raise ValueError(
+                f'Cannot merge histograms with bucket growth {other.bucket_growth} '
+                f'into {self.bucket_growth}'
+            )
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Return the q-th percentile (0-100), or None if the histogram is empty.
+
+        The value is the upper bound of the bucket holding the percentile, clamped to
+        the recorded min and max.
+        """
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * q / 100))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(max(self._bucket_upper_bound(index), self.min), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        """Return count, total, max and reported percentiles (p50, p90, p99)."""
+        summary: Dict[str, Any] = {'count': self.count, 'total': self.total, 'max': self.max}
+        for q in REPORTED_PERCENTILES:
+            summary[f'p{q}'] = self.percentile(q)
+        return summary
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dict (summary plus bucket counts)."""
+        data = self.summary()
+        data.update(
+            {
+                'min': self.min,
+                'bucket_growth': self.bucket_growth,
+                'buckets': {str(index): count for index, count in sorted(self.buckets.items())},
+            }
+        )
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LatencyHistogram':
+        """Deserialize a histogram written by to_dict()."""
+        histogram = cls(data.get('bucket_growth', DEFAULT_BUCKET_GROWTH))
+        histogram.buckets = {int(index): count for index, count in data['buckets'].items()}
+        histogram.count = data['count']
+        histogram.total = data['total']
+        histogram.min = data.get('min')
+        histogram.max = data.get('max')
+        return histogram
+
+    def _bucket_index(self, duration: float) -> int:
+        if duration <= MIN_TRACKED_DURATION:
+            return 0
+        return math.ceil(math.log(duration / MIN_TRACKED_DURATION) / self._log_base)
+
+    def _bucket_upper_bound(self, index: int) -> float:
+        return MIN_TRACKED_DURATION * math.exp(index * self._log_base)
+
+
+def merge_tool_latencies(
+    tool_latencies: Iterable[Dict[str, Dict[str, Any]]],
+) -> Dict[str, LatencyHistogram]:
+    """Merge per-tool histograms from several metrics reports (e.g., tasks or trials).
+
+    Args:
+        tool_latencies: 'tool_latency' entries of metrics reports
+
+    Returns:
+        Dict mapping tool name to merged LatencyHistogram
+    """
+    merged: Dict[str, LatencyHistogram] = {}
+    for entry in tool_latencies:
+        for tool_name, data in entry.items():
+            histogram = LatencyHistogram.from_dict(data)
+            if tool_name in merged:
+                merged[tool_name].merge(histogram)
+            else:
+                merged[tool_name] = histogram
+    return merged
+
+
+def format_latency_line(tool_name: str, summary: Dict[str, Any]) -> str:
+    """Format a per-tool latency summary (from summary() or to_dict()) as one line."""
+    return (
+        f'  - {tool_name}: p50 {summary["p50"]:.3f}s, p90 {summary["p90"]:.3f}s, '
+        f'p99 {summary["p99"]:.3f}s, max {summary["max"]:.3f}s '
+        f'({summary["count"]} calls, {summary["total"]:.2f}s total)'
+    )
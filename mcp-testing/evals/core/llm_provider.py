@@ -18,6 +18,8 @@ This module provides a unified interface for LLM interactions used by both
 the agent loop (with tool calling) and the LLM judge (simple text generation).
 """
 
+import asyncio
+from .tracing import trace_span
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
@@ -50,6 +52,19 @@ class LLMProvider(ABC):
         """
         pass
 
+    async def converse_async(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Conduct a conversation without blocking the event loop.
+
+        The default runs converse() in a worker thread, so concurrent tasks can make
+        progress while waiting for the model.
+        """
+        return await asyncio.to_thread(self.converse, messages, tools, **kwargs)
+
 
 class BedrockLLMProvider(LLMProvider):
     """AWS Bedrock LLM provider implementation."""
@@ -110,4 +125,15 @@ class BedrockLLMProvider(LLMProvider):
         # Allow overriding with additional kwargs
         converse_params.update(kwargs)
 
-        return self.bedrock_client.converse(**converse_params)
+        span_attributes = {'gen_ai.system': 'aws.bedrock', 'gen_ai.request.model': model_id}
+        with trace_span('llm.converse', span_attributes) as span:
+            response = self.bedrock_client.converse(**converse_params)
+            usage = response.get('usage', {})
+            span.set_attributes(
+                {
+                    'gen_ai.usage.input_tokens': usage.get('inputTokens', 0),
+                    'gen_ai.usage.output_tokens': usage.get('outputTokens', 0),
+                    'gen_ai.response.finish_reason': response.get('stopReason', ''),
+                }
+            )
+            return response
@@ -17,11 +17,13 @@
 Provides connection and tool conversion utilities for MCP servers.
 """
 
+import asyncio
 import contextlib
-import json
 import os
 import sys
-import tempfile
+from .mock_recorder import RECORD_DIR_ENV
+from .mock_transport import build_mock_bundle, share_mock_config
+from .profiling import get_server_profile_env
 from mcp import StdioServerParameters
 from mcp.client.stdio import stdio_client
 from pathlib import Path
@@ -34,6 +36,7 @@ async def connect_to_mcp_server(
     server_root_dir: str,
     verbose: bool = False,
     mock_config: Optional[Dict[str, Any]] = None,
+    record_dir: Optional[Path] = None,
 ):
     """Connect to an MCP server via stdio.
 
@@ -44,7 +47,10 @@ async def connect_to_mcp_server(
         server_file: Path to MCP server.py file
         server_root_dir: Root directory where the server should run (where its imports work)
         verbose: Enable verbose logging from server
-        mock_config: Optional mock configuration dictionary
+        mock_config: Optional mock configuration dictionary (fixture paths must be
+                     absolute), passed to the server in shared memory (see mock_transport.py)
+        record_dir: If set, boto3 calls are not mocked but recorded into this directory
+                    as a mock configuration with fixtures (see mock_recorder.py)
 
     Yields:
         Context manager from stdio_client for MCP connection
@@ -89,15 +95,16 @@ async def connect_to_mcp_server(
         if 'MCP_CLOUDWATCH_APPLICATION_SIGNALS_LOG_LEVEL' not in env:
             env['MCP_CLOUDWATCH_APPLICATION_SIGNALS_LOG_LEVEL'] = 'WARNING'
 
-    mock_file_path = None
+    # Profile the server too when the current task run is profiled (--profile)
+    env.update(get_server_profile_env())
+    if record_dir:
+        env[RECORD_DIR_ENV] = str(Path(record_dir).resolve())
 
-    try:
+    with contextlib.ExitStack() as stack:
         if mock_config:
-            mock_fd, mock_file_path = tempfile.mkstemp(suffix='.json', prefix='mcp_mocks_')
-            with os.fdopen(mock_fd, 'w') as f:
-                json.dump(mock_config, f)
-
-            env['TEMP_SERVER_WRAPPER_MOCK_FILE'] = mock_file_path
+            # Fixtures are inlined so the server needs no file I/O to apply mocks
+            bundle = await asyncio.to_thread(build_mock_bundle, mock_config)
+            env.update(stack.enter_context(share_mock_config(bundle)))
 
         server_params = StdioServerParameters(
             command=sys.executable,
@@ -113,10 +120,3 @@ async def connect_to_mcp_server(
 
         async with stdio_client(server_params) as client:
             yield client
-
-    finally:
-        if mock_file_path and os.path.exists(mock_file_path):
-            try:
-                os.unlink(mock_file_path)
-            except OSError:
-                pass
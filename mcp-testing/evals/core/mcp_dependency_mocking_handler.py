@@ -17,21 +17,37 @@
 Provides extensible mocking for external dependencies (boto3, requests, etc.)
 used by MCP servers during evaluation.
 
+Mocked clients are instances of stub classes generated once per service, with a plain
+method per mocked operation that looks up responses with an indexed RequestMatcher.
+
+A request/response pair may also set 'latency' (fixed, uniform or lognormal delay) and
+'fault' (throttling, server_error, unavailable or timeout, with a probability) to
+simulate slow or failing APIs. Without them, responses are returned immediately.
+
 Current limitations:
-- Only supports request -> String/JSON response mapping (no exception mocking)
-- Depends on MagicMock for client method patching
+- Only supports request -> String/JSON response mapping, plus injected faults
+- SDK retries are not simulated; injected faults reach the caller directly
 """
 
-import json
+import math
+import random
+import time
+from .fixture_pack import load_fixture
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from unittest.mock import MagicMock
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 
 # TODO: Move these constants to dedicated constants module during core/ directory refactor
 REQUEST = 'request'
 RESPONSE = 'response'
+LATENCY = 'latency'
+FAULT = 'fault'
+
+# Key of the parsed MockBehavior in resolved request/response pairs
+_BEHAVIOR = '_behavior'
+
+FAULT_TYPES = ('throttling', 'server_error', 'unavailable', 'timeout')
 
 
 class UnmockedMethodError(Exception):
@@ -62,6 +78,185 @@ class UnmockedMethodError(Exception):
         )
 
 
+class MockFaultError(Exception):
+    """Raised by mocked calls when a configured fault is injected.
+
+    Handlers for specific libraries raise the library's own exception types instead
+    (e.g., botocore ClientError for throttling).
+    """
+
+    def __init__(self, service_name: str, method_name: str, fault_type: str):
+        """Initialize MockFaultError.
+
+        Args:
+            service_name: Name of the service (e.g., 'cloudwatch')
+            method_name: Name of the mocked method
+            fault_type: Injected fault (one of FAULT_TYPES)
+        """
+        self.service_name = service_name
+        self.method_name = method_name
+        self.fault_type = fault_type
+        super().__init__(f"Injected '{fault_type}' fault in {service_name}.{method_name}")
+
+
+class MockBehavior:
+    """Latency and fault injection for a request/response pair.
+
+    Latency is either a number of seconds or a dict:
+    - {'distribution': 'fixed', 'seconds': 0.2}
+    - {'distribution': 'uniform', 'min': 0.1, 'max': 0.5}
+    - {'distribution': 'lognormal', 'median': 0.3, 'sigma': 0.5, 'max': 5.0}  ('max' optional)
+
+    Fault is either a fault type (always injected) or a dict:
+    - {'type': 'throttling', 'probability': 0.2}
+    """
+
+    def __init__(self, latency: Any = None, fault: Any = None):
+        """Parse and validate latency and fault settings.
+
+        Raises:
+            ValueError: If a setting is malformed
+        """
+        self._latency = self._parse_latency(latency)
+        self.fault_type, self.fault_probability = self._parse_fault(fault)
+
+    def apply(self, rng: random.Random) -> Optional[str]:
+        """Sleep for the sampled latency, then return the fault type to inject (or None)."""
+        delay = self.sample_latency(rng)
+        if delay > 0:
+            time.sleep(delay)
+        if self.fault_type and rng.random() < self.fault_probability:
+            return self.fault_type
+        return None
+
+    def sample_latency(self, rng: random.Random) -> float:
+        """Return a latency in seconds drawn from the configured distribution."""
+        if self._latency is None:
+            return 0.0
+        distribution, params = self._latency
+        if distribution == 'fixed':
+            return params['seconds']
+        if distribution == 'uniform':
+            return rng.uniform(params['min'], params['max'])
+        delay = rng.lognormvariate(math.log(params['median']), params['sigma'])
+        return min(delay, params.get('max', delay))
+
+    @staticmethod
+    def _parse_latency(latency: Any) -> Optional[Tuple[str, Dict[str, float]]]:
+        if latency is None:
+            return None
+        if isinstance(latency, (int, float)):
+            latency = {'distribution': 'fixed', 'seconds': latency}
+        required = {'fixed': ('seconds',), 'uniform': ('min', 'max'), 'lognormal': ('median', 'sigma')}
+        distribution = latency.get('distribution') if isinstance(latency, dict) else None
+        if distribution not in required:
+            raise ValueError(
+                f'Invalid latency {latency!r}: expected seconds or a dict with distribution '
+                f'{list(required)}'
+            )
+        missing = [name for name in required[distribution] if name not in latency]
+        if missing:
+            raise ValueError(f'Invalid {distribution} latency {latency!r}: missing {missing}')
+        params = {name: float(value) for name, value in latency.items() if name != 'distribution'}
+        if distribution == 'lognormal' and params['median'] <= 0:
+            raise ValueError(f'Invalid lognormal latency {latency!r}: median must be positive')
+        return distribution, params
+
+    @staticmethod
+    def _parse_fault(fault: Any) -> Tuple[Optional[str], float]:
+        if fault is None:
+            return None, 0.0
+        if isinstance(fault, str):
+            fault = {'type': fault}
+        fault_type = fault.get('type') if isinstance(fault, dict) else None
+        if fault_type not in FAULT_TYPES:
+            raise ValueError(f'Invalid fault {fault!r}: expected type in {list(FAULT_TYPES)}')
+        probability = float(fault.get('probability', 1.0))
+        if not 0 <= probability <= 1:
+            raise ValueError(f'Invalid fault {fault!r}: probability must be between 0 and 1')
+        return fault_type, probability
+
+
+def _freeze(value: Any) -> Hashable:
+    """Return a hashable form of a request value that preserves equality."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+class RequestMatcher:
+    """Finds the response for a call among an operation's request/response pairs.
+
+    Matching rules:
+    - Empty request dict {} matches any parameters (wildcard)
+    - Non-empty request dict matches when all specified params are present and equal
+    - The first matching pair in configuration order wins
+
+    Pairs are indexed by the value of their first request parameter, so a call only
+    checks the pairs whose indexed parameter it matches, plus the first wildcard.
+    """
+
+    def __init__(self, operation: str, matchers: List[Dict[str, Any]]):
+        """Build the index.
+
+        Args:
+            operation: Operation name (for error messages)
+            matchers: List of dicts with 'request' and 'response' keys
+        """
+        self.operation = operation
+        self.matchers = matchers
+        self._first_wildcard: Optional[int] = None
+        self._index: Dict[Tuple[str, Hashable], List[int]] = {}
+
+        for position, matcher in enumerate(matchers):
+            request_params = matcher.get(REQUEST) or {}
+            if not request_params:
+                if self._first_wildcard is None:
+                    self._first_wildcard = position
+                continue
+            key = next(iter(request_params))
+            self._index.setdefault((key, _freeze(request_params[key])), []).append(position)
+        self._indexed_keys = {key for key, _ in self._index}
+
+    def match(self, params: Dict[str, Any]) -> Any:
+        """Return the response for the given call parameters.
+
+        Raises:
+            ValueError: If no request pattern matches
+        """
+        return self.match_pair(params).get(RESPONSE)
+
+    def match_pair(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the request/response pair for the given call parameters.
+
+        Raises:
+            ValueError: If no request pattern matches
+        """
+        best = self._first_wildcard
+        for key in self._indexed_keys:
+            for position in self._index.get((key, _freeze(params.get(key))), ()):
+                if best is not None and position >= best:
+                    break
+                request_params = self.matchers[position][REQUEST]
+                # TODO: Add support for more flexible matching (wildcards, negations, regex, etc.)
+                if all(params.get(name) == value for name, value in request_params.items()):
+                    best = position
+                    break
+
+        if best is None:
+            raise ValueError(
+                f'No mock response found for {self.operation} with parameters: {params}\n'
+                f'Available request patterns: {[m.get(REQUEST) for m in self.matchers]}'
+            )
+        return self.matchers[best]
+
+
 class McpDependencyMockingHandler(ABC):
     """Base class for library-specific mock handlers.
 
@@ -69,6 +264,10 @@ class McpDependencyMockingHandler(ABC):
     (e.g., boto3, requests, database clients).
     """
 
+    # False when fixtures were already inlined into the mock configuration
+    # (see McpDependencyMockingHandlerRegistry.patch_all)
+    resolve_fixtures = True
+
     @abstractmethod
     def get_library_name(self) -> str:
         """Return the name of the library this handler mocks.
@@ -95,8 +294,8 @@ class McpDependencyMockingHandler(ABC):
     def resolve_method_mock_config(self, arg_response_pair: Dict[str, Any]) -> Dict[str, Any]:
         """Resolve a single method mock configuration.
 
-        Takes a dict with 'request' and 'response' keys. If 'response' is a file path,
-        loads the fixture data.
+        Takes a dict with 'request' and 'response' keys. If 'response' is a file path
+        (or a fixture in a fixture pack), loads the fixture data.
 
         Args:
             arg_response_pair: Dict with 'request' and 'response' keys (fixture paths must be absolute)
@@ -110,25 +309,21 @@ class McpDependencyMockingHandler(ABC):
                 f'got keys: {list(arg_response_pair.keys())}'
             )
 
-        # TODO: Add support for exception mocking (e.g., {'request': {...}, 'exception': SomeException(...)})
         response = arg_response_pair[RESPONSE]
 
         # Import here to avoid circular dependency (mock_config_path_normalizer imports REQUEST/RESPONSE from this module)
         from .mock_config_path_normalizer import MockConfigPathNormalizer
 
-        if MockConfigPathNormalizer.is_fixture_file_reference(response):
-            fixture_path = Path(response)
-            if not fixture_path.exists():
-                raise FileNotFoundError(f'Fixture file not found: {response}')
+        if self.resolve_fixtures and MockConfigPathNormalizer.is_fixture_file_reference(response):
+            # Plain fixture file, or a fixture in a pack ('<pack dir>/<name>', see fixture_pack.py)
+            response = load_fixture(Path(response))
 
-            if response.endswith('.json'):
-                with open(fixture_path, 'r') as f:
-                    response = json.load(f)
-            else:
-                with open(fixture_path, 'r') as f:
-                    response = f.read()
-
-        return {REQUEST: arg_response_pair[REQUEST], RESPONSE: response}
+        resolved = {**arg_response_pair, RESPONSE: response}
+        if LATENCY in arg_response_pair or FAULT in arg_response_pair:
+            resolved[_BEHAVIOR] = MockBehavior(
+                arg_response_pair.get(LATENCY), arg_response_pair.get(FAULT)
+            )
+        return resolved
 
     def resolve_method_mock_configs(
         self, arg_response_pairs: List[Dict[str, Any]]
@@ -158,51 +353,95 @@ class McpDependencyMockingHandler(ABC):
 
         return [self.resolve_method_mock_config(pair) for pair in arg_response_pairs]
 
-    def _create_parameter_aware_mock(self, operation: str, matchers: list) -> MagicMock:
-        """Create a mock that matches on parameters.
-
-        Matching rules:
-        - Empty request dict {} matches any parameters (wildcard)
-        - Non-empty request dict matches when all specified params are present and equal
+    def resolve_service_mock_configs(
+        self, mock_config: Dict[str, Any]
+    ) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """Resolve a service -> operation -> request/response pairs configuration.
 
         Args:
-            operation: Operation name (for error messages)
-            matchers: List of dicts with 'request' and 'response' keys
+            mock_config: Dict mapping service names to operations (fixture paths must be absolute)
 
         Returns:
-            MagicMock that returns responses based on parameter matching
+            Same structure with fixture data loaded
         """
+        return {
+            service: {
+                operation: self.resolve_method_mock_configs(pairs)
+                for operation, pairs in operations.items()
+            }
+            for service, operations in mock_config.items()
+        }
+
+    def respond(
+        self,
+        service_name: str,
+        operation: str,
+        matcher: RequestMatcher,
+        params: Dict[str, Any],
+    ) -> Any:
+        """Return the mock response for a call, applying any latency and fault settings.
 
-        def mock_implementation(**kwargs):
-            for matcher in matchers:
-                request_params = matcher.get(REQUEST, {})
-                response = matcher.get(RESPONSE)
-
-                if not request_params:
-                    return response
+        Raises:
+            ValueError: If no request pattern matches
+            Exception: The exception from create_fault_exception() when a fault is injected
+        """
+        pair = matcher.match_pair(params)
+        behavior = pair.get(_BEHAVIOR)
+        if behavior is not None:
+            fault_type = behavior.apply(_get_rng())
+            if fault_type:
+                raise self.create_fault_exception(fault_type, service_name, operation)
+        return pair.get(RESPONSE)
+
+    def create_fault_exception(
+        self, fault_type: str, service_name: str, operation: str
+    ) -> Exception:
+        """Return the exception raised for an injected fault.
+
+        Subclasses return the mocked library's exception types; the default is MockFaultError.
+        """
+        return MockFaultError(service_name, operation, fault_type)
 
-                # TODO: Add support for more flexible matching (wildcards, negations, regex, etc.)
-                if all(kwargs.get(key) == value for key, value in request_params.items()):
-                    return response
+    def _create_request_matcher(self, operation: str, matchers: list) -> RequestMatcher:
+        """Create a matcher that selects responses based on call parameters.
 
-            raise ValueError(
-                f'No mock response found for {operation} with parameters: {kwargs}\n'
-                f'Available request patterns: {[m.get("request") for m in matchers]}'
-            )
+        Args:
+            operation: Operation name (for error messages)
+            matchers: List of dicts with 'request' and 'response' keys
 
-        return MagicMock(side_effect=mock_implementation)
+        Returns:
+            RequestMatcher for the operation (see RequestMatcher for matching rules)
+        """
+        return RequestMatcher(operation, matchers)
 
 
 class Boto3DependencyMockingHandler(McpDependencyMockingHandler):
     """Mock handler for boto3 clients.
 
-    Patches boto3.client() to return mocked clients with predefined responses.
+    Patches boto3.client() to return mocked clients with predefined responses. The stub
+    client class for a service is generated on first use and reused for later clients.
+    Clients created another way (boto3.Session().client(), boto3.resource(), botocore
+    sessions) are mocked with the same configuration at the botocore level
+    (see BotocoreDependencyMockingHandler).
     """
 
-    def __init__(self):
-        """Initialize Boto3DependencyMockingHandler with empty state."""
+    def __init__(
+        self,
+        count_calls: bool = False,
+        botocore_handler: Optional['BotocoreDependencyMockingHandler'] = None,
+    ):
+        """Initialize Boto3DependencyMockingHandler with empty state.
+
+        Args:
+            count_calls: Count calls per (service, operation) in call_counts
+            botocore_handler: Handler that mocks other clients (shared with the registry)
+        """
         self.original_client = None
         self.service_method_mock_configs: Dict[str, Dict[str, Any]] = {}
+        self.count_calls = count_calls
+        self.call_counts: Dict[Tuple[str, str], int] = {}
+        self._stub_client_classes: Dict[str, type] = {}
+        self._botocore_handler = botocore_handler or BotocoreDependencyMockingHandler()
 
     def get_library_name(self) -> str:
         """Return library name."""
@@ -220,14 +459,12 @@ class Boto3DependencyMockingHandler(McpDependencyMockingHandler):
 
         self.original_client = boto3.client
 
-        resolved_config = {}
-        for service, operations in mock_config.items():
-            resolved_config[service] = {}
-            for operation, response in operations.items():
-                resolved_config[service][operation] = self.resolve_method_mock_configs(response)
+        resolved_config = self.resolve_service_mock_configs(mock_config)
 
         self.service_method_mock_configs = resolved_config
+        self._stub_client_classes = {}
         boto3.client = self._create_mock_client
+        self._botocore_handler.patch_resolved(resolved_config)
 
     def unpatch(self) -> None:
         """Restore original boto3.client."""
@@ -237,6 +474,14 @@ class Boto3DependencyMockingHandler(McpDependencyMockingHandler):
             boto3.client = self.original_client
             self.original_client = None
             self.service_method_mock_configs = {}
+            self._stub_client_classes = {}
+            self._botocore_handler.unpatch()
+
+    def create_fault_exception(
+        self, fault_type: str, service_name: str, operation: str
+    ) -> Exception:
+        """Return the botocore exception for an injected fault."""
+        return _botocore_fault_exception(fault_type, service_name, operation)
 
     def _create_mock_client(self, service_name: str, **kwargs):
         """Create a mocked boto3 client.
@@ -248,21 +493,178 @@ class Boto3DependencyMockingHandler(McpDependencyMockingHandler):
         Returns:
             Mocked client with predefined responses. Calls to unmocked methods will raise UnmockedMethodError.
         """
+        stub_class = self._stub_client_classes.get(service_name)
+        if stub_class is None:
+            stub_class = self._stub_client_classes[service_name] = self._build_stub_client_class(
+                service_name
+            )
+        return stub_class()
+
+    def _build_stub_client_class(self, service_name: str) -> type:
+        """Generate a client class with one method per mocked operation of a service."""
         method_mock_configs = self.service_method_mock_configs.get(service_name, {})
+        available_methods = list(method_mock_configs.keys())
 
-        class MockClient:
-            """Dynamic mock client that raises UnmockedMethodError for unmocked methods."""
+        def __getattr__(self, name):
+            raise UnmockedMethodError(service_name, name, available_methods)
 
-            def __getattr__(self, name):
-                raise UnmockedMethodError(service_name, name, list(method_mock_configs.keys()))
+        namespace = {'__slots__': (), '__getattr__': __getattr__}
+        for operation, response_data in method_mock_configs.items():
+            namespace[operation] = self._create_stub_method(
+                service_name, operation, self._create_request_matcher(operation, response_data)
+            )
 
-        mock_client = MockClient()
+        class_name = ''.join(part.title() for part in service_name.split('-')) + 'StubClient'
+        return type(class_name, (), namespace)
 
-        for operation, response_data in method_mock_configs.items():
-            mock_method = self._create_parameter_aware_mock(operation, response_data)
-            setattr(mock_client, operation, mock_method)
+    def _create_stub_method(self, service_name: str, operation: str, matcher: RequestMatcher):
+        """Create a client method that returns the matching mock response."""
+        respond = self.respond
+
+        if not self.count_calls:
+
+            def method(self, **kwargs):
+                return respond(service_name, operation, matcher, kwargs)
+
+        else:
+            call_counts = self.call_counts
+            key = (service_name, operation)
+
+            def method(self, **kwargs):
+                call_counts[key] = call_counts.get(key, 0) + 1
+                return respond(service_name, operation, matcher, kwargs)
+
+        method.__name__ = method.__qualname__ = operation
+        return method
+
+
+class BotocoreDependencyMockingHandler(McpDependencyMockingHandler):
+    """Mock handler for all botocore clients.
+
+    Patches botocore's BaseClient._make_api_call, through which every client operation
+    (including paginators and boto3 resources) is sent. Calls are answered from the mock
+    configuration without building, signing or sending a request. Mock configuration
+    uses client method names (e.g., 'list_services'), like the boto3 handler.
+    """
+
+    def __init__(self):
+        """Initialize BotocoreDependencyMockingHandler with empty state."""
+        self.original_make_api_call = None
+        self.matchers: Dict[str, Dict[str, RequestMatcher]] = {}
+
+    def get_library_name(self) -> str:
+        """Return library name."""
+        return 'botocore'
+
+    def patch(self, mock_config: Dict[str, Any]) -> None:
+        """Patch botocore clients to return mock responses.
+
+        Args:
+            mock_config: Dict mapping service names to operation responses
+                Example: {'cloudwatch': {'get_metric_data': [...]}}
+                Fixture paths must be absolute.
+        """
+        self.patch_resolved(self.resolve_service_mock_configs(mock_config))
+
+    def patch_resolved(self, resolved_config: Dict[str, Dict[str, List[Dict[str, Any]]]]) -> None:
+        """Patch botocore clients using an already resolved mock configuration.
+
+        Services are added to those of earlier patch calls (e.g., from both the 'boto3'
+        and 'botocore' configurations) until unpatch().
+        """
+        from botocore.client import BaseClient
+
+        for service, operations in resolved_config.items():
+            self.matchers[service] = {
+                operation: self._create_request_matcher(operation, pairs)
+                for operation, pairs in operations.items()
+            }
+        if self.original_make_api_call is not None:
+            return
+        self.original_make_api_call = BaseClient._make_api_call
+
+        handler = self
+
+        def _make_api_call(client, operation_name, api_params):
+            return handler.handle_api_call(
+                client.meta.service_model.service_name, operation_name, api_params
+            )
+
+        BaseClient._make_api_call = _make_api_call
+
+    def unpatch(self) -> None:
+        """Restore original BaseClient._make_api_call."""
+        if self.original_make_api_call:
+            from botocore.client import BaseClient
+
+            BaseClient._make_api_call = self.original_make_api_call
+            self.original_make_api_call = None
+            self.matchers = {}
+
+    def handle_api_call(
+        self, service_name: str, operation_name: str, api_params: Dict[str, Any]
+    ) -> Any:
+        """Return the mock response for an API call.
+
+        Args:
+            service_name: Client service name (e.g., 'application-signals')
+            operation_name: API operation name (e.g., 'ListServices')
+            api_params: Call parameters
+
+        Raises:
+            UnmockedMethodError: If the operation is not mocked
+        """
+        from botocore import xform_name
+
+        operations = self.matchers.get(service_name, {})
+        method_name = xform_name(operation_name)
+        matcher = operations.get(method_name)
+        if matcher is None:
+            raise UnmockedMethodError(service_name, method_name, list(operations.keys()))
+        return self.respond(service_name, method_name, matcher, api_params)
+
+    def create_fault_exception(
+        self, fault_type: str, service_name: str, operation: str
+    ) -> Exception:
+        """Return the botocore exception for an injected fault."""
+        return _botocore_fault_exception(fault_type, service_name, operation)
+
+
+# HTTP status and error code of injected botocore ClientErrors
+_BOTOCORE_FAULT_ERRORS = {
+    'throttling': (400, 'ThrottlingException', 'Rate exceeded'),
+    'server_error': (500, 'InternalServerError', 'Internal server error'),
+    'unavailable': (503, 'ServiceUnavailableException', 'Service unavailable'),
+}
+
+
+def _botocore_fault_exception(fault_type: str, service_name: str, operation: str) -> Exception:
+    """Build the botocore exception a real client raises for the fault."""
+    from botocore.exceptions import ClientError, ReadTimeoutError
+
+    if fault_type == 'timeout':
+        return ReadTimeoutError(endpoint_url=f'https://{service_name}.mock')
+
+    status, code, message = _BOTOCORE_FAULT_ERRORS[fault_type]
+    error_response = {
+        'Error': {'Code': code, 'Message': message},
+        'ResponseMetadata': {'HTTPStatusCode': status},
+    }
+    operation_name = ''.join(part.title() for part in operation.split('_'))
+    return ClientError(error_response, operation_name)
+
+
+_rng: Optional[random.Random] = None
+
+
+def _get_rng() -> random.Random:
+    """Return the random generator for latency and faults (seeded by MCP_EVAL_MOCK_SEED)."""
+    global _rng
+    if _rng is None:
+        from .eval_config import MOCK_SEED
 
-        return mock_client
+        _rng = random.Random(MOCK_SEED)
+    return _rng
 
 
 class McpDependencyMockingHandlerRegistry:
@@ -278,7 +680,9 @@ class McpDependencyMockingHandlerRegistry:
 
     def _register_builtin_handlers(self):
         """Register built-in mock handlers."""
-        self.register(Boto3DependencyMockingHandler())
+        botocore_handler = BotocoreDependencyMockingHandler()
+        self.register(Boto3DependencyMockingHandler(botocore_handler=botocore_handler))
+        self.register(botocore_handler)
 
     def register(self, handler: McpDependencyMockingHandler):
         """Register a mock handler.
@@ -308,15 +712,19 @@ class McpDependencyMockingHandlerRegistry:
         """
         return list(self._handlers.keys())
 
-    def patch_all(self, mock_config: Dict[str, Any]) -> None:
+    def patch_all(self, mock_config: Dict[str, Any], resolve_fixtures: bool = True) -> None:
         """Apply all mocks from configuration.
 
         Args:
             mock_config: Full mock configuration dict (fixture paths must be absolute)
+            resolve_fixtures: False if responses are already loaded fixture data (see
+                              MockConfigPathNormalizer.inline_fixtures), so responses
+                              that look like fixture paths are used as-is
         """
         for library_name, library_config in mock_config.items():
             handler = self.get_handler(library_name)
             if handler:
+                handler.resolve_fixtures = resolve_fixtures
                 handler.patch(library_config)
             else:
                 raise ValueError(
@@ -14,32 +14,66 @@
 
 """Metrics tracking for MCP tool evaluation.
 
-Tracks tool calls, success rates, hit rates, and task duration.
+Tracks tool calls, success rates, hit rates, per-tool latency, and task duration.
+Durations are measured with time.perf_counter().
 """
 
 import time
 from .file_tools import FILE_TOOL_LIST_FILES, FILE_TOOL_READ_FILE, FILE_TOOL_WRITE_FILE
+from .latency_histogram import LatencyHistogram
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 
+FILE_OPERATION_TOOLS = frozenset({FILE_TOOL_LIST_FILES, FILE_TOOL_READ_FILE, FILE_TOOL_WRITE_FILE})
+
+
+@dataclass(slots=True)
+class ToolCall:
+    """A single tool call made by the agent."""
+
+    tool_name: str
+    parameters: Dict[str, Any]
+    duration: float
+    success: bool
+    error: Optional[str] = None
+    timestamp: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary for serialization.
+
+        Shallow: parameters are shared with the call, not copied.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
 class MetricsTracker:
-    """Tracks metrics for tool calls and task execution."""
+    """Tracks metrics for tool calls and task execution.
+
+    Aggregates (success counts, per-tool breakdown and latency histograms, file
+    operation counts and total tool time) are updated as calls are recorded, so
+    reporting does not rescan calls.
+    """
 
     def __init__(self):
         """Initialize metrics tracker."""
-        # TODO: Create ToolCall dataclass/TypedDict to replace Dict[str, Any]
-        self.tool_calls: List[Dict[str, Any]] = []
+        self.tool_calls: List[ToolCall] = []
         self.task_start_time: Optional[float] = None
         self.task_end_time: Optional[float] = None
         self.turn_count: int = 0
+        self._success_count = 0
+        self._tool_breakdown: Dict[str, Dict[str, int]] = {}
+        self._file_operation_counts: Dict[str, int] = dict.fromkeys(FILE_OPERATION_TOOLS, 0)
+        self._total_tool_duration = 0.0
+        self._tool_latency: Dict[str, LatencyHistogram] = {}
 
     def start_task(self):
         """Mark task start time."""
-        self.task_start_time = time.time()
+        self.task_start_time = time.perf_counter()
 
     def end_task(self):
         """Mark task end time."""
-        self.task_end_time = time.time()
+        self.task_end_time = time.perf_counter()
 
     def record_turn_count(self, turn_count: int):
         """Record the number of agent loop turns.
@@ -57,24 +91,36 @@ class MetricsTracker:
         success: bool,
         error: Optional[str] = None,
     ):
-        """Record a tool call."""
+        """Record a tool call (duration in seconds, from time.perf_counter())."""
         self.tool_calls.append(
-            {
-                'tool_name': tool_name,
-                'parameters': parameters,
-                'duration': duration,
-                'success': success,
-                'error': error,
-                'timestamp': time.time(),
-            }
+            ToolCall(tool_name, parameters, duration, success, error, timestamp=time.time())
         )
 
+        stats = self._tool_breakdown.get(tool_name)
+        if stats is None:
+            stats = self._tool_breakdown[tool_name] = {'count': 0, 'success': 0, 'failed': 0}
+        stats['count'] += 1
+        if success:
+            stats['success'] += 1
+            self._success_count += 1
+        else:
+            stats['failed'] += 1
+
+        if tool_name in self._file_operation_counts:
+            self._file_operation_counts[tool_name] += 1
+        self._total_tool_duration += duration
+
+        histogram = self._tool_latency.get(tool_name)
+        if histogram is None:
+            histogram = self._tool_latency[tool_name] = LatencyHistogram()
+        histogram.record(duration)
+
     @property
     def success_rate(self) -> float:
         """Calculate success rate of tool calls."""
         if not self.tool_calls:
             return 0.0
-        return sum(1 for c in self.tool_calls if c['success']) / len(self.tool_calls)
+        return self._success_count / len(self.tool_calls)
 
     @property
     def tool_call_count(self) -> int:
@@ -84,7 +130,7 @@ class MetricsTracker:
     @property
     def unique_tools_count(self) -> int:
         """Return number of unique tools called."""
-        return len({c['tool_name'] for c in self.tool_calls})
+        return len(self._tool_breakdown)
 
     @property
     def task_duration(self) -> float:
@@ -93,47 +139,35 @@ class MetricsTracker:
             return self.task_end_time - self.task_start_time
         return 0.0
 
+    @property
+    def total_tool_duration(self) -> float:
+        """Return total time spent in tool calls in seconds."""
+        return self._total_tool_duration
+
     @property
     def tool_breakdown(self) -> Dict[str, Dict[str, int]]:
-        """Calculate per-tool call statistics."""
-        breakdown = {}
-        for call in self.tool_calls:
-            tool_name = call['tool_name']
-            if tool_name not in breakdown:
-                breakdown[tool_name] = {'count': 0, 'success': 0, 'failed': 0}
-            breakdown[tool_name]['count'] += 1
-            if call['success']:
-                breakdown[tool_name]['success'] += 1
-            else:
-                breakdown[tool_name]['failed'] += 1
-        return breakdown
+        """Return per-tool call statistics."""
+        return {tool_name: dict(stats) for tool_name, stats in self._tool_breakdown.items()}
+
+    @property
+    def tool_latency(self) -> Dict[str, LatencyHistogram]:
+        """Return per-tool latency histograms."""
+        return dict(self._tool_latency)
 
     @property
     def file_operation_count(self) -> int:
         """Return count of file operation tool calls."""
-        return len(self._get_file_operation_calls())
+        return sum(self._file_operation_counts.values())
 
     @property
     def file_read_count(self) -> int:
         """Return count of read_file calls."""
-        return len(
-            [c for c in self._get_file_operation_calls() if c['tool_name'] == FILE_TOOL_READ_FILE]
-        )
+        return self._file_operation_counts[FILE_TOOL_READ_FILE]
 
     @property
     def file_write_count(self) -> int:
         """Return count of write_file calls."""
-        return len(
-            [c for c in self._get_file_operation_calls() if c['tool_name'] == FILE_TOOL_WRITE_FILE]
-        )
-
-    def _get_file_operation_calls(self) -> List[Dict[str, Any]]:
-        """Get all file operation tool calls."""
-        return [
-            c
-            for c in self.tool_calls
-            if c['tool_name'] in [FILE_TOOL_LIST_FILES, FILE_TOOL_READ_FILE, FILE_TOOL_WRITE_FILE]
-        ]
+        return self._file_operation_counts[FILE_TOOL_WRITE_FILE]
 
     def _compare_expected_tools(self, expected_tools: List[str]) -> Dict[str, Any]:
         """Compare called tools against expected tools.
@@ -145,7 +179,7 @@ class MetricsTracker:
             Dictionary with hit_rate, expected_tools_called, missing_expected_tools, unexpected_tools_called
         """
         expected_tool_set = set(expected_tools)
-        called_tool_names = {c['tool_name'] for c in self.tool_calls}
+        called_tool_names = set(self._tool_breakdown)
         called_expected = called_tool_names & expected_tool_set
         missing = expected_tool_set - called_tool_names
         unexpected = called_tool_names - expected_tool_set
@@ -178,7 +212,15 @@ class MetricsTracker:
             'turn_count': self.turn_count,
             'tool_breakdown': self.tool_breakdown,
             'task_duration': self.task_duration,
-            'tool_calls_detail': self.tool_calls,
+            'total_tool_duration': self.total_tool_duration,
+            # Per-tool latency histograms, slowest total first (LatencyHistogram.to_dict())
+            'tool_latency': {
+                tool_name: histogram.to_dict()
+                for tool_name, histogram in sorted(
+                    self._tool_latency.items(), key=lambda item: -item[1].total
+                )
+            },
+            'tool_calls_detail': [call.to_dict() for call in self.tool_calls],
             'file_operation_count': self.file_operation_count,
             'file_read_count': self.file_read_count,
             'file_write_count': self.file_write_count,
@@ -23,8 +23,15 @@ Supported fixture file formats:
 - .txt - Loaded as plain text by the mock handler
 
 Other file extensions are treated as inline values and not loaded from disk.
+
+References into a fixture pack (e.g., 'fixtures.pack/services.json', see fixture_pack.py)
+are resolved the same way.
+
+inline_fixtures() replaces absolute fixture references with the loaded fixture data, so
+a mock configuration can be sent to the MCP server process self-contained.
 """
 
+from .fixture_pack import load_fixture
 from .mcp_dependency_mocking_handler import REQUEST, RESPONSE
 from pathlib import Path
 from typing import Any, Dict
@@ -72,6 +79,35 @@ class MockConfigPathNormalizer:
         """
         return MockConfigPathNormalizer._resolve_fixture_paths(mock_config, fixtures_dir)
 
+    @staticmethod
+    def inline_fixtures(mock_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace fixture file references with the loaded fixture data.
+
+        Args:
+            mock_config: Mock configuration with absolute fixture paths (see resolve_mock_config)
+
+        Returns:
+            Mock configuration whose responses are inline values
+
+        Raises:
+            FileNotFoundError: If a referenced fixture does not exist
+        """
+        inlined = {}
+        for key, value in mock_config.items():
+            if isinstance(value, dict):
+                inlined[key] = MockConfigPathNormalizer.inline_fixtures(value)
+            elif isinstance(value, list):
+                inlined[key] = [
+                    {**pair, RESPONSE: load_fixture(Path(pair[RESPONSE]))}
+                    if isinstance(pair, dict)
+                    and MockConfigPathNormalizer.is_fixture_file_reference(pair.get(RESPONSE))
+                    else pair
+                    for pair in value
+                ]
+            else:
+                inlined[key] = value
+        return inlined
+
     @staticmethod
     def has_fixture_references(mock_config: Dict[str, Any]) -> bool:
         """Check if mock configuration contains relative fixture file references.
@@ -123,6 +159,7 @@ class MockConfigPathNormalizer:
 
         Returns:
             Request/response pair with absolute path for response if it's a file reference
+            (other keys such as 'latency' and 'fault' are kept)
         """
         if not isinstance(pair, dict) or REQUEST not in pair or RESPONSE not in pair:
             raise ValueError(
@@ -134,4 +171,4 @@ class MockConfigPathNormalizer:
         if MockConfigPathNormalizer.is_fixture_file_reference(response):
             response = str(fixtures_dir / response)
 
-        return {REQUEST: pair[REQUEST], RESPONSE: response}
+        return {**pair, RESPONSE: response}
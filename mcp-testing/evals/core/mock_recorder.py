@@ -0,0 +1,271 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Record mode: capture real boto3 traffic as a mock configuration with fixture files.
+
+When RECORD_DIR_ENV is set (python -m evals --record), eval_mcp_server_wrapper leaves
+boto3 unmocked and records every botocore API call of the MCP server into that directory:
+- mock_config.json: {'boto3': {service: {operation: [{'request': ..., 'response': ...}]}}}
+- <service>-<operation>-<hash>.json: one fixture per distinct response, named by a hash
+  of its content, so identical responses share a file
+
+Volatile data is left out so recordings replay deterministically: ResponseMetadata
+(request IDs, retry counts) is stripped from responses, and request parameters whose
+input shape holds a timestamp (e.g., StartTime, whether passed as a datetime, epoch
+seconds or an ISO string) are left out of request patterns. Timestamps in responses
+are stored as ISO 8601 strings.
+
+To replay, use the directory as a task's fixtures_dir and the contents of
+mock_config.json as its mock_config. Later recordings into the same directory add
+to the existing configuration; requests already recorded keep their first response.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+from loguru import logger
+from pathlib import Path
+from typing import Any, Collection, Dict, FrozenSet, Optional, Tuple
+
+
+# Environment variable read by eval_mcp_server_wrapper
+RECORD_DIR_ENV = 'MCP_EVAL_RECORD_DIR'
+
+MOCK_CONFIG_FILE = 'mock_config.json'
+
+# Top-level response fields that differ between otherwise identical calls
+VOLATILE_RESPONSE_FIELDS = ('ResponseMetadata',)
+
+# Hex digits of the content hash in fixture file names
+_HASH_LENGTH = 12
+
+
+class MockRecorder:
+    """Records botocore API calls into a mock configuration and fixture files."""
+
+    def __init__(self, output_dir: Path):
+        """Initialize mock recorder.
+
+        Args:
+            output_dir: Directory for mock_config.json and fixtures (created if missing)
+        """
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.config_path = self.output_dir / MOCK_CONFIG_FILE
+        self.services: Dict[str, Dict[str, list]] = self._load_services()
+        self._recorded = {
+            (service, operation, _canonical_json(pair['request']))
+            for service, operations in self.services.items()
+            for operation, pairs in operations.items()
+            for pair in pairs
+        }
+        self._original_make_api_call = None
+        self._timestamp_members: Dict[Tuple[str, str], FrozenSet[str]] = {}
+
+    def start(self) -> None:
+        """Record all botocore client calls (boto3 clients, resources and paginators)."""
+        from botocore.client import BaseClient
+
+        if self._original_make_api_call is not None:
+            return
+        original = self._original_make_api_call = BaseClient._make_api_call
+        recorder = self
+
+        def _make_api_call(client, operation_name, api_params):
+            response = original(client, operation_name, api_params)
+            try:
+                service_model = client.meta.service_model
+                recorder.record(
+                    service_model.service_name,
+                    operation_name,
+                    api_params,
+                    response,
+                    recorder._get_timestamp_members(service_model, operation_name),
+                )
+            except Exception as e:
+                logger.warning(f'Failed to record {operation_name}: {e}')
+            return response
+
+        BaseClient._make_api_call = _make_api_call
+        logger.debug(f'Recording boto3 calls to {self.output_dir}')
+
+    def stop(self) -> None:
+        """Stop recording and restore botocore."""
+        if self._original_make_api_call is None:
+            return
+        from botocore.client import BaseClient
+
+        BaseClient._make_api_call = self._original_make_api_call
+        self._original_make_api_call = None
+
+    def record(
+        self,
+        service_name: str,
+        operation_name: str,
+        api_params: Dict[str, Any],
+        response: Dict[str, Any],
+        timestamp_members: Collection[str] = (),
+    ) -> bool:
+        """Add a call to the recording and write its fixture and the updated config.
+
+        Args:
+            service_name: botocore service name (e.g., 'application-signals')
+            operation_name: API operation name (e.g., 'ListServices')
+            api_params: Parameters of the call
+            response: Parsed response
+            timestamp_members: Parameters whose input shape holds a timestamp (left out
+                               of the request pattern, see timestamp_members())
+
+        Returns:
+            True if the call was added, False if its request was already recorded
+
+        Raises:
+            TypeError: If the request or response is not JSON serializable (e.g., streams)
+        """
+        from botocore import xform_name
+
+        operation = xform_name(operation_name)
+        request = strip_volatile_request(api_params, timestamp_members)
+        key = (service_name, operation, _canonical_json(request))
+        if key in self._recorded:
+            return False
+
+        content = _canonical_json(strip_volatile_response(response), indent=4)
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:_HASH_LENGTH]
+        fixture_name = f'{service_name}-{operation.replace("_", "-")}-{digest}.json'
+        fixture_path = self.output_dir / fixture_name
+        if not fixture_path.exists():
+            _write_atomic(fixture_path, content + '\n')
+
+        pairs = self.services.setdefault(service_name, {}).setdefault(operation, [])
+        pairs.append({'request': json.loads(key[2]), 'response': fixture_name})
+        self._recorded.add(key)
+        self.save()
+        return True
+
+    def save(self) -> None:
+        """Write mock_config.json."""
+        _write_atomic(self.config_path, json.dumps({'boto3': self.services}, indent=4) + '\n')
+
+    def _get_timestamp_members(self, service_model, operation_name: str) -> FrozenSet[str]:
+        key = (service_model.service_name, operation_name)
+        members = self._timestamp_members.get(key)
+        if members is None:
+            input_shape = service_model.operation_model(operation_name).input_shape
+            members = self._timestamp_members[key] = timestamp_members(input_shape)
+        return members
+
+    def _load_services(self) -> Dict[str, Dict[str, list]]:
+        if not self.config_path.exists():
+            return {}
+        with open(self.config_path, 'r') as f:
+            return json.load(f).get('boto3', {})
+
+
+def record_from_env() -> Optional[MockRecorder]:
+    """Start recording if RECORD_DIR_ENV is set (used by the server wrapper).
+
+    Returns:
+        The started MockRecorder, or None if record mode is off
+    """
+    record_dir = os.environ.get(RECORD_DIR_ENV)
+    if not record_dir:
+        return None
+    recorder = MockRecorder(Path(record_dir))
+    recorder.start()
+    return recorder
+
+
+def timestamp_members(input_shape) -> FrozenSet[str]:
+    """Return the members of a botocore input shape that are or contain timestamps.
+
+    Args:
+        input_shape: botocore StructureShape of an operation's input (None for no input)
+    """
+    if input_shape is None:
+        return frozenset()
+    return frozenset(
+        name
+        for name, shape in input_shape.members.items()
+        if _shape_has_timestamp(shape, set())
+    )
+
+
+def strip_volatile_request(
+    api_params: Dict[str, Any], timestamp_members: Collection[str] = ()
+) -> Dict[str, Any]:
+    """Return request parameters without timestamps.
+
+    Args:
+        api_params: Parameters of the call
+        timestamp_members: Parameters whose input shape holds a timestamp (see
+                           timestamp_members()); datetime values are dropped regardless
+    """
+    return {
+        name: value
+        for name, value in api_params.items()
+        if name not in timestamp_members and not _contains_datetime(value)
+    }
+
+
+def strip_volatile_response(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a response without VOLATILE_RESPONSE_FIELDS."""
+    return {
+        name: value for name, value in response.items() if name not in VOLATILE_RESPONSE_FIELDS
+    }
+
+
+def _shape_has_timestamp(shape, seen: set) -> bool:
+    if shape.type_name == 'timestamp':
+        return True
+    if id(shape) in seen:
+        return False
+    seen.add(id(shape))
+    if shape.type_name == 'structure':
+        return any(_shape_has_timestamp(member, seen) for member in shape.members.values())
+    if shape.type_name == 'list':
+        return _shape_has_timestamp(shape.member, seen)
+    if shape.type_name == 'map':
+        return _shape_has_timestamp(shape.value, seen)
+    return False
+
+
+def _contains_datetime(value: Any) -> bool:
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return True
+    if isinstance(value, dict):
+        return any(_contains_datetime(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_contains_datetime(item) for item in value)
+    return False
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime.datetime):
+        return value.isoformat().replace('+00:00', 'Z')
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    raise TypeError(f'{type(value).__name__} is not JSON serializable')
+
+
+def _canonical_json(value: Any, indent: Optional[int] = None) -> str:
+    return json.dumps(value, sort_keys=True, indent=indent, default=_json_default)
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    tmp_path = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    with open(tmp_path, 'w') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
@@ -0,0 +1,186 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared-memory transport of mock configurations to the MCP server process.
+
+connect_to_mcp_server encodes the mock configuration, with fixtures already inlined,
+as a mock bundle in a multiprocessing.shared_memory segment and passes its name and
+size in MOCK_BUNDLE_ENV. eval_mcp_server_wrapper decodes the bundle and applies the
+mocks without reading or parsing fixture files. The segment is removed when the
+server exits, so nothing is left in the temp directory.
+
+build_mock_bundle() inlines and encodes a mock configuration once and caches the bundle
+for the life of the process, keyed by the configuration and the mtimes of its fixtures,
+so repeated runs of a task reuse it. connect_to_mcp_server calls it in a worker thread,
+so loading fixtures does not block the event loop.
+
+Bundles are msgpack when msgpack is installed (in both processes), otherwise JSON,
+tagged by a 4-byte header. msgpack is in requirements.txt; the JSON fallback is slower
+to encode and decode for large fixtures.
+"""
+
+import contextlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+# Environment variable read by eval_mcp_server_wrapper: '<segment name>:<bundle size>'
+MOCK_BUNDLE_ENV = 'MCP_EVAL_MOCK_BUNDLE'
+
+_MSGPACK_HEADER = b'MPK1'
+_JSON_HEADER = b'JSN1'
+
+# Encoded bundles kept by build_mock_bundle() (least recently used dropped first)
+_BUNDLE_CACHE_SIZE = 32
+_bundles: 'OrderedDict[Tuple[str, Tuple], bytes]' = OrderedDict()
+_bundles_lock = threading.Lock()
+
+
+def encode_mock_bundle(mock_config: Dict[str, Any]) -> bytes:
+    """Serialize a mock configuration (msgpack if available, otherwise JSON)."""
+    try:
+        import msgpack
+    except ImportError:
+        return _JSON_HEADER + json.dumps(mock_config, separators=(',', ':')).encode('utf-8')
+    return _MSGPACK_HEADER + msgpack.packb(mock_config, use_bin_type=True)
+
+
+def build_mock_bundle(mock_config: Dict[str, Any]) -> bytes:
+    """Return the encoded bundle of a mock configuration with its fixtures inlined.
+
+    Bundles are cached per configuration and rebuilt when a fixture file (or the
+    manifest of a fixture pack) changes. Safe to call from worker threads.
+
+    Args:
+        mock_config: Mock configuration with absolute fixture paths
+            (see MockConfigPathNormalizer.resolve_mock_config)
+
+    Raises:
+        FileNotFoundError: If a referenced fixture does not exist
+    """
+    from .mock_config_path_normalizer import MockConfigPathNormalizer
+
+    config_key = json.dumps(mock_config, sort_keys=True, default=str)
+    key = (config_key, tuple(_fixture_mtimes(mock_config)))
+    with _bundles_lock:
+        bundle = _bundles.get(key)
+        if bundle is not None:
+            _bundles.move_to_end(key)
+            return bundle
+
+    bundle = encode_mock_bundle(MockConfigPathNormalizer.inline_fixtures(mock_config))
+    with _bundles_lock:
+        _bundles[key] = bundle
+        while len(_bundles) > _BUNDLE_CACHE_SIZE:
+            _bundles.popitem(last=False)
+    return bundle
+
+
+def decode_mock_bundle(data: bytes) -> Dict[str, Any]:
+    """Deserialize a mock bundle written by encode_mock_bundle().
+
+    Raises:
+        ValueError: If the bundle header is unknown
+    """
+    header, payload = data[:4], data[4:]
+    if header == _JSON_HEADER:
+        return json.loads(payload)
+    if header == _MSGPACK_HEADER:
+        import msgpack
+
+        return msgpack.unpackb(payload, raw=False)
+    raise ValueError(f'Unknown mock bundle header {header!r}')
+
+
+@contextlib.contextmanager
+def share_mock_config(bundle: bytes) -> Iterator[Dict[str, str]]:
+    """Place a mock bundle in shared memory for the lifetime of the context.
+
+    Args:
+        bundle: Encoded mock configuration (see build_mock_bundle)
+
+    Yields:
+        Environment variables that point the server wrapper at the bundle
+    """
+    segment = shared_memory.SharedMemory(create=True, size=max(len(bundle), 1))
+    try:
+        segment.buf[: len(bundle)] = bundle
+        yield {MOCK_BUNDLE_ENV: f'{segment.name}:{len(bundle)}'}
+    finally:
+        segment.close()
+        segment.unlink()
+
+
+def read_mock_bundle_from_env() -> Optional[Dict[str, Any]]:
+    """Read the mock configuration passed in MOCK_BUNDLE_ENV (used by the server wrapper).
+
+    Returns:
+        Mock configuration with inlined fixtures, or None if no bundle was passed
+    """
+    value = os.environ.get(MOCK_BUNDLE_ENV)
+    if not value:
+        return None
+    name, _, size = value.rpartition(':')
+    segment = _attach(name)
+    try:
+        return decode_mock_bundle(bytes(segment.buf[: int(size)]))
+    finally:
+        segment.close()
+
+
+def _fixture_mtimes(value: Any) -> Iterator[Tuple[str, Optional[int]]]:
+    """Yield (path, mtime) for every fixture reference in a mock configuration.
+
+    Packed fixtures are keyed by the mtime of their pack's manifest, which
+    build_fixture_pack() rewrites whenever the pack changes.
+    """
+    from .fixture_pack import MANIFEST_FILE
+    from .mock_config_path_normalizer import MockConfigPathNormalizer
+
+    if isinstance(value, dict):
+        for item in value.values():
+            yield from _fixture_mtimes(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _fixture_mtimes(item)
+    elif MockConfigPathNormalizer.is_fixture_file_reference(value):
+        for path in (Path(value), Path(value).parent / MANIFEST_FILE):
+            try:
+                yield value, os.stat(path).st_mtime_ns
+                break
+            except OSError:
+                continue
+        else:
+            yield value, None
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to a segment owned by the parent process without tracking it here."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        pass
+    segment = shared_memory.SharedMemory(name=name)
+    if os.name == 'posix':
+        # Before 3.13, attaching registers the segment with this process's resource
+        # tracker, which would unlink it (and warn about a leak) when the server exits
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(segment._name, 'shared_memory')
+    return segment
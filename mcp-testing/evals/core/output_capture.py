@@ -0,0 +1,147 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Streaming subprocess output capture with bounded memory.
+
+Output is read from the pipes incrementally. The full log is written to a spool
+file, while memory holds only the first and last bytes of each stream, which is
+where commands usually print what they are doing and why they failed.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+
+DEFAULT_HEAD_BYTES = 8 * 1024
+DEFAULT_TAIL_BYTES = 32 * 1024
+
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+class OutputExcerpt:
+    """Keeps the head and a ring buffer of the tail of a byte stream."""
+
+    def __init__(self, head_bytes: int = DEFAULT_HEAD_BYTES, tail_bytes: int = DEFAULT_TAIL_BYTES):
+        """Initialize excerpt.
+
+        Args:
+            head_bytes: Number of leading bytes to keep
+            tail_bytes: Number of trailing bytes to keep
+        """
+        self.head_bytes = head_bytes
+        self.tail_bytes = tail_bytes
+        self.total_bytes = 0
+        self._head = bytearray()
+        self._tail = bytearray()
+
+    @property
+    def truncated(self) -> bool:
+        """Return True if some output was dropped from the excerpt."""
+        return self.total_bytes > len(self._head) + len(self._tail)
+
+    def feed(self, chunk: bytes) -> None:
+        """Append a chunk of output."""
+        self.total_bytes += len(chunk)
+        if len(self._head) < self.head_bytes:
+            take = self.head_bytes - len(self._head)
+            self._head += chunk[:take]
+            chunk = chunk[take:]
+        if not chunk:
+            return
+        self._tail += chunk[-self.tail_bytes :] if self.tail_bytes else b''
+        overflow = len(self._tail) - self.tail_bytes
+        if overflow > 0:
+            del self._tail[:overflow]
+
+    def text(self, log_path: Optional[Path] = None) -> str:
+        """Return the excerpt as text, marking where output was omitted.
+
+        Args:
+            log_path: Full log location, mentioned in the omission marker
+
+        Returns:
+            Decoded excerpt
+        """
+        head = self._head.decode('utf-8', errors='replace')
+        if not self.truncated:
+            return head + self._tail.decode('utf-8', errors='replace')
+
+        omitted = self.total_bytes - len(self._head) - len(self._tail)
+        location = f', full log: {log_path}' if log_path else ''
+        return (
+            f'{head}\n... [{omitted} bytes omitted{location}] ...\n'
+            f'{self._tail.decode("utf-8", errors="replace")}'
+        )
+
+
+class StreamingOutputCapture:
+    """Captures stdout and stderr of a subprocess into excerpts and a spool file.
+
+    The spool file receives both streams in the order chunks arrive.
+    """
+
+    def __init__(
+        self,
+        log_path: Optional[Path] = None,
+        head_bytes: int = DEFAULT_HEAD_BYTES,
+        tail_bytes: int = DEFAULT_TAIL_BYTES,
+    ):
+        """Initialize capture.
+
+        Args:
+            log_path: File to write the full output to (None keeps excerpts only)
+            head_bytes: Leading bytes kept in memory per stream
+            tail_bytes: Trailing bytes kept in memory per stream
+        """
+        self.log_path = log_path
+        self.stdout = OutputExcerpt(head_bytes, tail_bytes)
+        self.stderr = OutputExcerpt(head_bytes, tail_bytes)
+        self._log_file: Optional[BinaryIO] = None
+        if log_path is not None:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._log_file = open(log_path, 'wb')
+
+    async def read(self, stream: asyncio.StreamReader, excerpt: OutputExcerpt) -> None:
+        """Read a stream until EOF into an excerpt and the spool file."""
+        while True:
+            chunk = await stream.read(_READ_CHUNK_SIZE)
+            if not chunk:
+                return
+            excerpt.feed(chunk)
+            if self._log_file is not None:
+                self._log_file.write(chunk)
+
+    async def communicate(self, process: asyncio.subprocess.Process) -> int:
+        """Drain a process's stdout and stderr pipes and wait for it to exit.
+
+        Returns:
+            Process exit code
+        """
+        await asyncio.gather(
+            self.read(process.stdout, self.stdout),
+            self.read(process.stderr, self.stderr),
+        )
+        return await process.wait()
+
+    @property
+    def truncated(self) -> bool:
+        """Return True if either excerpt dropped output."""
+        return self.stdout.truncated or self.stderr.truncated
+
+    def close(self) -> None:
+        """Close the spool file."""
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
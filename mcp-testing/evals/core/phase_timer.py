@@ -0,0 +1,67 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wall-clock timing of the phases of a task run.
+
+EvalRunner times each phase (server start, MCP initialize, tool listing, setup, agent
+loop, captors, validators, cleanup and server shutdown) and reports them as the
+'phases' metric, so non-agent overhead can be compared with agent time.
+"""
+
+import contextlib
+import time
+from .tracing import trace_span
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+
+class PhaseTimer:
+    """Accumulates elapsed seconds per named phase, in first-run order."""
+
+    def __init__(self):
+        """Initialize phase timer."""
+        self.phases: Dict[str, float] = {}
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as the named phase (also traced as eval.<name>)."""
+        start = time.perf_counter()
+        try:
+            with trace_span(f'eval.{name}'):
+                yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add elapsed seconds to a phase."""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+
+def summarize_phases(phase_maps: Iterable[Dict[str, Any]]) -> List[Tuple[str, float, float]]:
+    """Total the 'phases' metrics of several task runs.
+
+    Args:
+        phase_maps: 'phases' metrics, one per task run
+
+    Returns:
+        List of (phase, total seconds, share of all phase time), in first-seen order
+    """
+    totals: Dict[str, float] = {}
+    for phases in phase_maps:
+        for name, seconds in phases.items():
+            totals[name] = totals.get(name, 0.0) + seconds
+    grand_total = sum(totals.values())
+    return [
+        (name, seconds, seconds / grand_total if grand_total else 0.0)
+        for name, seconds in totals.items()
+    ]
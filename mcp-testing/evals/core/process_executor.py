@@ -14,7 +14,11 @@
 
 """Process execution abstraction for testability."""
 
+import asyncio
+import os
+import signal
 import subprocess
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import List, Optional
@@ -42,6 +46,19 @@ class ProcessExecutor(ABC):
         """Execute a command and return result."""
         pass
 
+    async def run_async(
+        self,
+        cmd: List[str],
+        cwd: Optional[str] = None,
+        timeout: Optional[int] = None,
+    ) -> ProcessResult:
+        """Execute a command without blocking the event loop.
+
+        The default runs run() in a worker thread, so executors that only implement
+        run() (e.g., test doubles) can be used from async code.
+        """
+        return await asyncio.to_thread(self.run, cmd, cwd=cwd, timeout=timeout)
+
 
 class SubprocessExecutor(ProcessExecutor):
     """Real subprocess executor using Python's subprocess module."""
@@ -66,3 +83,72 @@ class SubprocessExecutor(ProcessExecutor):
             stdout=result.stdout,
             stderr=result.stderr,
         )
+
+
+# One semaphore per event loop, since asyncio primitives cannot be shared across loops
+_semaphores: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]' = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    from .eval_config import MAX_SUBPROCESSES
+
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(MAX_SUBPROCESSES)
+        _semaphores[loop] = semaphore
+    return semaphore
+
+
+class AsyncProcessExecutor(SubprocessExecutor):
+    """Subprocess executor with a native asyncio implementation of run_async().
+
+    Concurrent run_async() calls are limited to MCP_EVAL_MAX_SUBPROCESSES running
+    processes. Each process runs in its own session, so a timeout kills the whole
+    process group rather than leaving grandchildren behind.
+    """
+
+    async def run_async(
+        self,
+        cmd: List[str],
+        cwd: Optional[str] = None,
+        timeout: Optional[int] = None,
+    ) -> ProcessResult:
+        """Execute a command using asyncio.create_subprocess_exec().
+
+        Raises:
+            subprocess.TimeoutExpired: If the command does not finish within timeout seconds
+        """
+        async with _get_semaphore():
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+            except asyncio.TimeoutError:
+                kill_process_group(process)
+                await process.wait()
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            except asyncio.CancelledError:
+                kill_process_group(process)
+                raise
+
+        return ProcessResult(
+            returncode=process.returncode,
+            stdout=stdout.decode('utf-8', errors='replace'),
+            stderr=stderr.decode('utf-8', errors='replace'),
+        )
+
+
+def kill_process_group(process: asyncio.subprocess.Process) -> None:
+    """Kill a process started with start_new_session=True and all its descendants."""
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
@@ -0,0 +1,376 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""CPU profiling of eval runs (python -m evals --profile).
+
+Two backends are supported:
+- 'sampling' (default, stdlib only): a SIGPROF timer fires every few milliseconds of
+  CPU time and samples the main thread's stack, weighted by the CPU time it used
+  since the previous sample. Profiles are written in collapsed-stack format
+  ('frame;frame;frame count' per line), which flamegraph.pl, speedscope and inferno
+  read. Time spent waiting (e.g., for the model) uses no CPU and is not sampled.
+  Work in worker threads (asyncio.to_thread: model calls, build cache hashing, sandbox
+  preparation, mock bundles) is sampled by a background thread and appears under a
+  'worker-threads' root frame in the merged profile only, since the run a worker
+  thread works for is not known.
+- 'pyinstrument': per-task pyinstrument sessions, written as HTML (requires pyinstrument).
+
+Each task run gets a profile of the eval process and one of its MCP server subprocess.
+The server is profiled by eval_mcp_server_wrapper when PROFILE_FILE_ENV is set in its
+environment (connect_to_mcp_server sets it during profiled task runs), and writes its
+profile on exit. A merged profile of all runs and servers is written at the end.
+"""
+
+import atexit
+import contextlib
+import contextvars
+import os
+import re
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from loguru import logger
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+
+# Environment variables read by eval_mcp_server_wrapper
+PROFILE_FILE_ENV = 'MCP_EVAL_PROFILE_FILE'
+PROFILER_ENV = 'MCP_EVAL_PROFILER'
+
+PROFILERS = ('sampling', 'pyinstrument')
+
+# Seconds of CPU time between samples
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+# Root frame of server samples in merged profiles
+_SERVER_ROOT_FRAME = 'mcp-server'
+
+# Root frame of samples from threads other than the main thread
+_WORKER_ROOT_FRAME = 'worker-threads'
+
+_current_label: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    'profile_label', default=None
+)
+_server_profile_env: contextvars.ContextVar[Dict[str, str]] = contextvars.ContextVar(
+    'server_profile_env', default={}
+)
+
+
+def get_server_profile_env() -> Dict[str, str]:
+    """Return environment variables that profile an MCP server started in the current task run."""
+    return _server_profile_env.get()
+
+
+class SamplingProfiler:
+    """CPU-time stack sampler for the main thread and worker threads.
+
+    The main thread is sampled from a SIGPROF handler. Samples are attributed to the
+    label active (via section()) in the interrupted context, so concurrently running
+    asyncio tasks get separate profiles. Other threads are sampled by a background
+    thread and recorded without a label, under _WORKER_ROOT_FRAME.
+
+    Each thread gets one sample per interval of CPU time it used (per-thread CPU
+    clocks), so idle threads, including the event loop waiting for worker threads, are
+    not sampled. Where per-thread CPU clocks are unavailable, only the main thread is
+    sampled, once per interval of process CPU time, so work in worker threads is
+    charged to whatever the main thread runs next.
+    """
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL):
+        """Initialize sampling profiler.
+
+        Args:
+            interval: Seconds of CPU time between samples
+        """
+        self.interval = interval
+        self.samples: Dict[Optional[str], Counter] = {}
+        self.worker_samples: Counter = Counter()
+        self._frame_names: Dict[object, str] = {}
+        self._previous_handler = None
+        self._running = False
+        self._main_thread_id = threading.main_thread().ident
+        # Thread ID -> CPU time already turned into samples
+        self._sampled_cpu: Dict[int, float] = {}
+        self._per_thread = False
+        self._stop_event = threading.Event()
+        self._worker_sampler: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start sampling (must be called from the main thread)."""
+        if not hasattr(signal, 'setitimer'):
+            raise RuntimeError('Sampling profiler requires signal.setitimer (Unix)')
+        self._per_thread = _thread_cpu_time(self._main_thread_id) is not None
+        if self._per_thread:
+            for thread_id in sys._current_frames():
+                cpu_time = _thread_cpu_time(thread_id)
+                if cpu_time is not None:
+                    self._sampled_cpu[thread_id] = cpu_time
+            self._stop_event.clear()
+            self._worker_sampler = threading.Thread(
+                target=self._sample_workers, name='profiler-sampler', daemon=True
+            )
+            self._worker_sampler.start()
+        self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        self._running = True
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        if not self._running:
+            return
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+        if self._worker_sampler is not None:
+            self._stop_event.set()
+            self._worker_sampler.join()
+            self._worker_sampler = None
+        self._running = False
+
+    @contextlib.contextmanager
+    def section(self, label: str) -> Iterator[None]:
+        """Attribute samples taken in the current context to label."""
+        token = _current_label.set(label)
+        try:
+            yield
+        finally:
+            _current_label.reset(token)
+
+    def stacks(self, label: Optional[str] = None) -> Counter:
+        """Return main thread sample counts per collapsed stack for a label.
+
+        Args:
+            label: Section label (None: samples outside sections)
+        """
+        return self.samples.get(label, Counter())
+
+    def merged_stacks(self) -> Counter:
+        """Return sample counts per collapsed stack across all labels and worker threads."""
+        merged = Counter(self.worker_samples)
+        for counts in self.samples.values():
+            merged.update(counts)
+        return merged
+
+    def _sample(self, signum, frame) -> None:
+        count = self._cpu_intervals(self._main_thread_id) if self._per_thread else 1
+        if count:
+            stack = self._collapse(frame)
+            if stack:
+                self.samples.setdefault(_current_label.get(), Counter())[stack] += count
+
+    def _sample_workers(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            frames = sys._current_frames()
+            for thread_id, frame in frames.items():
+                if thread_id in (self._main_thread_id, own_id):
+                    continue
+                count = self._cpu_intervals(thread_id)
+                if count:
+                    stack = self._collapse(frame)
+                    self.worker_samples[f'{_WORKER_ROOT_FRAME};{stack}'] += count
+            for thread_id in set(self._sampled_cpu) - set(frames):
+                self._sampled_cpu.pop(thread_id, None)
+
+    def _cpu_intervals(self, thread_id: int) -> int:
+        """Return how many whole intervals of CPU time a thread used since its last sample."""
+        cpu_time = _thread_cpu_time(thread_id)
+        if cpu_time is None:
+            return 0
+        # Threads started after start() have used CPU only while profiling
+        sampled = self._sampled_cpu.get(thread_id, 0.0)
+        count = int((cpu_time - sampled) / self.interval)
+        self._sampled_cpu[thread_id] = sampled + count * self.interval
+        return count
+
+    def _collapse(self, frame) -> str:
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            name = self._frame_names.get(code)
+            if name is None:
+                name = self._frame_names[code] = _frame_name(code)
+            names.append(name)
+            frame = frame.f_back
+        return ';'.join(reversed(names))
+
+
+class EvalProfiler:
+    """Profiles task runs of an eval sweep and writes one profile per run plus a merged one."""
+
+    def __init__(self, output_dir: Path, profiler: str = 'sampling'):
+        """Initialize eval profiler.
+
+        Args:
+            output_dir: Directory for profile files (created if missing)
+            profiler: 'sampling' (stdlib) or 'pyinstrument'
+
+        Raises:
+            ValueError: If the profiler is unknown
+            ImportError: If pyinstrument is requested but not installed
+        """
+        if profiler not in PROFILERS:
+            raise ValueError(f"Unknown profiler '{profiler}' (expected one of {PROFILERS})")
+        if profiler == 'pyinstrument':
+            import pyinstrument  # noqa: F401
+
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.profiler = profiler
+        self._sampler = SamplingProfiler() if profiler == 'sampling' else None
+        self._sessions: List = []
+        self._labels: List[str] = []
+
+    def start(self) -> None:
+        """Start profiling the eval process."""
+        if self._sampler:
+            self._sampler.start()
+
+    @contextlib.contextmanager
+    def task(self, label: str) -> Iterator[None]:
+        """Profile one task run (and the MCP server it starts) under a unique label."""
+        label = self._unique_label(label)
+        suffix = '.collapsed' if self.profiler == 'sampling' else '.pyisession'
+        server_profile = self.output_dir / f'{label}.server{suffix}'
+        token = _server_profile_env.set(
+            {PROFILE_FILE_ENV: str(server_profile), PROFILER_ENV: self.profiler}
+        )
+        try:
+            if self._sampler:
+                with self._sampler.section(label):
+                    yield
+            else:
+                with self._pyinstrument_session(label):
+                    yield
+        finally:
+            _server_profile_env.reset(token)
+
+    def finish(self) -> None:
+        """Stop profiling and write per-run and merged profiles."""
+        if self._sampler:
+            self._sampler.stop()
+            merged = self._sampler.merged_stacks()
+            for label in self._labels:
+                write_collapsed(self.output_dir / f'{label}.collapsed', self._sampler.stacks(label))
+                merged.update(self._read_server_profile(label))
+            write_collapsed(self.output_dir / 'merged.collapsed', merged)
+        else:
+            self._finish_pyinstrument()
+        logger.debug(f'Wrote profiles to {self.output_dir}')
+
+    @contextlib.contextmanager
+    def _pyinstrument_session(self, label: str) -> Iterator[None]:
+        from pyinstrument import Profiler
+
+        profiler = Profiler(async_mode='enabled')
+        profiler.start()
+        try:
+            yield
+        finally:
+            session = profiler.stop()
+            self._sessions.append(session)
+            (self.output_dir / f'{label}.html').write_text(profiler.output_html())
+
+    def _finish_pyinstrument(self) -> None:
+        from pyinstrument.renderers import HTMLRenderer
+        from pyinstrument.session import Session
+
+        sessions = list(self._sessions)
+        for label in self._labels:
+            server_path = self.output_dir / f'{label}.server.pyisession'
+            if server_path.exists():
+                server_session = Session.load(str(server_path))
+                (self.output_dir / f'{label}.server.html').write_text(
+                    HTMLRenderer().render(server_session)
+                )
+                sessions.append(server_session)
+        if sessions:
+            merged = sessions[0]
+            for session in sessions[1:]:
+                merged = Session.combine(merged, session)
+            (self.output_dir / 'merged.html').write_text(HTMLRenderer().render(merged))
+
+    def _read_server_profile(self, label: str) -> Counter:
+        counts = Counter()
+        try:
+            with open(self.output_dir / f'{label}.server.collapsed', 'r') as f:
+                for line in f:
+                    stack, _, count = line.rstrip('\n').rpartition(' ')
+                    if stack and count.isdigit():
+                        counts[f'{_SERVER_ROOT_FRAME};{stack}'] += int(count)
+        except FileNotFoundError:
+            logger.debug(f'No server profile for {label}')
+        return counts
+
+    def _unique_label(self, label: str) -> str:
+        label = re.sub(r'[^A-Za-z0-9_.-]', '_', label)
+        unique = label
+        n = 2
+        while unique in self._labels:
+            unique = f'{label}-{n}'
+            n += 1
+        self._labels.append(unique)
+        return unique
+
+
+def profile_process_from_env() -> None:
+    """Profile this process until exit if PROFILE_FILE_ENV is set (used by the server wrapper)."""
+    path = os.environ.get(PROFILE_FILE_ENV)
+    if not path:
+        return
+
+    if os.environ.get(PROFILER_ENV) == 'pyinstrument':
+        from pyinstrument import Profiler
+
+        profiler = Profiler()
+        profiler.start()
+
+        def dump():
+            profiler.stop().save(path)
+
+    else:
+        sampler = SamplingProfiler()
+        sampler.start()
+
+        def dump():
+            sampler.stop()
+            write_collapsed(Path(path), sampler.merged_stacks())
+
+    atexit.register(dump)
+    # The client terminates the server on shutdown; exit normally so the profile is written
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+
+def write_collapsed(path: Path, counts: Counter) -> None:
+    """Write sample counts in collapsed-stack format, most frequent first."""
+    with open(path, 'w') as f:
+        for stack, count in counts.most_common():
+            f.write(f'{stack} {count}\n')
+
+
+def _thread_cpu_time(thread_id: int) -> Optional[float]:
+    """Return the CPU time of a thread in seconds, or None if it cannot be read."""
+    try:
+        return time.clock_gettime(time.pthread_getcpuclockid(thread_id))
+    except (AttributeError, OSError):
+        return None
+
+
+def _frame_name(code) -> str:
+    """Return 'function (dir/file.py:line)' for a code object (';' is the stack separator)."""
+    name = getattr(code, 'co_qualname', code.co_name)
+    filename = '/'.join(Path(code.co_filename).parts[-2:])
+    return f'{name} ({filename}:{code.co_firstlineno})'.replace(';', ':')
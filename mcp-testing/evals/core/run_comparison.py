@@ -0,0 +1,237 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Comparison of two eval runs exported with --output.
+
+Results files are read line by line and folded into per-task aggregates, so memory
+grows with the number of tasks rather than the size of the files (each line carries
+full tool call details). Tasks with several trials are compared by pass counts and
+mean metrics. The two runs are joined by task ID.
+"""
+
+import json
+from dataclasses import dataclass, field
+from loguru import logger
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+# Metrics compared per task, with True if a higher value is better
+COMPARED_METRICS: Dict[str, bool] = {
+    'task_duration': False,
+    'turn_count': False,
+    'tool_call_count': False,
+    'hit_rate': True,
+}
+
+# Default relative change for a metric to count as a regression (10%)
+DEFAULT_REGRESSION_THRESHOLD = 0.1
+
+_STATUS_RANK = {'fail': 0, 'flaky': 1, 'pass': 2}
+
+
+@dataclass
+class TaskRunStats:
+    """Aggregated results of one task in one run (all trials)."""
+
+    runs: int = 0
+    passes: int = 0
+    errors: int = 0
+    metric_sums: Dict[str, float] = field(default_factory=dict)
+    metric_counts: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, record: dict) -> None:
+        """Fold one result record into the aggregate."""
+        self.runs += 1
+        self.passes += int(bool(record.get('success')))
+        self.errors += int(bool(record.get('error')))
+        metrics = record.get('metrics') or {}
+        for name in COMPARED_METRICS:
+            value = metrics.get(name)
+            if isinstance(value, (int, float)):
+                self.metric_sums[name] = self.metric_sums.get(name, 0.0) + value
+                self.metric_counts[name] = self.metric_counts.get(name, 0) + 1
+
+    @property
+    def status(self) -> str:
+        """Return 'pass' if every run passed, 'fail' if none did, else 'flaky'."""
+        if self.passes == self.runs:
+            return 'pass'
+        return 'fail' if self.passes == 0 else 'flaky'
+
+    def mean(self, name: str) -> Optional[float]:
+        """Return the mean of a metric across runs, or None if never reported."""
+        count = self.metric_counts.get(name)
+        return self.metric_sums[name] / count if count else None
+
+
+def read_run_stats(results_path: Path) -> Dict[str, TaskRunStats]:
+    """Stream a results file into per-task aggregates.
+
+    Args:
+        results_path: JSON Lines file written with --output
+
+    Returns:
+        Dict mapping task ID to TaskRunStats, in first-seen order
+    """
+    stats: Dict[str, TaskRunStats] = {}
+    with open(results_path, 'r') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                task_id = record['task_id']
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f'Skipping malformed line {line_number} in {results_path}: {e}')
+                continue
+            stats.setdefault(task_id, TaskRunStats()).add(record)
+    return stats
+
+
+@dataclass
+class TaskComparison:
+    """Baseline and candidate results of one task."""
+
+    task_id: str
+    baseline: TaskRunStats
+    candidate: TaskRunStats
+
+    @property
+    def flip(self) -> Optional[str]:
+        """Return 'regressed' or 'fixed' if the pass status changed, else None."""
+        before = _STATUS_RANK[self.baseline.status]
+        after = _STATUS_RANK[self.candidate.status]
+        if after < before:
+            return 'regressed'
+        return 'fixed' if after > before else None
+
+    def delta(self, name: str) -> Optional[Tuple[float, float]]:
+        """Return (baseline mean, candidate mean) of a metric, or None if either is missing."""
+        before, after = self.baseline.mean(name), self.candidate.mean(name)
+        if before is None or after is None:
+            return None
+        return before, after
+
+    def regressed_metrics(self, threshold: float = DEFAULT_REGRESSION_THRESHOLD) -> List[str]:
+        """Return metrics that got worse by more than threshold (relative change)."""
+        regressed = []
+        for name, higher_is_better in COMPARED_METRICS.items():
+            values = self.delta(name)
+            if values is None:
+                continue
+            change = _relative_change(*values)
+            if change is not None and (-change if higher_is_better else change) > threshold:
+                regressed.append(name)
+        return regressed
+
+
+@dataclass
+class RunComparison:
+    """Join of two runs by task ID."""
+
+    tasks: List[TaskComparison]
+    only_in_baseline: List[str]
+    only_in_candidate: List[str]
+
+    def totals(self, name: str) -> Optional[Tuple[float, float]]:
+        """Return summed per-task means of a metric over tasks reporting it in both runs."""
+        values = [v for v in (t.delta(name) for t in self.tasks) if v is not None]
+        if not values:
+            return None
+        return sum(v[0] for v in values), sum(v[1] for v in values)
+
+    def has_regressions(self, threshold: float = DEFAULT_REGRESSION_THRESHOLD) -> bool:
+        """Return True if any task flipped to failing or a metric regressed past threshold."""
+        return any(t.flip == 'regressed' or t.regressed_metrics(threshold) for t in self.tasks)
+
+    def format_report(self, threshold: float = DEFAULT_REGRESSION_THRESHOLD) -> str:
+        """Format the comparison as a human-readable report."""
+        lines = ['=' * 60, 'RUN COMPARISON (baseline -> candidate)', '=' * 60]
+
+        flips = [t for t in self.tasks if t.flip]
+        lines.append(f'Pass/fail changes: {len(flips)}')
+        for t in flips:
+            lines.append(
+                f'  {t.flip.upper()}: {t.task_id} '
+                f'({t.baseline.passes}/{t.baseline.runs} -> {t.candidate.passes}/{t.candidate.runs})'
+            )
+
+        lines.append('')
+        lines.append(f'Per-task metrics ({len(self.tasks)} task(s) in both runs):')
+        for t in self.tasks:
+            regressed = t.regressed_metrics(threshold)
+            marker = '  [REGRESSED: ' + ', '.join(regressed) + ']' if regressed else ''
+            lines.append(f'  {t.task_id}{marker}')
+            for name in COMPARED_METRICS:
+                values = t.delta(name)
+                if values is not None:
+                    lines.append(f'    {name}: {_format_delta(*values)}')
+
+        lines.append('')
+        lines.append('Aggregate:')
+        for name in ('task_duration', 'turn_count', 'tool_call_count'):
+            totals = self.totals(name)
+            if totals is None:
+                continue
+            line = f'  total {name}: {_format_delta(*totals)}'
+            before, after = totals
+            if name == 'task_duration' and before > 0 and after > 0:
+                if before >= after:
+                    line += f' ({before / after:.2f}x speedup)'
+                else:
+                    line += f' ({after / before:.2f}x slowdown)'
+            lines.append(line)
+
+        if self.only_in_baseline:
+            lines.append(f'\nOnly in baseline: {", ".join(self.only_in_baseline)}')
+        if self.only_in_candidate:
+            lines.append(f'\nOnly in candidate: {", ".join(self.only_in_candidate)}')
+        lines.append('=' * 60)
+        return '\n'.join(lines)
+
+
+def compare_runs(baseline_path: Path, candidate_path: Path) -> RunComparison:
+    """Compare two results files written with --output.
+
+    Args:
+        baseline_path: Results of the reference run
+        candidate_path: Results of the run being evaluated
+
+    Returns:
+        RunComparison with tasks in baseline order
+    """
+    baseline = read_run_stats(baseline_path)
+    candidate = read_run_stats(candidate_path)
+    return RunComparison(
+        tasks=[
+            TaskComparison(task_id, stats, candidate[task_id])
+            for task_id, stats in baseline.items()
+            if task_id in candidate
+        ],
+        only_in_baseline=[task_id for task_id in baseline if task_id not in candidate],
+        only_in_candidate=[task_id for task_id in candidate if task_id not in baseline],
+    )
+
+
+def _relative_change(before: float, after: float) -> Optional[float]:
+    if before == 0:
+        return None if after == 0 else float('inf')
+    return (after - before) / abs(before)
+
+
+def _format_delta(before: float, after: float) -> str:
+    change = _relative_change(before, after)
+    percent = '' if change is None or change == float('inf') else f' ({change:+.1%})'
+    return f'{before:.2f} -> {after:.2f}, {after - before:+.2f}{percent}'
@@ -0,0 +1,223 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Duration-aware task partitioning and ordering.
+
+Tasks are split across shards with longest-processing-time-first (LPT) bin packing:
+tasks are sorted by expected duration (longest first) and each is assigned to the
+shard with the least total expected duration so far. Ties are broken by task ID and
+shard number, so every runner computes the same partition.
+
+Concurrent runs start the longest tasks first, using expected durations from a local
+TaskHistory, so short tasks fill in at the end instead of a long task starting last.
+Tasks without history start before all others, in declared order, since their duration
+is unknown.
+"""
+
+import json
+import os
+import statistics
+import tempfile
+from loguru import logger
+from pathlib import Path
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple, TypeVar
+
+
+T = TypeVar('T', bound=Hashable)
+
+# Expected duration used for every task when no history is available
+DEFAULT_TASK_DURATION = 1.0
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse a shard specification of the form 'i/N' (1-based).
+
+    Args:
+        value: Shard specification, e.g., '2/4'
+
+    Returns:
+        Tuple of (shard index, shard count)
+
+    Raises:
+        ValueError: If the specification is malformed or out of range
+    """
+    try:
+        index_str, count_str = value.split('/')
+        index, count = int(index_str), int(count_str)
+    except ValueError:
+        raise ValueError(f"Invalid shard '{value}', expected 'i/N' (e.g., 1/4)")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{value}', expected 1 <= i <= N")
+    return index, count
+
+
+def load_task_durations(results_path: Path) -> Dict[str, float]:
+    """Read mean task durations from a results file written with --output.
+
+    Args:
+        results_path: JSON Lines file with one task result per line
+
+    Returns:
+        Dict mapping task ID to mean task_duration in seconds
+    """
+    samples: Dict[str, List[float]] = {}
+    with open(results_path, 'r') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                duration = (record.get('metrics') or {}).get('task_duration')
+                if duration is not None:
+                    samples.setdefault(record['task_id'], []).append(float(duration))
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                logger.warning(f'Skipping malformed line {line_number} in {results_path}: {e}')
+    return {task_id: statistics.fmean(values) for task_id, values in samples.items()}
+
+
+def fill_missing_durations(keys: Sequence[T], durations: Mapping[T, float]) -> Dict[T, float]:
+    """Return a duration for every key, using the median known duration for unseen ones."""
+    known = [durations[key] for key in keys if key in durations]
+    default = statistics.median(known) if known else DEFAULT_TASK_DURATION
+    return {key: durations.get(key, default) for key in keys}
+
+
+def partition_tasks(
+    keys: Sequence[T],
+    durations: Mapping[T, float],
+    num_shards: int,
+    sort_key=str,
+) -> List[List[T]]:
+    """Partition tasks into shards with roughly equal total expected duration.
+
+    Args:
+        keys: Task keys (e.g., task IDs), in declared order
+        durations: Expected duration per key (keys without history get the median)
+        num_shards: Number of shards
+        sort_key: Function giving a deterministic tie-breaker for each key
+
+    Returns:
+        One list of keys per shard, each in declared order
+    """
+    expected = fill_missing_durations(keys, durations)
+    loads = [0.0] * num_shards
+    assignment: Dict[T, int] = {}
+
+    for key in sorted(keys, key=lambda k: (-expected[k], sort_key(k))):
+        shard = min(range(num_shards), key=lambda i: (loads[i], i))
+        assignment[key] = shard
+        loads[shard] += expected[key]
+
+    shards: List[List[T]] = [[] for _ in range(num_shards)]
+    for key in keys:
+        shards[assignment[key]].append(key)
+    return shards
+
+
+def order_longest_first(keys: Sequence[T], durations: Mapping[T, float]) -> List[T]:
+    """Order tasks by expected duration, longest first.
+
+    Keys without history come first, in declared order (so with no history at all the
+    declared order is kept). Keys with equal durations keep their declared order.
+
+    Args:
+        keys: Task keys in declared order
+        durations: Expected duration per key
+
+    Returns:
+        Keys in start order
+    """
+    unseen = [key for key in keys if key not in durations]
+    seen = [key for key in keys if key in durations]
+    return unseen + sorted(seen, key=lambda key: -durations[key])
+
+
+class TaskHistory:
+    """Recent task_duration and turn_count metrics per task, persisted as JSON."""
+
+    # Number of recent runs kept per task
+    MAX_SAMPLES = 5
+
+    def __init__(self, path: Optional[Path] = None):
+        """Initialize task history.
+
+        Args:
+            path: History file (default: task_history.json under CACHE_DIR)
+        """
+        if path is None:
+            from .eval_config import CACHE_DIR
+
+            path = Path(CACHE_DIR) / 'task_history.json'
+        self.path = path
+        self._entries = self._read()
+        self._updated: Dict[str, Dict[str, List[float]]] = {}
+
+    def record(self, task_id: str, metrics: Dict[str, Any]) -> None:
+        """Record metrics of a completed task run (saved by save())."""
+        entry = self._entries.setdefault(task_id, {'task_duration': [], 'turn_count': []})
+        for name in ('task_duration', 'turn_count'):
+            value = metrics.get(name)
+            if value is not None:
+                entry[name] = (entry.get(name, []) + [float(value)])[-self.MAX_SAMPLES :]
+        self._updated[task_id] = entry
+
+    def expected_durations(self, task_ids: Sequence[str]) -> Dict[str, float]:
+        """Return expected durations in seconds for tasks with history.
+
+        Tasks with turn counts but no durations are estimated from the mean time per
+        turn across all recorded tasks.
+        """
+        total_duration = total_turns = 0.0
+        for entry in self._entries.values():
+            if entry.get('task_duration') and entry.get('turn_count'):
+                total_duration += statistics.fmean(entry['task_duration'])
+                total_turns += statistics.fmean(entry['turn_count'])
+        seconds_per_turn = total_duration / total_turns if total_turns else None
+
+        durations = {}
+        for task_id in task_ids:
+            entry = self._entries.get(task_id, {})
+            if entry.get('task_duration'):
+                durations[task_id] = statistics.fmean(entry['task_duration'])
+            elif entry.get('turn_count') and seconds_per_turn is not None:
+                durations[task_id] = statistics.fmean(entry['turn_count']) * seconds_per_turn
+        return durations
+
+    def save(self) -> None:
+        """Write recorded runs, merged with entries saved concurrently by other processes."""
+        if not self._updated:
+            return
+        entries = self._read()
+        entries.update(self._updated)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entries, f, indent=2)
+            os.replace(tmp_path, self.path)
+            self._entries = entries
+            self._updated = {}
+        except OSError as e:
+            logger.warning(f'Failed to save task history {self.path}: {e}')
+
+    def _read(self) -> Dict[str, Dict[str, List[float]]]:
+        try:
+            with open(self.path, 'r') as f:
+                entries = json.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.debug(f'Ignoring unreadable task history {self.path}: {e}')
+            return {}
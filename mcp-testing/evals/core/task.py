@@ -14,9 +14,10 @@
 
 """Base Task class for MCP evaluations."""
 
+import asyncio
 from .captor import Captor
 from .mock_config_path_normalizer import MockConfigPathNormalizer
-from .process_executor import ProcessExecutor, SubprocessExecutor
+from .process_executor import AsyncProcessExecutor, ProcessExecutor
 from .validator import Validator
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -41,6 +42,7 @@ class Task(ABC):
         - get_captors(working_directory): Return captors to collect execution data
         - get_validators(working_directory): Return validators for custom validation
         - get_working_directory(): Return task working directory
+        - allows_concurrent_runs(): Return True if runs do not share a working directory
         - setup(working_directory): Set up workspace before task execution
         - cleanup(working_directory): Clean up after execution
 
@@ -49,7 +51,7 @@ class Task(ABC):
         expected_tools: MCP tool names expected to be called (for hit rate metric)
         mock_config: Mock configuration for AWS APIs (for initialization only - use resolved_mock_config to access)
         fixtures_dir: Base directory for resolving fixture paths
-        process_executor: ProcessExecutor for shell commands (default: SubprocessExecutor)
+        process_executor: ProcessExecutor for shell commands (default: AsyncProcessExecutor)
 
     Note:
         When accessing mock configuration in framework code, always use the resolved_mock_config
@@ -64,7 +66,7 @@ class Task(ABC):
     # TODO: Consider typed config classes (e.g., Boto3MockConfig) instead of Dict[str, Any] for better type safety
     mock_config: Optional[Dict[str, Any]] = None
     fixtures_dir: Optional[Path] = None
-    process_executor: ProcessExecutor = field(default_factory=SubprocessExecutor)
+    process_executor: ProcessExecutor = field(default_factory=AsyncProcessExecutor)
 
     @abstractmethod
     def get_prompt(self, working_directory: Path) -> str:
@@ -180,6 +182,18 @@ class Task(ABC):
         """Return working directory for this task. None uses current directory."""
         return None
 
+    def allows_concurrent_runs(self) -> bool:
+        """Return True if runs of this task can overlap with other runs.
+
+        Override to return True when each run gets its own working directory (or does
+        not modify one). Tasks that return False run one at a time, even with
+        --concurrency or --trials.
+
+        Returns:
+            False by default, since the default working directory is shared
+        """
+        return False
+
     def setup(self, working_directory: Path) -> None:
         """Set up workspace before task execution.
 
@@ -206,6 +220,28 @@ class Task(ABC):
         """
         pass
 
+    async def setup_async(self, working_directory: Path) -> None:
+        """Run setup() without blocking the event loop.
+
+        The framework calls this instead of setup(). The default runs setup() in a
+        worker thread; override to await async work (e.g., process_executor.run_async).
+
+        Args:
+            working_directory: Path to task working directory
+        """
+        await asyncio.to_thread(self.setup, working_directory)
+
+    async def cleanup_async(self, working_directory: Path) -> None:
+        """Run cleanup() without blocking the event loop.
+
+        The framework calls this instead of cleanup(). The default runs cleanup() in a
+        worker thread; override to await async work (e.g., process_executor.run_async).
+
+        Args:
+            working_directory: Path to task working directory
+        """
+        await asyncio.to_thread(self.cleanup, working_directory)
+
     def __str__(self) -> str:
         """Return string representation of the task."""
         return f'Task({self.id})'
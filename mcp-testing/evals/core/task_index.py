@@ -0,0 +1,208 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cached index of task modules and the task IDs they define.
+
+Task modules (*_tasks.py) are imported once to record their task IDs, along with
+the size and mtime of every source file under the task directory that the import
+loaded. Later runs list and filter tasks from the index, and import only modules
+whose tasks were selected. A module is re-imported only when one of its recorded
+source files changes.
+"""
+
+import hashlib
+import importlib
+import json
+import os
+import sys
+import tempfile
+from loguru import logger
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+
+if TYPE_CHECKING:
+    from .task import Task
+
+
+# Bump when the index file format changes
+_INDEX_VERSION = 1
+
+
+class TaskIndex:
+    """Index of task modules under a task directory, persisted as JSON."""
+
+    def __init__(self, task_dir: Path, index_path: Optional[Path] = None):
+        """Initialize task index.
+
+        Args:
+            task_dir: Directory containing *_tasks.py modules
+            index_path: Index file (default: under CACHE_DIR, keyed by task_dir)
+        """
+        self.task_dir = Path(task_dir).absolute()
+        if index_path is None:
+            from .eval_config import CACHE_DIR
+
+            dir_hash = hashlib.sha256(str(self.task_dir).encode('utf-8')).hexdigest()[:16]
+            index_path = Path(CACHE_DIR) / 'task_index' / f'{dir_hash}.json'
+        self.index_path = index_path
+        self._loaded: Dict[str, List['Task']] = {}
+
+    def get_task_ids(self) -> Dict[str, List[str]]:
+        """Return task IDs by module name, importing only modules that changed.
+
+        Returns:
+            Dict mapping module name to task IDs, in discovery order
+        """
+        _add_to_sys_path(self.task_dir)
+        cached = self._read_index()
+        modules = {}
+        changed = False
+
+        task_files = list(self.task_dir.rglob('*_tasks.py'))
+        logger.debug(f'Discovered task files in {self.task_dir}: {task_files}')
+
+        for task_file in task_files:
+            module_name = _module_name(self.task_dir, task_file)
+            entry = cached.get(module_name)
+            if entry is None or not self._is_fresh(entry):
+                entry = self._index_module(module_name)
+                changed = True
+                if entry is None:
+                    continue
+            modules[module_name] = entry
+
+        if changed or set(modules) != set(cached):
+            self._write_index(modules)
+        return {name: entry['task_ids'] for name, entry in modules.items() if entry['task_ids']}
+
+    def load_tasks(self, module_names: List[str]) -> Dict[str, List['Task']]:
+        """Import the given task modules and return their tasks.
+
+        Args:
+            module_names: Module names as returned by get_task_ids()
+
+        Returns:
+            Dict mapping module name to Task instances (modules that fail to load are omitted)
+        """
+        _add_to_sys_path(self.task_dir)
+        tasks_by_module = {}
+        for module_name in module_names:
+            if module_name not in self._loaded:
+                tasks = _import_tasks(module_name)
+                if tasks is None:
+                    continue
+                self._loaded[module_name] = tasks
+            tasks_by_module[module_name] = self._loaded[module_name]
+        return tasks_by_module
+
+    def _index_module(self, module_name: str) -> Optional[dict]:
+        before = set(sys.modules)
+        tasks = _import_tasks(module_name)
+        if tasks is None:
+            return None
+        self._loaded[module_name] = tasks
+
+        # Record source files under task_dir loaded by this import (e.g., config modules),
+        # plus already-loaded package __init__ files enclosing the module (shared helpers)
+        module_dir = Path(sys.modules[module_name].__file__).parent
+        sources = {}
+        for name, module in list(sys.modules.items()):
+            source = getattr(module, '__file__', None)
+            if not source or not Path(source).is_relative_to(self.task_dir):
+                continue
+            source_path = Path(source)
+            is_enclosing_package = source_path.name == '__init__.py' and (
+                module_dir.is_relative_to(source_path.parent)
+            )
+            if name in before and name != module_name and not is_enclosing_package:
+                continue
+            stat = os.stat(source_path)
+            sources[str(source_path.relative_to(self.task_dir))] = [stat.st_size, stat.st_mtime_ns]
+        return {'task_ids': [task.id for task in tasks], 'sources': sources}
+
+    def _is_fresh(self, entry: dict) -> bool:
+        try:
+            for rel_path, recorded in entry['sources'].items():
+                stat = os.stat(self.task_dir / rel_path)
+                if [stat.st_size, stat.st_mtime_ns] != recorded:
+                    return False
+        except (OSError, KeyError, AttributeError):
+            return False
+        return True
+
+    def _read_index(self) -> Dict[str, dict]:
+        try:
+            with open(self.index_path, 'r') as f:
+                data = json.load(f)
+            if data.get('version') == _INDEX_VERSION and data.get('task_dir') == str(
+                self.task_dir
+            ):
+                return data['modules']
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, AttributeError) as e:
+            logger.debug(f'Ignoring unreadable task index {self.index_path}: {e}')
+        return {}
+
+    def _write_index(self, modules: Dict[str, dict]) -> None:
+        data = {'version': _INDEX_VERSION, 'task_dir': str(self.task_dir), 'modules': modules}
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.index_path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.debug(f'Failed to write task index {self.index_path}: {e}')
+
+
+def _add_to_sys_path(task_dir: Path) -> None:
+    """Add task directories to sys.path to enable bare module imports.
+
+    Alternative: require task directories to be proper packages (with __init__.py)
+    and use fully qualified imports.
+    """
+    for path in (str(task_dir.parent), str(task_dir)):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+
+def _module_name(task_dir: Path, task_file: Path) -> str:
+    """Convert a task file path to a module name relative to task_dir."""
+    return str(task_file.relative_to(task_dir).with_suffix('')).replace(os.sep, '.')
+
+
+def _import_tasks(module_name: str) -> Optional[List['Task']]:
+    """Import a task module and return its valid Task instances (None if the import fails)."""
+    from .task import Task
+
+    try:
+        module = importlib.import_module(module_name)
+    except Exception as e:
+        logger.warning(f'Failed to load tasks from {module_name}: {e}')
+        return None
+
+    valid_tasks = []
+    for task in getattr(module, 'TASKS', []):
+        if isinstance(task, Task):
+            valid_tasks.append(task)
+        else:
+            logger.warning(
+                f'Skipping non-Task object in {module_name}.TASKS: {task} '
+                f'(type: {type(task).__name__})'
+            )
+    if valid_tasks:
+        logger.debug(f'Loaded {len(valid_tasks)} tasks from {module_name}')
+    return valid_tasks
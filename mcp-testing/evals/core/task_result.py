@@ -14,6 +14,7 @@
 
 """Result types for task execution."""
 
+from .latency_histogram import format_latency_line
 from .validator import ValidationResult
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
@@ -31,6 +32,7 @@ class TaskResult:
         metrics: Dictionary of metrics (duration, turns, tool calls, etc.)
         captured_data: Data captured by captors during execution
         error: Error message if the task failed to execute (None if successful)
+        trial: 1-based trial number when the task was run multiple times (--trials)
     """
 
     task_id: str
@@ -40,6 +42,7 @@ class TaskResult:
     metrics: Optional[Dict[str, Any]] = None
     captured_data: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
+    trial: Optional[int] = None
 
     @classmethod
     def from_execution(
@@ -94,6 +97,23 @@ class TaskResult:
             error=error,
         )
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable summary for results files.
+
+        Captured data and the prompt are omitted to keep records small.
+
+        Returns:
+            Dict with task_id, trial, success, error, metrics and validation_results
+        """
+        return {
+            'task_id': self.task_id,
+            'trial': self.trial,
+            'success': self.success,
+            'error': self.error,
+            'metrics': self.metrics,
+            'validation_results': self.validation_results,
+        }
+
     def get_captured_data_str(self) -> str:
         """Get string representation of captured_data for debug reporting.
 
@@ -122,9 +142,12 @@ class TaskResult:
 
     def __str__(self) -> str:
         """Format result as a human-readable string."""
+        title = f'EVALUATION RESULT: {self.task_id}'
+        if self.trial is not None:
+            title += f' (trial {self.trial})'
         lines = [
             '=' * 60,
-            f'EVALUATION RESULT: {self.task_id}',
+            title,
             '=' * 60,
         ]
 
@@ -159,6 +182,16 @@ class TaskResult:
                         f'({stats["success"]} success, {stats["failed"]} failed)'
                     )
 
+            if self.metrics.get('phases'):
+                lines.extend(['', 'Phases:'])
+                for phase, seconds in self.metrics['phases'].items():
+                    lines.append(f'  - {phase}: {seconds:.2f}s')
+
+            if self.metrics.get('tool_latency'):
+                lines.extend(['', 'Tool Latency:'])
+                for tool_name, summary in self.metrics['tool_latency'].items():
+                    lines.append(format_latency_line(tool_name, summary))
+
         if self.validation_results:
             lines.extend(['', 'Validation Results:'])
             for validation_result in self.validation_results:
@@ -0,0 +1,324 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Regex-like patterns over tool call sequences.
+
+Patterns are compiled once into a DFA so matching a captured tool call sequence
+is a single linear pass, regardless of how many orderings the pattern allows.
+
+Grammar (whitespace separates tokens):
+    list_slos          Tool name (letters, digits, '_' and '-')
+    .                  Any single tool call
+    a b                Sequence
+    a | b              Alternation
+    ( ... )            Grouping
+    x?  x*  x+         Optional, zero or more, one or more
+    {a, b, c}          Unordered group: every item exactly once, in any order
+
+Example:
+    'list_slos audit_slos? get_slo audit_slos' matches
+    [list_slos, get_slo, audit_slos] and [list_slos, audit_slos, get_slo, audit_slos]
+"""
+
+import itertools
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+
+
+# Unordered groups expand to all permutations; keep the expansion bounded.
+MAX_UNORDERED_GROUP_SIZE = 6
+
+_TOKEN_RE = re.compile(r'\s*(?:([A-Za-z0-9_\-]+)|(.))')
+_OPERATORS = set('|()?*+{},.')
+
+# AST node kinds
+_SYMBOL = 'symbol'
+_ANY = 'any'
+_SEQUENCE = 'sequence'
+_ALTERNATION = 'alternation'
+_OPTIONAL = 'optional'
+_STAR = 'star'
+_PLUS = 'plus'
+_UNORDERED = 'unordered'
+
+
+class ToolCallPatternError(ValueError):
+    """Raised when a tool call pattern cannot be parsed."""
+
+
+def _tokenize(pattern: str) -> List[str]:
+    tokens = []
+    position = 0
+    while position < len(pattern):
+        match = _TOKEN_RE.match(pattern, position)
+        if not match or match.end() == position:
+            break
+        name, operator = match.groups()
+        if name:
+            tokens.append(name)
+        elif operator is not None and not operator.isspace():
+            if operator not in _OPERATORS:
+                raise ToolCallPatternError(
+                    f"Unexpected character '{operator}' in tool call pattern: {pattern!r}"
+                )
+            tokens.append(operator)
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive descent parser producing a nested-tuple AST."""
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.tokens = _tokenize(pattern)
+        self.position = 0
+
+    def parse(self) -> tuple:
+        if not self.tokens:
+            raise ToolCallPatternError('Tool call pattern is empty')
+        node = self._alternation()
+        if self.position != len(self.tokens):
+            raise ToolCallPatternError(
+                f"Unexpected '{self.tokens[self.position]}' in tool call pattern: {self.pattern!r}"
+            )
+        return node
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _expect(self, token: str) -> None:
+        if self._peek() != token:
+            raise ToolCallPatternError(f"Expected '{token}' in tool call pattern: {self.pattern!r}")
+        self.position += 1
+
+    def _alternation(self) -> tuple:
+        branches = [self._sequence()]
+        while self._peek() == '|':
+            self.position += 1
+            branches.append(self._sequence())
+        return branches[0] if len(branches) == 1 else (_ALTERNATION, branches)
+
+    def _sequence(self) -> tuple:
+        items = []
+        while self._peek() is not None and self._peek() not in '|),}':
+            items.append(self._repeat())
+        if not items:
+            raise ToolCallPatternError(f'Empty branch in tool call pattern: {self.pattern!r}')
+        return items[0] if len(items) == 1 else (_SEQUENCE, items)
+
+    def _repeat(self) -> tuple:
+        node = self._atom()
+        while self._peek() in ('?', '*', '+'):
+            operator = self.tokens[self.position]
+            self.position += 1
+            node = ({'?': _OPTIONAL, '*': _STAR, '+': _PLUS}[operator], node)
+        return node
+
+    def _atom(self) -> tuple:
+        token = self._peek()
+        if token is None:
+            raise ToolCallPatternError(f'Unexpected end of tool call pattern: {self.pattern!r}')
+        self.position += 1
+
+        if token == '.':
+            return (_ANY,)
+        if token == '(':
+            node = self._alternation()
+            self._expect(')')
+            return node
+        if token == '{':
+            items = [self._alternation()]
+            while self._peek() == ',':
+                self.position += 1
+                items.append(self._alternation())
+            self._expect('}')
+            if len(items) > MAX_UNORDERED_GROUP_SIZE:
+                raise ToolCallPatternError(
+                    f'Unordered groups support at most {MAX_UNORDERED_GROUP_SIZE} items, '
+                    f'got {len(items)} in: {self.pattern!r}'
+                )
+            return (_UNORDERED, items)
+        if token in _OPERATORS:
+            raise ToolCallPatternError(f"Unexpected '{token}' in tool call pattern: {self.pattern!r}")
+        return (_SYMBOL, token)
+
+
+def _collect_names(node: tuple, names: Set[str]) -> None:
+    kind = node[0]
+    if kind == _SYMBOL:
+        names.add(node[1])
+    elif kind in (_SEQUENCE, _ALTERNATION, _UNORDERED):
+        for child in node[1]:
+            _collect_names(child, names)
+    elif kind in (_OPTIONAL, _STAR, _PLUS):
+        _collect_names(node[1], names)
+
+
+class _Nfa:
+    """Thompson NFA with integer symbols; epsilon moves are kept separately."""
+
+    def __init__(self, alphabet_size: int):
+        self.alphabet_size = alphabet_size
+        self.moves: List[Dict[int, Set[int]]] = []
+        self.epsilon: List[Set[int]] = []
+
+    def new_state(self) -> int:
+        self.moves.append({})
+        self.epsilon.append(set())
+        return len(self.moves) - 1
+
+    def build(self, node: tuple, symbol_ids: Dict[str, int]) -> Tuple[int, int]:
+        """Build a fragment for node and return its (start, accept) states."""
+        kind = node[0]
+        start = self.new_state()
+        accept = self.new_state()
+
+        if kind in (_SYMBOL, _ANY):
+            symbols = [symbol_ids[node[1]]] if kind == _SYMBOL else range(self.alphabet_size)
+            for symbol in symbols:
+                self.moves[start].setdefault(symbol, set()).add(accept)
+        elif kind == _SEQUENCE:
+            current = start
+            for child in node[1]:
+                child_start, child_accept = self.build(child, symbol_ids)
+                self.epsilon[current].add(child_start)
+                current = child_accept
+            self.epsilon[current].add(accept)
+        elif kind == _ALTERNATION:
+            for child in node[1]:
+                child_start, child_accept = self.build(child, symbol_ids)
+                self.epsilon[start].add(child_start)
+                self.epsilon[child_accept].add(accept)
+        elif kind == _UNORDERED:
+            orderings = [(_SEQUENCE, list(p)) for p in itertools.permutations(node[1])]
+            child_start, child_accept = self.build((_ALTERNATION, orderings), symbol_ids)
+            self.epsilon[start].add(child_start)
+            self.epsilon[child_accept].add(accept)
+        else:
+            child_start, child_accept = self.build(node[1], symbol_ids)
+            self.epsilon[start].add(child_start)
+            self.epsilon[child_accept].add(accept)
+            if kind in (_OPTIONAL, _STAR):
+                self.epsilon[start].add(accept)
+            if kind in (_STAR, _PLUS):
+                self.epsilon[child_accept].add(child_start)
+
+        return start, accept
+
+    def closure(self, states: Set[int]) -> FrozenSet[int]:
+        stack = list(states)
+        closed = set(states)
+        while stack:
+            state = stack.pop()
+            for target in self.epsilon[state]:
+                if target not in closed:
+                    closed.add(target)
+                    stack.append(target)
+        return frozenset(closed)
+
+
+class ToolCallPattern:
+    """A tool call pattern compiled into a DFA.
+
+    Tool names that do not appear in the pattern share a single "other" symbol,
+    so the transition table size depends only on the pattern.
+
+    Use compile_tool_call_pattern() to reuse compiled patterns across tasks.
+    """
+
+    def __init__(self, pattern: str):
+        """Parse and compile a pattern.
+
+        Args:
+            pattern: Pattern string (see module docstring for grammar)
+
+        Raises:
+            ToolCallPatternError: If the pattern is malformed
+        """
+        self.pattern = pattern
+        ast = _Parser(pattern).parse()
+
+        names: Set[str] = set()
+        _collect_names(ast, names)
+        # Symbol ids: named tools first, the last id is reserved for any other tool
+        self._symbol_ids: Dict[str, int] = {name: i for i, name in enumerate(sorted(names))}
+        self._other_symbol = len(self._symbol_ids)
+        alphabet_size = self._other_symbol + 1
+
+        nfa = _Nfa(alphabet_size)
+        nfa_start, nfa_accept = nfa.build(ast, self._symbol_ids)
+
+        # Subset construction
+        self._transitions: List[List[int]] = []
+        self._accepting: List[bool] = []
+        dfa_ids: Dict[FrozenSet[int], int] = {}
+
+        def dfa_state(state_set: FrozenSet[int]) -> int:
+            if state_set not in dfa_ids:
+                dfa_ids[state_set] = len(self._transitions)
+                self._transitions.append([-1] * alphabet_size)
+                self._accepting.append(nfa_accept in state_set)
+                pending.append(state_set)
+            return dfa_ids[state_set]
+
+        pending: List[FrozenSet[int]] = []
+        dfa_state(nfa.closure({nfa_start}))
+
+        while pending:
+            state_set = pending.pop()
+            row = self._transitions[dfa_ids[state_set]]
+            for symbol in range(alphabet_size):
+                targets: Set[int] = set()
+                for state in state_set:
+                    targets |= nfa.moves[state].get(symbol, set())
+                if targets:
+                    row[symbol] = dfa_state(nfa.closure(targets))
+
+    @property
+    def state_count(self) -> int:
+        """Return the number of DFA states."""
+        return len(self._transitions)
+
+    def find_mismatch(self, tool_names: Sequence[str]) -> Optional[int]:
+        """Run the DFA over a tool call sequence.
+
+        Args:
+            tool_names: Called tool names, in order
+
+        Returns:
+            None if the sequence matches. Otherwise the index of the first call the
+            pattern cannot accept, or len(tool_names) if the sequence ended early.
+        """
+        state = 0
+        for index, name in enumerate(tool_names):
+            state = self._transitions[state][self._symbol_ids.get(name, self._other_symbol)]
+            if state < 0:
+                return index
+        return None if self._accepting[state] else len(tool_names)
+
+    def matches(self, tool_names: Sequence[str]) -> bool:
+        """Return True if the whole sequence matches the pattern."""
+        return self.find_mismatch(tool_names) is None
+
+    def __repr__(self) -> str:
+        """Return string representation of the pattern."""
+        return f'ToolCallPattern({self.pattern!r})'
+
+
+@lru_cache(maxsize=256)
+def compile_tool_call_pattern(pattern: str) -> ToolCallPattern:
+    """Compile a pattern, reusing the DFA for identical pattern strings."""
+    return ToolCallPattern(pattern)
@@ -0,0 +1,126 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Optional OpenTelemetry tracing of the eval pipeline.
+
+Tasks, agent turns, model calls, tool calls, captors and validators each get a span,
+so a trace shows where a task's time goes (model, MCP tool, git, build or judge).
+
+Tracing is off unless MCP_EVAL_TRACING is set:
+- 'otlp': export over OTLP (configured with the standard OTEL_EXPORTER_OTLP_* variables)
+- 'file': append one JSON span per line to MCP_EVAL_TRACE_FILE
+
+Requires opentelemetry-sdk (and opentelemetry-exporter-otlp for 'otlp'). When tracing
+is off or the packages are missing, spans are no-ops.
+"""
+
+import contextlib
+from loguru import logger
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+
+SERVICE_NAME = 'mcp-evals'
+
+_tracer = None
+
+
+class _NoOpSpan:
+    """Span stand-in used when tracing is disabled."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        pass
+
+
+class _NoOpTracer:
+    """Tracer stand-in used when tracing is disabled."""
+
+    @contextlib.contextmanager
+    def start_as_current_span(self, name: str, **kwargs) -> Iterator[_NoOpSpan]:
+        yield _NoOpSpan()
+
+
+def get_tracer():
+    """Return the eval tracer, configuring OpenTelemetry on first use."""
+    global _tracer
+    if _tracer is None:
+        _tracer = _create_tracer()
+    return _tracer
+
+
+@contextlib.contextmanager
+def trace_span(name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+    """Run the enclosed block in a span (exceptions are recorded on the span).
+
+    Args:
+        name: Span name (e.g., 'eval.task')
+        attributes: Initial span attributes (None values are skipped)
+
+    Yields:
+        The span, for attributes known only at the end (e.g., outcome)
+    """
+    with get_tracer().start_as_current_span(name) as span:
+        if attributes:
+            span.set_attributes({k: v for k, v in attributes.items() if v is not None})
+        yield span
+
+
+def _create_tracer():
+    from .eval_config import TRACE_FILE, TRACING
+
+    if not TRACING:
+        return _NoOpTracer()
+
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+    except ImportError:
+        logger.warning(
+            f"MCP_EVAL_TRACING='{TRACING}' requires opentelemetry-sdk; tracing disabled"
+        )
+        return _NoOpTracer()
+
+    if TRACING == 'otlp':
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        except ImportError:
+            try:
+                from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+                    OTLPSpanExporter,
+                )
+            except ImportError:
+                logger.warning(
+                    "MCP_EVAL_TRACING='otlp' requires opentelemetry-exporter-otlp; tracing disabled"
+                )
+                return _NoOpTracer()
+        exporter = OTLPSpanExporter()
+    elif TRACING == 'file':
+        Path(TRACE_FILE).parent.mkdir(parents=True, exist_ok=True)
+        trace_file = open(TRACE_FILE, 'a', encoding='utf-8')
+        exporter = ConsoleSpanExporter(
+            out=trace_file, formatter=lambda span: span.to_json(indent=None) + '\n'
+        )
+    else:
+        logger.warning(f"Unknown MCP_EVAL_TRACING '{TRACING}' (expected 'otlp' or 'file')")
+        return _NoOpTracer()
+
+    # Not registered globally, so tracing of the code under test is unaffected
+    provider = TracerProvider(resource=Resource.create({'service.name': SERVICE_NAME}))
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    logger.debug(f'Tracing eval pipeline via {TRACING}')
+    return provider.get_tracer(__name__)
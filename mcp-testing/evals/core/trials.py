@@ -0,0 +1,148 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Statistics over repeated trials of a task.
+
+A single agent run is a noisy pass/fail sample. Running a task K times gives a pass
+rate with a Wilson score confidence interval, plus latency and effort percentiles.
+Trials can stop early once the interval lies entirely above or below a threshold.
+"""
+
+import math
+import statistics
+from .task_result import TaskResult
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+
+DEFAULT_CONFIDENCE = 0.95
+
+
+def wilson_interval(
+    successes: int, trials: int, confidence: float = DEFAULT_CONFIDENCE
+) -> Tuple[float, float]:
+    """Return the Wilson score interval for a binomial pass rate.
+
+    Args:
+        successes: Number of passing trials
+        trials: Number of trials
+        confidence: Two-sided confidence level (e.g., 0.95)
+
+    Returns:
+        Tuple of (lower bound, upper bound); (0.0, 1.0) if there are no trials
+    """
+    if trials == 0:
+        return 0.0, 1.0
+    z = statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    center = (p + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def is_decided(
+    successes: int, trials: int, threshold: float, confidence: float = DEFAULT_CONFIDENCE
+) -> bool:
+    """Return True if the pass rate interval no longer contains the threshold."""
+    low, high = wilson_interval(successes, trials, confidence)
+    return low > threshold or high < threshold
+
+
+def percentile(values: Sequence[float], q: float) -> Optional[float]:
+    """Return the q-th percentile (0-100) with linear interpolation, or None if empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+@dataclass
+class TrialSummary:
+    """Aggregated results of repeated trials of one task."""
+
+    task_id: str
+    trials: int
+    passes: int
+    errors: int
+    pass_rate: float
+    ci_low: float
+    ci_high: float
+    duration_p50: Optional[float]
+    duration_p95: Optional[float]
+    mean_turns: Optional[float]
+    mean_tool_calls: Optional[float]
+    stopped_early: bool = False
+
+    @classmethod
+    def from_results(
+        cls,
+        task_id: str,
+        results: List[TaskResult],
+        confidence: float = DEFAULT_CONFIDENCE,
+        stopped_early: bool = False,
+    ) -> 'TrialSummary':
+        """Summarize the trial results of a task.
+
+        Args:
+            task_id: ID of the task
+            results: One TaskResult per trial (errors count as failures)
+            confidence: Confidence level for the pass rate interval
+            stopped_early: Whether trials stopped before the requested count
+
+        Returns:
+            TrialSummary instance
+        """
+        passes = sum(1 for r in results if r.success)
+        metrics = [r.metrics for r in results if r.metrics]
+        durations = [m['task_duration'] for m in metrics if 'task_duration' in m]
+        turns = [m['turn_count'] for m in metrics if 'turn_count' in m]
+        tool_calls = [m['tool_call_count'] for m in metrics if 'tool_call_count' in m]
+        ci_low, ci_high = wilson_interval(passes, len(results), confidence)
+
+        return cls(
+            task_id=task_id,
+            trials=len(results),
+            passes=passes,
+            errors=sum(1 for r in results if r.error),
+            pass_rate=passes / len(results) if results else 0.0,
+            ci_low=ci_low,
+            ci_high=ci_high,
+            duration_p50=percentile(durations, 50),
+            duration_p95=percentile(durations, 95),
+            mean_turns=statistics.fmean(turns) if turns else None,
+            mean_tool_calls=statistics.fmean(tool_calls) if tool_calls else None,
+            stopped_early=stopped_early,
+        )
+
+    def __str__(self) -> str:
+        """Format summary as a single report line."""
+
+        def fmt(value: Optional[float], spec: str) -> str:
+            return '-' if value is None else format(value, spec)
+
+        line = (
+            f'{self.task_id}: {self.passes}/{self.trials} passed '
+            f'({self.pass_rate:.0%}, CI {self.ci_low:.0%}-{self.ci_high:.0%}), '
+            f'duration p50 {fmt(self.duration_p50, ".1f")}s p95 {fmt(self.duration_p95, ".1f")}s, '
+            f'turns {fmt(self.mean_turns, ".1f")}, tool calls {fmt(self.mean_tool_calls, ".1f")}'
+        )
+        if self.errors:
+            line += f', {self.errors} error(s)'
+        if self.stopped_early:
+            line += ' [stopped early]'
+        return line
@@ -15,7 +15,11 @@
 """Validators for evaluating agent outputs."""
 
 import asyncio
+import os
+import tempfile
 import time
+from .build_cache import BuildResultCache, get_default_build_cache
+from .build_sandbox import BuildSandbox, get_default_build_sandbox
 from .captor import (
     CONTENT_TEXT,
     FINAL_RESPONSE,
@@ -27,11 +31,14 @@ from .captor import (
 )
 from .file_tools import PERMITTED_FILE_TOOLS
 from .llm_provider import LLMProvider
+from .output_capture import StreamingOutputCapture
+from .process_executor import kill_process_group
+from .tool_call_pattern import compile_tool_call_pattern
 from .validation_prompts import ValidationPromptType
 from abc import ABC, abstractmethod
 from loguru import logger
 from pathlib import Path
-from typing import Any, Dict, List, Literal, TypedDict
+from typing import Any, Dict, List, Literal, Optional, Tuple, TypedDict
 
 
 class CriterionResult(TypedDict):
@@ -131,12 +138,12 @@ class LLMJudgeValidator(Validator):
         )
 
         try:
-            start = time.time()
-            response = self.llm_provider.converse(
+            start = time.perf_counter()
+            response = await self.llm_provider.converse_async(
                 messages=[{MESSAGE_ROLE: ROLE_USER, MESSAGE_CONTENT: [{CONTENT_TEXT: prompt}]}]
             )
             response_text = response['output']['message'][MESSAGE_CONTENT][0][CONTENT_TEXT]
-            elapsed = time.time() - start
+            elapsed = time.perf_counter() - start
             logger.debug(f'LLM validation took {elapsed:.2f}s')
 
             criteria_results = self._parse_llm_response(response_text, self.rubric)
@@ -316,6 +323,83 @@ class ToolCallValidator(Validator):
             }
 
 
+class ToolCallPatternValidator(Validator):
+    """Validator that checks tool calls against a regex-like pattern over tool names.
+
+    Use instead of ToolCallValidator when many orderings are acceptable. See
+    tool_call_pattern.py for the pattern grammar.
+    """
+
+    def __init__(self, expected_pattern: str, ignore_file_tools: bool = False):
+        """Initialize tool call pattern validator.
+
+        Args:
+            expected_pattern: Pattern the full tool call sequence must match
+                              (e.g., 'list_slos audit_slos? get_slo audit_slos')
+            ignore_file_tools: If True, filter out file-related tools before validation
+
+        Raises:
+            ToolCallPatternError: If the pattern is malformed
+        """
+        self.expected_pattern = expected_pattern
+        self.ignore_file_tools = ignore_file_tools
+        self.compiled_pattern = compile_tool_call_pattern(expected_pattern)
+
+    def get_name(self) -> str:
+        """Return validator name."""
+        return 'Tool Call Pattern'
+
+    async def validate(
+        self,
+        captured_data: Dict[str, Any],
+    ) -> ValidationResult:
+        """Validate tool calls match the expected pattern."""
+        logger.info('Validating tool calls against pattern...')
+
+        tool_calls = captured_data.get(TOOL_CALLS, [])
+        called_tools = [call['name'] for call in tool_calls]
+
+        if self.ignore_file_tools:
+            called_tools = [tool for tool in called_tools if tool not in PERMITTED_FILE_TOOLS]
+
+        mismatch_index = self.compiled_pattern.find_mismatch(called_tools)
+        called_str = f'[{" → ".join(called_tools)}]'
+
+        if mismatch_index is None:
+            status = 'PASS'
+            reasoning = f'Matched pattern {self.expected_pattern!r}: {called_str}'
+        elif mismatch_index < len(called_tools):
+            status = 'FAIL'
+            reasoning = (
+                f'Expected pattern {self.expected_pattern!r}, got: {called_str}. '
+                f"Unexpected call #{mismatch_index + 1}: '{called_tools[mismatch_index]}'"
+            )
+        else:
+            status = 'FAIL'
+            reasoning = (
+                f'Expected pattern {self.expected_pattern!r}, got: {called_str}. '
+                'Sequence ended before the pattern was complete'
+            )
+
+        return {
+            'validator_name': self.get_name(),
+            'overall_pass': mismatch_index is None,
+            'criteria_results': [
+                {
+                    'criterion': 'Tools called in expected pattern',
+                    'status': status,
+                    'reasoning': reasoning,
+                }
+            ],
+            'raw_validation_output': {
+                'expected_pattern': self.expected_pattern,
+                'called_tools': called_tools,
+                'mismatch_index': mismatch_index,
+                'ignore_file_tools': self.ignore_file_tools,
+            },
+        }
+
+
 class ToolPresenceValidator(Validator):
     """Validator that checks if specific tools were called, regardless of order and other tools being called."""
 
@@ -395,13 +479,25 @@ class ToolPresenceValidator(Validator):
 
 
 class BuildValidator(Validator):
-    """Validator that runs build commands and checks exit code."""
+    """Validator that runs build commands and checks exit code.
+
+    Successful results are cached on (command, hash of files under working_dir), so a
+    build of identical agent output is skipped (see build_cache.py). Failures are not
+    cached, since they may come from transient dependency download or network errors.
+    Builds that do run use shared dependency caches (see build_sandbox.py).
+    """
 
     def __init__(
         self,
         command: str,
         working_dir: Path,
         timeout: int = 120,
+        use_cache: bool = True,
+        cache: Optional[BuildResultCache] = None,
+        use_sandbox: bool = True,
+        sandbox: Optional[BuildSandbox] = None,
+        log_dir: Optional[Path] = None,
+        max_log_files: Optional[int] = None,
     ):
         """Initialize build validator.
 
@@ -409,10 +505,29 @@ class BuildValidator(Validator):
             command: Build command to execute
             working_dir: Directory to run command in
             timeout: Command timeout in seconds
+            use_cache: If False, always run the build
+            cache: BuildResultCache to use (default: process-wide cache from eval_config)
+            use_sandbox: If False, build with the inherited environment and no warm dependencies
+            sandbox: BuildSandbox to use (default: process-wide sandbox from eval_config)
+            log_dir: Directory for full build logs (default: BUILD_LOG_DIR from eval_config)
+            max_log_files: Number of most recent logs kept in log_dir
+                           (default: BUILD_LOG_MAX_FILES from eval_config)
         """
+        from .eval_config import BUILD_LOG_DIR, BUILD_LOG_MAX_FILES
+
         self.command = command
         self.working_dir = working_dir
         self.timeout = timeout
+        self.log_dir = log_dir if log_dir is not None else Path(BUILD_LOG_DIR)
+        self.max_log_files = max_log_files if max_log_files is not None else BUILD_LOG_MAX_FILES
+        if not use_cache:
+            self.cache = None
+        else:
+            self.cache = cache if cache is not None else get_default_build_cache()
+        if not use_sandbox:
+            self.sandbox = None
+        else:
+            self.sandbox = sandbox if sandbox is not None else get_default_build_sandbox()
 
     def get_name(self) -> str:
         """Return validator name."""
@@ -422,63 +537,33 @@ class BuildValidator(Validator):
         self,
         captured_data: Dict[str, Any],
     ) -> ValidationResult:
-        """Validate by running build command."""
-        logger.info(f'Running build command: {self.command}')
+        """Validate by running build command (or reusing a cached result)."""
         try:
-            process = await asyncio.create_subprocess_shell(
-                self.command,
-                cwd=self.working_dir,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-
-            try:
-                stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                    process.communicate(), timeout=self.timeout
-                )
-                stdout = stdout_bytes.decode('utf-8', errors='replace')
-                stderr = stderr_bytes.decode('utf-8', errors='replace')
-                exit_code = process.returncode
-            except asyncio.TimeoutError:
-                process.kill()
-                await process.wait()
-                raise TimeoutError(f'Build command timed out after {self.timeout} seconds')
-
-            result = {
-                'exit_code': exit_code,
-                'stdout': stdout,
-                'stderr': stderr,
-                'success': exit_code == 0,
-            }
-
-            if result['success']:
-                logger.info('✓ Build succeeded')
-                return {
-                    'validator_name': self.get_name(),
-                    'overall_pass': True,
-                    'criteria_results': [
-                        {
-                            'criterion': 'Build succeeds',
-                            'status': 'PASS',
-                            'reasoning': 'Build completed with exit code 0',
-                        }
-                    ],
-                    'raw_validation_output': result,
-                }
-            else:
-                logger.error(f'✗ Build failed with exit code {exit_code}')
-                return {
-                    'validator_name': self.get_name(),
-                    'overall_pass': False,
-                    'criteria_results': [
-                        {
-                            'criterion': 'Build succeeds',
-                            'status': 'FAIL',
-                            'reasoning': f'Build failed with exit code {exit_code}',
-                        }
-                    ],
-                    'raw_validation_output': result,
-                }
+            cache_key = await self._get_cache_key()
+            if cache_key is not None:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    logger.info(f'Using cached result for build command: {self.command}')
+                    return self._to_validation_result({**cached, 'cached': True})
+
+            env, node_projects = await self._prepare_sandbox()
+            logger.info(f'Running build command: {self.command}')
+            result = await self._run_build(env)
+
+            if result['success'] and node_projects is not None:
+                try:
+                    await asyncio.to_thread(self.sandbox.save, self.working_dir, node_projects)
+                except Exception as e:
+                    logger.warning(f'Failed to save warm build dependencies: {e}')
+
+            if result['success'] and cache_key is not None:
+                try:
+                    # The log file is temporary, so cached results keep only the excerpts
+                    self.cache.put(cache_key, {**result, 'log_path': None})
+                except Exception as e:
+                    logger.warning(f'Failed to cache build result: {e}')
+
+            return self._to_validation_result(result)
         except Exception as e:
             logger.error(f'Build validation error: {e}')
             return {
@@ -499,3 +584,134 @@ class BuildValidator(Validator):
                     'success': False,
                 },
             }
+
+    async def _get_cache_key(self) -> Optional[str]:
+        """Hash the working directory before the build modifies it."""
+        if self.cache is None:
+            return None
+        try:
+            return await asyncio.to_thread(self.cache.make_key, self.command, self.working_dir)
+        except Exception as e:
+            logger.warning(f'Build cache disabled for this run: {e}')
+            return None
+
+    async def _prepare_sandbox(
+        self,
+    ) -> Tuple[Optional[Dict[str, str]], Optional[List[Tuple[Path, str]]]]:
+        """Restore warm dependencies before the build.
+
+        Returns:
+            Build environment (None to inherit) and the Node.js projects found before
+            the build (None without a sandbox), for saving warm dependencies afterwards
+        """
+        if self.sandbox is None:
+            return None, None
+        try:
+            node_projects = await asyncio.to_thread(
+                self.sandbox.find_node_projects, self.working_dir
+            )
+            env = await asyncio.to_thread(self.sandbox.prepare, self.working_dir, node_projects)
+            return env, node_projects
+        except Exception as e:
+            logger.warning(f'Building without dependency caches: {e}')
+            return None, None
+
+    async def _run_build(self, env: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Run the build command and return exit code and bounded output excerpts.
+
+        The full output is spooled to a log file, which is kept only if the excerpts
+        had to be truncated or the build timed out (its path is returned as 'log_path').
+        Only the max_log_files most recent logs are kept. The build runs in its own
+        session, so a timeout kills the whole process tree (npm, gradle, ...), not just
+        the shell.
+        """
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        fd, log_name = tempfile.mkstemp(dir=self.log_dir, prefix='build_', suffix='.log')
+        os.close(fd)
+        log_path = Path(log_name)
+        capture = StreamingOutputCapture(log_path)
+
+        try:
+            process = await asyncio.create_subprocess_shell(
+                self.command,
+                cwd=self.working_dir,
+                env=env,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True,
+            )
+            try:
+                exit_code = await asyncio.wait_for(
+                    capture.communicate(process), timeout=self.timeout
+                )
+            except asyncio.TimeoutError:
+                kill_process_group(process)
+                await process.wait()
+                _prune_logs(self.log_dir, self.max_log_files)
+                raise TimeoutError(
+                    f'Build command timed out after {self.timeout} seconds (output: {log_path})'
+                )
+            except asyncio.CancelledError:
+                kill_process_group(process)
+                raise
+        finally:
+            capture.close()
+
+        truncated = capture.truncated
+        if truncated:
+            _prune_logs(self.log_dir, self.max_log_files)
+        else:
+            log_path.unlink()
+        return {
+            'exit_code': exit_code,
+            'stdout': capture.stdout.text(log_path),
+            'stderr': capture.stderr.text(log_path),
+            'success': exit_code == 0,
+            'output_bytes': capture.stdout.total_bytes + capture.stderr.total_bytes,
+            'log_path': str(log_path) if truncated else None,
+        }
+
+    def _to_validation_result(self, result: Dict[str, Any]) -> ValidationResult:
+        """Convert a build result into a ValidationResult."""
+        exit_code = result['exit_code']
+        if result['success']:
+            logger.info('✓ Build succeeded')
+            return {
+                'validator_name': self.get_name(),
+                'overall_pass': True,
+                'criteria_results': [
+                    {
+                        'criterion': 'Build succeeds',
+                        'status': 'PASS',
+                        'reasoning': 'Build completed with exit code 0',
+                    }
+                ],
+                'raw_validation_output': result,
+            }
+
+        logger.error(f'✗ Build failed with exit code {exit_code}')
+        return {
+            'validator_name': self.get_name(),
+            'overall_pass': False,
+            'criteria_results': [
+                {
+                    'criterion': 'Build succeeds',
+                    'status': 'FAIL',
+                    'reasoning': f'Build failed with exit code {exit_code}',
+                }
+            ],
+            'raw_validation_output': result,
+        }
+
+
+def _prune_logs(log_dir: Path, max_files: int) -> None:
+    """Delete all but the max_files most recently modified build logs in log_dir."""
+    try:
+        logs = sorted(log_dir.glob('build_*.log'), key=lambda path: path.stat().st_mtime_ns)
+    except OSError:
+        return
+    for path in logs[: max(len(logs) - max_files, 0)]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
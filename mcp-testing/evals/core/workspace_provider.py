@@ -0,0 +1,395 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Copy-on-write workspace provisioning.
+
+A template is built once per process from a source directory (optionally with its
+own git repository), then each task workspace is cloned from it file by file using
+the cheapest available method:
+
+1. reflink (FICLONE ioctl on btrfs/XFS): independent copy sharing data blocks
+2. hardlink: shares the inode; writers must call ensure_private_copy() first
+3. regular copy
+
+The file tools used by the agent call ensure_private_copy() before writing, so a
+write never modifies the template or other workspaces. Files under .git are always
+reflinked or copied, never hardlinked, because git rewrites its index in place.
+"""
+
+import atexit
+import os
+import shutil
+import tempfile
+import threading
+from .process_executor import ProcessExecutor, SubprocessExecutor
+from .workspace_snapshot import DEFAULT_EXCLUDED_DIRS, WorkspaceSnapshot
+from loguru import logger
+from pathlib import Path
+from typing import FrozenSet, List, Optional
+
+
+# Linux FICLONE ioctl request number (_IOW(0x94, 9, int))
+_FICLONE = 0x40049409
+
+CLONE_MODE_REFLINK = 'reflink'
+CLONE_MODE_HARDLINK = 'hardlink'
+CLONE_MODE_COPY = 'copy'
+
+# Directories whose files are never hardlinked (their tools rewrite files in place)
+PRIVATE_COPY_DIRS = frozenset({'.git'})
+
+
+def _reflink(src: str, dst: str) -> None:
+    import fcntl
+
+    with open(src, 'rb') as src_file, open(dst, 'wb') as dst_file:
+        fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+
+
+def ensure_private_copy(path: Path) -> None:
+    """Break a hardlink before a file is modified in place.
+
+    Does nothing if the file does not exist or is not shared.
+
+    Args:
+        path: File about to be written
+    """
+    try:
+        if os.stat(path).st_nlink <= 1:
+            return
+    except FileNotFoundError:
+        return
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.')
+    os.close(fd)
+    try:
+        shutil.copy2(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class FileCloner:
+    """Clones files with the first method that works, remembering the choice."""
+
+    def __init__(self, allow_hardlinks: bool = True, clone_mode: Optional[str] = None):
+        """Initialize cloner.
+
+        Args:
+            allow_hardlinks: If False, fall back from reflink straight to a full copy
+            clone_mode: Force 'reflink', 'hardlink' or 'copy' (default: best available)
+        """
+        self.allow_hardlinks = allow_hardlinks
+        self.mode = clone_mode
+        self._forced = clone_mode is not None
+
+    def clone_file(self, src: str, dst: str, allow_hardlink: bool = True) -> None:
+        """Clone a single file to a path that does not exist yet.
+
+        Args:
+            src: Source file
+            dst: Destination path
+            allow_hardlink: If False, copy instead of hardlinking (when reflink is unavailable)
+        """
+        mode = self.mode
+        if mode in (None, CLONE_MODE_REFLINK):
+            try:
+                _reflink(src, dst)
+                shutil.copystat(src, dst)
+                self.mode = CLONE_MODE_REFLINK
+                return
+            except (OSError, ImportError):
+                if self._forced:
+                    raise
+                if os.path.exists(dst):
+                    os.unlink(dst)
+        if allow_hardlink and (
+            mode == CLONE_MODE_HARDLINK
+            or (mode in (None, CLONE_MODE_REFLINK) and self.allow_hardlinks and not self._forced)
+        ):
+            try:
+                os.link(src, dst)
+                self.mode = CLONE_MODE_HARDLINK
+                return
+            except OSError:
+                if self._forced:
+                    raise
+        shutil.copy2(src, dst)
+        if allow_hardlink:
+            self.mode = CLONE_MODE_COPY
+
+    def clone_tree(self, src_root: Path, dst_root: Path) -> None:
+        """Clone a directory tree into dst_root, recreating symlinks as symlinks.
+
+        Files under PRIVATE_COPY_DIRS (e.g., .git) are never hardlinked.
+        """
+        for dir_path, dir_names, file_names in os.walk(src_root):
+            rel_dir = os.path.relpath(dir_path, src_root)
+            dst_dir = Path(dst_root) if rel_dir == '.' else Path(dst_root) / rel_dir
+            private = not PRIVATE_COPY_DIRS.isdisjoint(Path(rel_dir).parts)
+            dst_dir.mkdir(parents=True, exist_ok=True)
+
+            for name in dir_names:
+                src = os.path.join(dir_path, name)
+                if os.path.islink(src):
+                    os.symlink(os.readlink(src), dst_dir / name)
+            dir_names[:] = [d for d in dir_names if not os.path.islink(os.path.join(dir_path, d))]
+
+            for name in file_names:
+                src = os.path.join(dir_path, name)
+                dst = str(dst_dir / name)
+                if os.path.islink(src):
+                    os.symlink(os.readlink(src), dst)
+                else:
+                    self.clone_file(src, dst, allow_hardlink=not private)
+
+
+class TemplateWorkspaceProvider:
+    """Provisions task workspaces from a template built once per process.
+
+    Thread-safe. The template directory is removed when the process exits.
+    """
+
+    def __init__(
+        self,
+        source_dir: Path,
+        init_git: bool = False,
+        excluded_dirs: FrozenSet[str] = DEFAULT_EXCLUDED_DIRS,
+        allow_hardlinks: bool = True,
+        clone_mode: Optional[str] = None,
+        process_executor: Optional[ProcessExecutor] = None,
+    ):
+        """Initialize provider. The template is built lazily on first use.
+
+        Args:
+            source_dir: Directory whose contents make up the template
+            init_git: If True, initialize and commit a git repository in the template
+                      so every workspace is a git repository without running git per task
+            excluded_dirs: Directory names left out of the template and its snapshot
+                           (e.g., dependency and build output directories)
+            allow_hardlinks: Set to False if tools other than the agent's file tools (e.g., builds)
+                             may modify files in place, so reflink falls back to a full copy
+            clone_mode: Force 'reflink', 'hardlink' or 'copy' (default: best available)
+            process_executor: ProcessExecutor for git commands (default: SubprocessExecutor)
+        """
+        self.source_dir = Path(source_dir)
+        self.init_git = init_git
+        self.excluded_dirs = excluded_dirs
+        self.allow_hardlinks = allow_hardlinks
+        self.process_executor = (
+            process_executor if process_executor is not None else SubprocessExecutor()
+        )
+        self._cloner = FileCloner(allow_hardlinks=allow_hardlinks, clone_mode=clone_mode)
+        self._template_dir: Optional[Path] = None
+        self._snapshot: Optional[WorkspaceSnapshot] = None
+        self._lock = threading.Lock()
+
+    @property
+    def template_dir(self) -> Path:
+        """Return the template directory, building it on first access."""
+        self._ensure_template()
+        return self._template_dir
+
+    @property
+    def snapshot(self) -> WorkspaceSnapshot:
+        """Return a snapshot of the template.
+
+        Cloned files keep the template's size and mtime, so this snapshot can diff any
+        provisioned workspace (pass the workspace as root) without re-hashing unchanged files.
+        """
+        self._ensure_template()
+        return self._snapshot
+
+    def populate(self, workspace: Path) -> WorkspaceSnapshot:
+        """Clone the template into an existing (typically empty) directory.
+
+        Args:
+            workspace: Destination directory
+
+        Returns:
+            Snapshot of the template, valid for diffing the workspace
+        """
+        self._ensure_template()
+        self._cloner.clone_tree(self._template_dir, Path(workspace))
+        return self._snapshot
+
+    def provision(self) -> Path:
+        """Create a new temporary workspace cloned from the template.
+
+        Returns:
+            Path to the new workspace (remove with release())
+        """
+        workspace = Path(tempfile.mkdtemp(prefix='mcp_eval_workspace_'))
+        self.populate(workspace)
+        return workspace
+
+    def release(self, workspace: Path) -> None:
+        """Delete a workspace created by provision()."""
+        shutil.rmtree(workspace, ignore_errors=True)
+
+    def _ensure_template(self) -> None:
+        with self._lock:
+            if self._template_dir is not None:
+                return
+
+            template_dir = Path(tempfile.mkdtemp(prefix='mcp_eval_template_'))
+            atexit.register(shutil.rmtree, template_dir, ignore_errors=True)
+            shutil.copytree(
+                self.source_dir,
+                template_dir,
+                symlinks=True,
+                dirs_exist_ok=True,
+                ignore=shutil.ignore_patterns(*self.excluded_dirs),
+            )
+            self._check_tracked_files(template_dir)
+
+            if self.init_git:
+                cwd = str(template_dir)
+                self.process_executor.run(['git', 'init', '-q'], cwd=cwd)
+                self.process_executor.run(['git', 'add', '.'], cwd=cwd)
+                self.process_executor.run(
+                    [
+                        'git',
+                        '-c',
+                        'user.name=mcp-evals',
+                        '-c',
+                        'user.email=mcp-evals@localhost',
+                        'commit',
+                        '-q',
+                        '-m',
+                        'Initial commit',
+                    ],
+                    cwd=cwd,
+                )
+
+            self._snapshot = WorkspaceSnapshot.capture(
+                template_dir, excluded_dirs=self.excluded_dirs
+            )
+            self._template_dir = template_dir
+            logger.debug(f'Built workspace template from {self.source_dir} at {template_dir}')
+
+    def _check_tracked_files(self, template_dir: Path) -> None:
+        """Raise if excluded_dirs left out files that git tracks in the source directory.
+
+        Skipped when the source directory is not in a git repository.
+        """
+        result = self.process_executor.run(
+            ['git', 'ls-files', '-z', '--cached'], cwd=str(self.source_dir)
+        )
+        if result.returncode != 0:
+            return
+        missing = [
+            rel_path
+            for rel_path in result.stdout.split('\0')
+            if rel_path
+            and (self.source_dir / rel_path).is_file()
+            and not (template_dir / rel_path).is_file()
+        ]
+        if missing:
+            raise ValueError(
+                f'Workspace template of {self.source_dir} is missing {len(missing)} '
+                f'git-tracked files (excluded_dirs={sorted(self.excluded_dirs)}): '
+                f'{", ".join(missing[:5])}'
+            )
+
+    def restore(self, workspace: Path, rel_paths: List[str]) -> None:
+        """Reset files in a workspace to their template state.
+
+        Files missing from the template are deleted; others are cloned again.
+
+        Args:
+            workspace: Workspace created from this template
+            rel_paths: Relative paths of files to restore
+        """
+        self._ensure_template()
+        for rel_path in rel_paths:
+            target = workspace / rel_path
+            if target.exists() or target.is_symlink():
+                target.unlink()
+            source = self._template_dir / rel_path
+            if source.is_file():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                self._cloner.clone_file(str(source), str(target))
+            else:
+                _remove_empty_parents(target.parent, workspace)
+
+
+def _remove_empty_parents(directory: Path, stop_at: Path) -> None:
+    """Remove empty directories from directory up to (excluding) stop_at."""
+    while directory != stop_at and stop_at in directory.parents:
+        try:
+            directory.rmdir()
+        except OSError:
+            return
+        directory = directory.parent
+
+
+class WorkspacePool:
+    """Pool of workspaces cloned from a template, recycled between tasks.
+
+    Released workspaces are reset by restoring only the files that changed since they
+    were cloned, so recycling costs O(changed files) rather than a full clone.
+    """
+
+    def __init__(self, provider: TemplateWorkspaceProvider, max_idle: int = 8):
+        """Initialize pool.
+
+        Args:
+            provider: Provider used to create new workspaces
+            max_idle: Maximum number of idle workspaces kept for reuse
+        """
+        self.provider = provider
+        self.max_idle = max_idle
+        self._idle: List[Path] = []
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def prefill(self, count: int) -> None:
+        """Create workspaces ahead of time so the first tasks do not pay for cloning."""
+        with self._lock:
+            missing = min(count, self.max_idle) - len(self._idle)
+        for _ in range(max(missing, 0)):
+            workspace = self.provider.provision()
+            with self._lock:
+                self._idle.append(workspace)
+
+    def acquire(self) -> Path:
+        """Return a clean workspace, reusing an idle one when available."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self.provider.provision()
+
+    def release(self, workspace: Path) -> None:
+        """Reset a workspace and return it to the pool (or delete it if the pool is full)."""
+        with self._lock:
+            keep = len(self._idle) < self.max_idle
+        if keep:
+            try:
+                changes = self.provider.snapshot.changes(workspace)
+                self.provider.restore(workspace, changes.all_paths)
+                with self._lock:
+                    self._idle.append(workspace)
+                return
+            except Exception as e:
+                logger.warning(f'Failed to reset workspace {workspace}, discarding it: {e}')
+        self.provider.release(workspace)
+
+    def close(self) -> None:
+        """Delete all idle workspaces."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for workspace in idle:
+            self.provider.release(workspace)
@@ -0,0 +1,318 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""In-process workspace snapshots and unified diffs.
+
+A snapshot records a content hash for every file under the captured paths before
+the agent runs. Afterwards, only files whose size or mtime changed are re-read, and
+a git-style unified diff is produced for files that actually differ. This avoids
+spawning git and works on directories that are not git repositories.
+
+Unlike `git diff`, new (untracked) files are included in the diff.
+"""
+
+import difflib
+import hashlib
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+
+# Directories never included in snapshots
+DEFAULT_EXCLUDED_DIRS = frozenset({'.git'})
+
+# Dependency and build output directories, typically git-ignored in sample apps.
+# Names that sample apps also use for sources (e.g., 'bin' for CDK entry points) are
+# not listed, since every directory with a listed name is excluded.
+DEPENDENCY_AND_BUILD_DIRS = DEFAULT_EXCLUDED_DIRS | frozenset(
+    {
+        '.gradle',
+        '.terraform',
+        '__pycache__',
+        'build',
+        'cdk.out',
+        'node_modules',
+        'obj',
+        'target',
+    }
+)
+
+# Files larger than this are hashed but their content is not retained for diffing
+DEFAULT_MAX_DIFF_FILE_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class FileState:
+    """Recorded state of a single file."""
+
+    size: int
+    mtime_ns: int
+    digest: str
+
+
+@dataclass(frozen=True)
+class WorkspaceChanges:
+    """Relative paths of files that changed since a snapshot was captured."""
+
+    added: List[str]
+    modified: List[str]
+    deleted: List[str]
+
+    def __bool__(self) -> bool:
+        """Return True if anything changed."""
+        return bool(self.added or self.modified or self.deleted)
+
+    @property
+    def all_paths(self) -> List[str]:
+        """Return every changed path, sorted."""
+        return sorted(self.added + self.modified + self.deleted)
+
+
+def _hash_bytes(content: bytes) -> str:
+    return hashlib.blake2b(content, digest_size=20).hexdigest()
+
+
+class WorkspaceSnapshot:
+    """Content-hashed snapshot of files under a workspace root."""
+
+    def __init__(
+        self,
+        root: Path,
+        paths: Optional[List[str]],
+        files: Dict[str, FileState],
+        blobs: Dict[str, bytes],
+        captured_at_ns: int,
+        excluded_dirs: FrozenSet[str] = DEFAULT_EXCLUDED_DIRS,
+        max_diff_file_size: int = DEFAULT_MAX_DIFF_FILE_SIZE,
+    ):
+        """Initialize snapshot. Use WorkspaceSnapshot.capture() to create one."""
+        self.root = root
+        self.paths = paths
+        self.files = files
+        self._blobs = blobs
+        self._captured_at_ns = captured_at_ns
+        self.excluded_dirs = excluded_dirs
+        self.max_diff_file_size = max_diff_file_size
+
+    @classmethod
+    def capture(
+        cls,
+        root: Path,
+        paths: Optional[List[str]] = None,
+        excluded_dirs: FrozenSet[str] = DEFAULT_EXCLUDED_DIRS,
+        max_diff_file_size: int = DEFAULT_MAX_DIFF_FILE_SIZE,
+    ) -> 'WorkspaceSnapshot':
+        """Hash all files under root (or under the given relative paths).
+
+        Args:
+            root: Workspace root directory
+            paths: Paths relative to root to snapshot. If None or empty, snapshots all of root.
+            excluded_dirs: Directory names to skip (e.g., '.git', 'node_modules')
+            max_diff_file_size: Files larger than this can be detected as changed but not diffed
+
+        Returns:
+            WorkspaceSnapshot instance
+        """
+        captured_at_ns = time.time_ns()
+        files: Dict[str, FileState] = {}
+        blobs: Dict[str, bytes] = {}
+
+        for rel_path, full_path, stat in _walk(root, paths, excluded_dirs):
+            content = full_path.read_bytes()
+            digest = _hash_bytes(content)
+            files[rel_path] = FileState(stat.st_size, stat.st_mtime_ns, digest)
+            if len(content) <= max_diff_file_size:
+                blobs[digest] = content
+
+        return cls(
+            root=root,
+            paths=list(paths) if paths else None,
+            files=files,
+            blobs=blobs,
+            captured_at_ns=captured_at_ns,
+            excluded_dirs=excluded_dirs,
+            max_diff_file_size=max_diff_file_size,
+        )
+
+    @property
+    def digest(self) -> str:
+        """Return a single hash covering every file path and content in the snapshot."""
+        hasher = hashlib.blake2b(digest_size=20)
+        for rel_path in sorted(self.files):
+            hasher.update(rel_path.encode('utf-8'))
+            hasher.update(b'\0')
+            hasher.update(self.files[rel_path].digest.encode('ascii'))
+            hasher.update(b'\n')
+        return hasher.hexdigest()
+
+    def restrict(self, paths: Optional[List[str]]) -> 'WorkspaceSnapshot':
+        """Return a snapshot limited to files under the given relative paths.
+
+        Args:
+            paths: Paths relative to root. If None or empty, returns this snapshot.
+
+        Returns:
+            WorkspaceSnapshot sharing recorded content with this one
+        """
+        if not paths:
+            return self
+        prefixes = [Path(p).as_posix().rstrip('/') for p in paths]
+        files = {
+            rel_path: state
+            for rel_path, state in self.files.items()
+            if any(rel_path == prefix or rel_path.startswith(prefix + '/') for prefix in prefixes)
+        }
+        return WorkspaceSnapshot(
+            root=self.root,
+            paths=list(paths),
+            files=files,
+            blobs=self._blobs,
+            captured_at_ns=self._captured_at_ns,
+            excluded_dirs=self.excluded_dirs,
+            max_diff_file_size=self.max_diff_file_size,
+        )
+
+    def get_content(self, rel_path: str) -> Optional[bytes]:
+        """Return recorded content for a file, or None if unknown or too large."""
+        state = self.files.get(rel_path)
+        return self._blobs.get(state.digest) if state else None
+
+    def changes(self, root: Optional[Path] = None) -> WorkspaceChanges:
+        """Compare the snapshot against the current state of the workspace.
+
+        Files with unchanged size and mtime are not re-read.
+
+        Args:
+            root: Workspace to compare (default: the captured root). A different root
+                  can be used when it was provisioned from the captured one.
+
+        Returns:
+            WorkspaceChanges with sorted relative paths
+        """
+        changes, _ = self._compare(root or self.root, keep_content=False)
+        return changes
+
+    def diff(self, root: Optional[Path] = None) -> str:
+        """Return a git-style unified diff of all changes since the snapshot.
+
+        Args:
+            root: Workspace to compare (default: the captured root)
+
+        Returns:
+            Unified diff text (empty string if nothing changed)
+        """
+        changes, current_content = self._compare(root or self.root, keep_content=True)
+        sections = []
+        for rel_path in changes.all_paths:
+            old = None if rel_path in changes.added else self.get_content(rel_path)
+            new = None if rel_path in changes.deleted else current_content.get(rel_path)
+            sections.append(
+                _format_file_diff(
+                    rel_path,
+                    old,
+                    new,
+                    old_missing=rel_path in changes.added,
+                    new_missing=rel_path in changes.deleted,
+                )
+            )
+        return ''.join(sections)
+
+    def _compare(
+        self, root: Path, keep_content: bool
+    ) -> Tuple[WorkspaceChanges, Dict[str, bytes]]:
+        added, modified = [], []
+        current_content: Dict[str, bytes] = {}
+        seen = set()
+
+        for rel_path, full_path, stat in _walk(root, self.paths, self.excluded_dirs):
+            seen.add(rel_path)
+            state = self.files.get(rel_path)
+            if (
+                state is not None
+                and state.size == stat.st_size
+                and state.mtime_ns == stat.st_mtime_ns
+                # Files modified while the snapshot was taken may share an mtime with later writes
+                and state.mtime_ns < self._captured_at_ns
+            ):
+                continue
+
+            content = full_path.read_bytes()
+            if state is None:
+                added.append(rel_path)
+            elif _hash_bytes(content) != state.digest:
+                modified.append(rel_path)
+            else:
+                continue
+            if keep_content and len(content) <= self.max_diff_file_size:
+                current_content[rel_path] = content
+
+        deleted = [rel_path for rel_path in self.files if rel_path not in seen]
+        return WorkspaceChanges(sorted(added), sorted(modified), sorted(deleted)), current_content
+
+
+def _walk(
+    root: Path, paths: Optional[List[str]], excluded_dirs: FrozenSet[str]
+) -> Iterator[Tuple[str, Path, os.stat_result]]:
+    """Yield (relative posix path, full path, stat) for regular files under the paths."""
+    for start in [root / p for p in paths] if paths else [root]:
+        if start.is_file():
+            yield start.relative_to(root).as_posix(), start, start.stat()
+            continue
+        if not start.is_dir():
+            continue
+        for dir_path, dir_names, file_names in os.walk(start):
+            dir_names[:] = [d for d in dir_names if d not in excluded_dirs]
+            current = Path(dir_path)
+            for file_name in file_names:
+                full_path = current / file_name
+                if full_path.is_symlink() or not full_path.is_file():
+                    continue
+                yield full_path.relative_to(root).as_posix(), full_path, full_path.stat()
+
+
+def _format_file_diff(
+    rel_path: str,
+    old: Optional[bytes],
+    new: Optional[bytes],
+    old_missing: bool,
+    new_missing: bool,
+) -> str:
+    """Format one file's changes in `git diff` style."""
+    from_file = '/dev/null' if old_missing else f'a/{rel_path}'
+    to_file = '/dev/null' if new_missing else f'b/{rel_path}'
+    lines = [f'diff --git a/{rel_path} b/{rel_path}\n']
+    if old_missing:
+        lines.append('new file mode 100644\n')
+    elif new_missing:
+        lines.append('deleted file mode 100644\n')
+
+    old_bytes = b'' if old_missing else old
+    new_bytes = b'' if new_missing else new
+    if old_bytes is None or new_bytes is None:
+        lines.append(f'File {rel_path} changed but is too large to diff\n')
+        return ''.join(lines)
+    if b'\0' in old_bytes or b'\0' in new_bytes:
+        lines.append(f'Binary files {from_file} and {to_file} differ\n')
+        return ''.join(lines)
+
+    old_lines = old_bytes.decode('utf-8', errors='replace').splitlines(keepends=True)
+    new_lines = new_bytes.decode('utf-8', errors='replace').splitlines(keepends=True)
+    for line in difflib.unified_diff(old_lines, new_lines, fromfile=from_file, tofile=to_file):
+        if line.endswith('\n'):
+            lines.append(line)
+        else:
+            lines.append(line + '\n\\ No newline at end of file\n')
+    return ''.join(lines)
@@ -58,6 +58,10 @@ class ChangeEventTask(ApplicationSignalsTask):
         """No working directory needed for change event tasks."""
         return None
 
+    def allows_concurrent_runs(self) -> bool:
+        """Change event tasks do not modify files, so runs can overlap."""
+        return True
+
     def get_prompt(self, working_directory: Path) -> str:
         """Return task prompt."""
         return self.prompt
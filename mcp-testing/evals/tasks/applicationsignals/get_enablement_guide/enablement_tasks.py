@@ -18,15 +18,20 @@ Evaluates whether the AI agent can use the get_enablement_guide tool
 to enable Application Signals monitoring on various platforms.
 """
 
+import asyncio
 from evals.core import (
+    DEPENDENCY_AND_BUILD_DIRS,
     BuildValidator,
     Captor,
     GitDiffCaptor,
     LLMJudgeValidator,
+    TemplateWorkspaceProvider,
     ToolCallsCaptor,
     ToolResultsCaptor,
     ValidationPromptType,
     Validator,
+    WorkspacePool,
+    WorkspaceSnapshot,
 )
 from evals.tasks.applicationsignals import (
     SAMPLES_ROOT,
@@ -49,6 +54,22 @@ My application directory is: {app_abs_path}
 My AWS Region for Lambda + CDK is: "us-west-2"
 My AWS Region for Lambda + Terraform is: "us-east-1"""
 
+# Dependency and build output directories. They are left out of workspace templates, diffs
+# and resets, so pooled workspaces keep them warm between tasks. The template is checked
+# to contain every git-tracked sample file (e.g., the CDK entry points in bin/).
+ENABLEMENT_EXCLUDED_DIRS = DEPENDENCY_AND_BUILD_DIRS
+
+# Each task gets its own clone of the samples so tasks can run concurrently. Build commands
+# may rewrite files in place, so workspaces use reflinks or full copies but never hardlinks.
+_WORKSPACE_POOL = WorkspacePool(
+    TemplateWorkspaceProvider(
+        SAMPLES_ROOT / 'get-enablement-guide-samples',
+        excluded_dirs=ENABLEMENT_EXCLUDED_DIRS,
+        allow_hardlinks=False,
+    )
+)
+
+
 class EnablementTask(ApplicationSignalsTask):
     """Task for evaluating Application Signals enablement.
 
@@ -74,6 +95,7 @@ class EnablementTask(ApplicationSignalsTask):
         build_command: Optional[str] = None,
         build_working_dir: Optional[str] = None,
         modifies_code: bool = True,
+        isolated_workspace: bool = True,
     ):
         """Initialize EnablementTask.
 
@@ -91,6 +113,8 @@ class EnablementTask(ApplicationSignalsTask):
             build_command: Optional build command (e.g., 'npm install && npm run build')
             build_working_dir: Optional build working directory (relative to working_directory)
             modifies_code: Whether task modifies files (for cleanup)
+            isolated_workspace: If True, run in a pooled copy of the samples instead of the
+                                shared checkout (required for running tasks concurrently)
         """
         super().__init__(id=id)
         self.prompt_template = prompt_template
@@ -105,14 +129,26 @@ class EnablementTask(ApplicationSignalsTask):
         self.build_command = build_command
         self.build_working_dir = build_working_dir
         self.modifies_code = modifies_code
+        self.isolated_workspace = isolated_workspace
+        self.working_directory: Optional[Path] = None
+        self.workspace_snapshot: Optional[WorkspaceSnapshot] = None
 
     def get_working_directory(self):
-        """Return path to enablement guide samples directory.
+        """Return path to the enablement guide samples for this task.
 
         Returns:
-            Path to get-enablement-guide-samples directory
+            Path to an isolated copy of get-enablement-guide-samples, or to the shared
+            checkout if isolated_workspace is False
         """
-        return SAMPLES_ROOT / 'get-enablement-guide-samples'
+        if not self.isolated_workspace:
+            return SAMPLES_ROOT / 'get-enablement-guide-samples'
+        if self.working_directory is None:
+            self.working_directory = _WORKSPACE_POOL.acquire()
+        return self.working_directory
+
+    def allows_concurrent_runs(self) -> bool:
+        """Isolated workspaces come from a pool; the shared checkout allows one run at a time."""
+        return self.isolated_workspace
 
     def get_prompt(self, working_directory: Path) -> str:
         """Return enablement prompt with absolute paths.
@@ -151,7 +187,7 @@ class EnablementTask(ApplicationSignalsTask):
             List of captors
         """
         return [
-            GitDiffCaptor(git_paths=self.git_paths),
+            GitDiffCaptor(git_paths=self.git_paths, snapshot=self.workspace_snapshot),
             ToolCallsCaptor(),
             ToolResultsCaptor(),
         ]
@@ -189,34 +225,78 @@ class EnablementTask(ApplicationSignalsTask):
 
         return validators
 
+    def setup(self, working_directory: Path):
+        """Snapshot git_paths so the diff can be computed without git.
+
+        Args:
+            working_directory: Path to task working directory
+        """
+        if self.isolated_workspace:
+            # The pooled workspace matches the template, so its snapshot can be reused
+            self.workspace_snapshot = _WORKSPACE_POOL.provider.snapshot.restrict(self.git_paths)
+        else:
+            self.workspace_snapshot = WorkspaceSnapshot.capture(
+                working_directory, self.git_paths, excluded_dirs=ENABLEMENT_EXCLUDED_DIRS
+            )
+
     def cleanup(self, working_directory: Path):
-        """Clean up git changes made by enablement agent.
+        """Clean up changes made by enablement agent.
 
-        Resets git state for paths specified in git_paths.
+        Returns an isolated workspace to the pool (which resets it), or resets git
+        state in the shared checkout for paths specified in git_paths.
 
         Args:
             working_directory: Path to task working directory
         """
+        if self.isolated_workspace:
+            self._release_workspace(working_directory)
+            return
+
         if not self.git_paths:
             logger.warning('No git_paths specified to clean')
             return
 
         try:
-            for rel_path in self.git_paths:
-                full_path = str(working_directory / rel_path)
-                logger.debug(f'Cleaning path: {full_path}')
-                self.process_executor.run(
-                    ['git', 'checkout', 'HEAD', '--', full_path],
-                    timeout=10,
-                )
-                self.process_executor.run(
-                    ['git', 'clean', '-fd', full_path],
-                    timeout=10,
-                )
+            for command in self._git_reset_commands(working_directory):
+                self.process_executor.run(command, timeout=10)
+            logger.debug(f'Reset git state for: {", ".join(self.git_paths)}')
+        except Exception as e:
+            logger.warning(f'Failed to reset git state: {e}')
+
+    async def cleanup_async(self, working_directory: Path):
+        """Clean up changes made by enablement agent without blocking the event loop.
+
+        Args:
+            working_directory: Path to task working directory
+        """
+        if self.isolated_workspace:
+            await asyncio.to_thread(self._release_workspace, working_directory)
+            return
+
+        if not self.git_paths:
+            logger.warning('No git_paths specified to clean')
+            return
+
+        try:
+            for command in self._git_reset_commands(working_directory):
+                await self.process_executor.run_async(command, timeout=10)
             logger.debug(f'Reset git state for: {", ".join(self.git_paths)}')
         except Exception as e:
             logger.warning(f'Failed to reset git state: {e}')
 
+    def _release_workspace(self, working_directory: Path):
+        _WORKSPACE_POOL.release(working_directory)
+        self.working_directory = None
+
+    def _git_reset_commands(self, working_directory: Path) -> list[list[str]]:
+        commands = []
+        for rel_path in self.git_paths:
+            full_path = str(working_directory / rel_path)
+            logger.debug(f'Cleaning path: {full_path}')
+            commands.append(['git', 'checkout', 'HEAD', '--', full_path])
+            commands.append(['git', 'clean', '-fd', full_path])
+        return commands
+
 
 # Import task configurations after class definition to avoid circular import
 # TODO: Refactor
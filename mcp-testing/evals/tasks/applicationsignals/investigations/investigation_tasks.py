@@ -26,9 +26,12 @@ from evals.core import (
     GitDiffCaptor,
     LLMJudgeValidator,
     ToolCallsCaptor,
+    ToolCallPatternValidator,
     ToolCallValidator,
+    TemplateWorkspaceProvider,
     ValidationPromptType,
     Validator,
+    WorkspaceSnapshot,
 )
 from evals.tasks.applicationsignals import (
     SAMPLES_ROOT,
@@ -38,6 +41,13 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 
+# Shared by all investigation tasks: the sample (and its git repository) is built once per
+# process and each task workspace is a copy-on-write clone of it.
+_WORKSPACE_PROVIDER = TemplateWorkspaceProvider(
+    SAMPLES_ROOT / 'investigations-sample' / 'src', init_git=True
+)
+
+
 class InvestigationTask(ApplicationSignalsTask):
     """Task for evaluating AI agent investigation and root cause analysis capabilities."""
 
@@ -46,18 +56,33 @@ class InvestigationTask(ApplicationSignalsTask):
         id: str,
         prompt: str,
         validation_rubric: list[str],
-        expected_tool_calls: list[list[str]],
+        expected_tool_calls: Optional[list[list[str]]] = None,
+        expected_tool_pattern: Optional[str] = None,
         mock_config: Optional[Dict[str, Any]] = None,
         modifies_code: bool = True,
     ):
-        """Initialize investigation task."""
+        """Initialize investigation task.
+
+        Provide either expected_tool_calls (exact sequences) or expected_tool_pattern
+        (one pattern covering all allowed orderings, see evals.core.tool_call_pattern).
+
+        Raises:
+            ValueError: If neither or both of expected_tool_calls and expected_tool_pattern
+                        are given
+        """
+        if (expected_tool_calls is None) == (expected_tool_pattern is None):
+            raise ValueError(
+                f"Task '{id}' needs exactly one of expected_tool_calls and expected_tool_pattern"
+            )
         super().__init__(id=id)
         self.fixtures_dir = Path(__file__).parent / 'fixtures'
         self.working_directory = None
+        self.workspace_snapshot: Optional[WorkspaceSnapshot] = None
         self.prompt = prompt
         self.mock_config = mock_config
         self.validation_rubric = validation_rubric
         self.expected_tool_calls = expected_tool_calls
+        self.expected_tool_pattern = expected_tool_pattern
         self.modifies_code = modifies_code
 
     def get_working_directory(self) -> Optional[Path]:
@@ -66,6 +91,10 @@ class InvestigationTask(ApplicationSignalsTask):
             self.working_directory = Path(tempfile.mkdtemp())
         return self.working_directory
 
+    def allows_concurrent_runs(self) -> bool:
+        """Each run gets its own temporary working directory."""
+        return True
+
     def get_prompt(self, working_directory: Path) -> str:
         """Generate task prompt with working directory path."""
         return (
@@ -75,14 +104,27 @@ class InvestigationTask(ApplicationSignalsTask):
 
     def get_captors(self, working_directory: Path) -> list[Captor]:
         """Get captors for recording task execution."""
-        return [GitDiffCaptor(), ToolCallsCaptor(), FinalResponseCaptor()]
+        return [
+            GitDiffCaptor(snapshot=self.workspace_snapshot),
+            ToolCallsCaptor(),
+            FinalResponseCaptor(),
+        ]
 
     def get_validators(self, working_directory: Path) -> list[Validator]:
         """Get validators for verifying task completion."""
         validators = []
-        validators.append(
-            ToolCallValidator(expected_tool_calls=self.expected_tool_calls, ignore_file_tools=True)
-        )
+        if self.expected_tool_pattern is not None:
+            validators.append(
+                ToolCallPatternValidator(
+                    expected_pattern=self.expected_tool_pattern, ignore_file_tools=True
+                )
+            )
+        else:
+            validators.append(
+                ToolCallValidator(
+                    expected_tool_calls=self.expected_tool_calls, ignore_file_tools=True
+                )
+            )
         validators.append(
             LLMJudgeValidator(
                 validation_prompt_type=ValidationPromptType.CODE_MODIFICATION,
@@ -93,22 +135,13 @@ class InvestigationTask(ApplicationSignalsTask):
         return validators
 
     def setup(self, working_directory: Path):
-        """Copy sample app files to working directory and initialize git."""
-        # Copy files from sample_app_dir to working_directory
-        shutil.copytree(
-            SAMPLES_ROOT / 'investigations-sample' / 'src', working_directory, dirs_exist_ok=True
-        )
-
-        # Initialize git repository
-        self.process_executor.run(['git', 'init'], cwd=str(working_directory))
-        self.process_executor.run(['git', 'add', '.'], cwd=str(working_directory))
-        self.process_executor.run(
-            ['git', 'commit', '-m', 'Initial commit'], cwd=str(working_directory)
-        )
+        """Clone the sample app template (including its git repository) into the working directory."""
+        self.workspace_snapshot = _WORKSPACE_PROVIDER.populate(working_directory)
 
     def cleanup(self, working_directory: Path):
         """Delete the temporary working directory."""
         shutil.rmtree(working_directory, ignore_errors=True)
+        self.working_directory = None
 
 
 # Task definitions
@@ -121,24 +154,8 @@ TASKS = [
             'Agent identifies that the root cause is that we are getting ParamValidationError errors as the s3_key is not persisted in upload_document',
             'Agent makes a fix that would prevent ParamValidationError by storing s3_key in upload_document or by checking s3_key presence before get_document',
         ],
-       # Sometimes the agent will call audit_slos with "default auditors" then with "all auditors second", and other times it will call with "all auditors" only.
-        expected_tool_calls=[
-            [
-                'list_slos',
-                'audit_slos',
-            ],
-            [
-                'list_slos',
-                'get_slo',
-                'audit_slos',
-            ],
-            [
-                'list_slos',
-                'audit_slos',
-                'get_slo',
-                'audit_slos',
-            ],
-        ],
+        # Sometimes the agent will call audit_slos with "default auditors" then with "all auditors second", and other times it will call with "all auditors" only.
+        expected_tool_pattern='list_slos (audit_slos | audit_slos? get_slo audit_slos)',
         mock_config={
             'boto3': {
                 'application-signals': {
@@ -215,19 +232,7 @@ TASKS = [
             'Agent makes a fix that would timeout calls to scan_file in less than 500ms OR prevents scan_file from being run for large files',
         ],
         # Sometimes the agent will call audit_slos with "default auditors" then with "all auditors second", and other times it will call with "all auditors" only.
-        expected_tool_calls=[
-            [
-                'list_slos',
-                'get_slo',
-                'audit_slos',
-            ],
-            [
-                'list_slos',
-                'audit_slos',
-                'get_slo',
-                'audit_slos',
-            ],
-        ],
+        expected_tool_pattern='list_slos audit_slos? get_slo audit_slos',
         mock_config={
             'boto3': {
                 'application-signals': {
@@ -266,15 +271,7 @@ TASKS = [
             'Agent makes a fix that would prevent ValidationExceptions due to document_id is too long OR improves error handling to not retry non-retryable errors',
         ],
         # Sometimes the agent will call with "all auditors" first, and other times it will call with "default auditors", then "all auditors".
-        expected_tool_calls=[
-            [
-                'audit_services',
-            ],
-            [
-                'audit_services',
-                'audit_services',
-            ],
-        ],
+        expected_tool_pattern='audit_services audit_services?',
         mock_config={
             'boto3': {
                 'application-signals': {
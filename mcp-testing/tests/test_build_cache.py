@@ -0,0 +1,75 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for build result cache keys."""
+
+import asyncio
+import pytest
+import shutil
+import subprocess
+from evals.core.build_cache import BuildResultCache
+from evals.core.validator import BuildValidator
+
+
+EXCLUDED_DIRS = frozenset({'.git', 'build', 'node_modules'})
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Git repository with a tracked source file inside a directory named 'build'."""
+    if shutil.which('git') is None:
+        pytest.skip('requires git')
+    (tmp_path / 'build').mkdir()
+    (tmp_path / 'build' / 'entry.ts').write_text('app.synth();\n')
+    (tmp_path / 'node_modules').mkdir()
+    (tmp_path / 'node_modules' / 'dep.js').write_text('module.exports = 1;\n')
+    (tmp_path / '.gitignore').write_text('node_modules/\n')
+    subprocess.run(['git', 'init', '-q'], cwd=tmp_path, check=True)
+    subprocess.run(['git', 'add', '.'], cwd=tmp_path, check=True)
+    return tmp_path
+
+
+def test_key_covers_tracked_files_in_excluded_dirs(repo, tmp_path_factory):
+    cache = BuildResultCache(tmp_path_factory.mktemp('cache'), 1024, excluded_dirs=EXCLUDED_DIRS)
+    key = cache.make_key('npm run build', repo)
+
+    (repo / 'build' / 'entry.ts').write_text('app.synth(); // changed\n')
+
+    assert cache.make_key('npm run build', repo) != key
+
+
+def test_key_ignores_git_ignored_dependency_dirs(repo, tmp_path_factory):
+    cache = BuildResultCache(tmp_path_factory.mktemp('cache'), 1024, excluded_dirs=EXCLUDED_DIRS)
+    key = cache.make_key('npm run build', repo)
+
+    (repo / 'node_modules' / 'dep.js').write_text('module.exports = 2;\n')
+
+    assert cache.make_key('npm run build', repo) == key
+
+
+@pytest.mark.parametrize('command, cached', [('true', True), ('exit 1', False)])
+def test_validator_caches_only_successful_builds(tmp_path, command, cached):
+    if shutil.which('sh') is None:
+        pytest.skip('requires sh')
+    working_dir = tmp_path / 'project'
+    working_dir.mkdir()
+    (working_dir / 'main.ts').write_text('export {};\n')
+    cache = BuildResultCache(tmp_path / 'cache', 1024 * 1024, excluded_dirs=EXCLUDED_DIRS)
+    validator = BuildValidator(
+        command, working_dir, cache=cache, use_sandbox=False, log_dir=tmp_path / 'logs'
+    )
+
+    asyncio.run(validator.validate({}))
+
+    assert (cache.get(cache.make_key(command, working_dir)) is not None) is cached
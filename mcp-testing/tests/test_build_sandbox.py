@@ -0,0 +1,127 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for shared dependency caches and warm node_modules in the build sandbox."""
+
+import os
+from evals.core.build_sandbox import BuildSandbox
+
+
+def _make_project(path):
+    path.mkdir()
+    (path / 'package.json').write_text('{"name": "app"}\n')
+    (path / 'package-lock.json').write_text('{"lockfileVersion": 3}\n')
+    return path
+
+
+def test_snapshot_saved_under_key_from_before_the_build(tmp_path):
+    sandbox = BuildSandbox(tmp_path / 'cache')
+    first = _make_project(tmp_path / 'first')
+    node_projects = sandbox.find_node_projects(first)
+    sandbox.prepare(first, node_projects)
+
+    # The build installs dependencies and rewrites the lockfile
+    (first / 'node_modules').mkdir()
+    (first / 'node_modules' / '.package-lock.json').write_text('{}\n')
+    (first / 'package-lock.json').write_text('{"lockfileVersion": 3, "packages": {}}\n')
+    sandbox.save(first, node_projects)
+
+    second = _make_project(tmp_path / 'second')
+    sandbox.prepare(second, sandbox.find_node_projects(second))
+
+    assert (second / 'node_modules' / '.package-lock.json').is_file()
+
+
+def test_restored_node_modules_are_not_hardlinked(tmp_path):
+    sandbox = BuildSandbox(tmp_path / 'cache')
+    first = _make_project(tmp_path / 'first')
+    (first / 'node_modules').mkdir()
+    (first / 'node_modules' / '.package-lock.json').write_text('{}\n')
+    sandbox.save(first)
+
+    second = _make_project(tmp_path / 'second')
+    sandbox.prepare(second)
+    restored = second / 'node_modules' / '.package-lock.json'
+    restored.write_text('{"rewritten": true}\n')
+
+    assert os.stat(restored).st_nlink == 1
+    snapshot = next((tmp_path / 'cache' / 'node_modules').iterdir())
+    assert (snapshot / '.package-lock.json').read_text() == '{}\n'
+
+
+def test_env_points_tools_at_shared_caches(tmp_path):
+    sandbox = BuildSandbox(tmp_path / 'cache')
+
+    env = sandbox.get_env({'MAVEN_OPTS': '-Xmx1g'})
+
+    assert env['npm_config_cache'] == str(tmp_path / 'cache' / 'npm')
+    assert env['npm_config_prefer_offline'] == 'true'
+    assert (tmp_path / 'cache' / 'terraform' / 'plugins').is_dir()
+    maven_repo = tmp_path / 'cache' / 'm2' / 'repository'
+    assert env['MAVEN_OPTS'] == f'-Xmx1g -Dmaven.repo.local={maven_repo}'
+    assert 'npm_config_offline' not in env
+
+
+def test_offline_env_disables_downloads(tmp_path):
+    env = BuildSandbox(tmp_path / 'cache', offline=True).get_env({})
+
+    assert env['npm_config_offline'] == 'true'
+    assert env['MAVEN_ARGS'] == '--offline'
+    assert env['PIP_NO_INDEX'] == '1'
+    assert 'npm_config_prefer_offline' not in env
+
+
+def test_projects_are_keyed_by_lockfile_and_skip_dependency_dirs(tmp_path):
+    sandbox = BuildSandbox(tmp_path / 'cache')
+    root = _make_project(tmp_path / 'root')
+    nested = _make_project(root / 'web')
+    _make_project(root / 'node_modules')
+    (root / 'unlocked').mkdir()
+    (root / 'unlocked' / 'package.json').write_text('{}\n')
+
+    projects = dict(sandbox.find_node_projects(root))
+
+    assert set(projects) == {root, nested}
+    # Same lockfile content, same key
+    assert projects[root] == projects[nested]
+
+
+def test_existing_node_modules_are_left_untouched(tmp_path):
+    sandbox = BuildSandbox(tmp_path / 'cache')
+    first = _make_project(tmp_path / 'first')
+    (first / 'node_modules').mkdir()
+    (first / 'node_modules' / 'warm.js').write_text('1\n')
+    sandbox.save(first)
+
+    second = _make_project(tmp_path / 'second')
+    (second / 'node_modules').mkdir()
+    sandbox.prepare(second)
+
+    assert list((second / 'node_modules').iterdir()) == []
+
+
+def test_least_recently_used_snapshots_are_evicted(tmp_path):
+    sandbox = BuildSandbox(tmp_path / 'cache', max_node_modules_snapshots=2)
+    for i in range(3):
+        project = _make_project(tmp_path / f'project{i}')
+        (project / 'package-lock.json').write_text(f'{{"version": {i}}}\n')
+        (project / 'node_modules').mkdir()
+        sandbox.save(project)
+        snapshot = sandbox.node_modules_dir / sandbox.find_node_projects(project)[0][1]
+        os.utime(snapshot, ns=(i * 10**9, i * 10**9))
+
+    remaining = {path.name for path in sandbox.node_modules_dir.iterdir()}
+    assert len(remaining) == 2
+    first_key = sandbox.find_node_projects(tmp_path / 'project0')[0][1]
+    assert first_key not in remaining
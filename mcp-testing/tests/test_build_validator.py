@@ -0,0 +1,71 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for build timeouts and build log retention."""
+
+import asyncio
+import os
+import pytest
+import time
+from evals.core.validator import BuildValidator
+
+
+pytestmark = pytest.mark.skipif(os.name != 'posix', reason='requires a POSIX shell')
+
+
+def _validator(tmp_path, command, **kwargs):
+    return BuildValidator(
+        command,
+        tmp_path,
+        use_cache=False,
+        use_sandbox=False,
+        log_dir=tmp_path / 'logs',
+        **kwargs,
+    )
+
+
+def _is_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def test_timeout_kills_build_child_processes(tmp_path):
+    command = 'sleep 60 >/dev/null 2>&1 & echo $! > child.pid; wait'
+    validator = _validator(tmp_path, command, timeout=1)
+
+    result = asyncio.run(validator.validate({}))
+
+    assert result['overall_pass'] is False
+    assert 'timed out' in result['error']
+    pid = int((tmp_path / 'child.pid').read_text())
+    deadline = time.monotonic() + 5
+    while _is_running(pid) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not _is_running(pid)
+
+
+def test_only_most_recent_truncated_logs_are_kept(tmp_path):
+    validator = _validator(tmp_path, 'head -c 100000 /dev/zero | tr "\\0" a', max_log_files=2)
+
+    log_paths = []
+    for _ in range(3):
+        result = asyncio.run(validator.validate({}))
+        log_paths.append(result['raw_validation_output']['log_path'])
+        time.sleep(0.01)
+
+    assert all(log_paths)
+    assert sorted((tmp_path / 'logs').iterdir()) == sorted(map(type(tmp_path), log_paths[1:]))
@@ -0,0 +1,46 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for eval CLI argument validation."""
+
+import pytest
+import subprocess
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.mark.parametrize(
+    'args, message',
+    [
+        (['--concurrency', '0'], '--concurrency must be at least 1'),
+        (['--concurrency', '-2'], '--concurrency must be at least 1'),
+        (['--trials', '0'], '--trials must be at least 1'),
+        (['--confidence', '1'], '--confidence must be between 0 and 1'),
+        (['--pass-threshold', '1.5'], '--pass-threshold must be between 0 and 1'),
+    ],
+)
+def test_invalid_arguments_are_rejected(args, message):
+    result = subprocess.run(
+        [sys.executable, '-m', 'evals', 'tasks', *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert result.returncode == 2
+    assert message in result.stderr
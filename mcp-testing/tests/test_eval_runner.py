@@ -0,0 +1,116 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for task cleanup in EvalRunner."""
+
+import asyncio
+import contextlib
+import pytest
+from evals.core import eval_runner
+from evals.core.eval_runner import EvalRunner
+from evals.core.scheduling import TaskHistory
+from evals.core.task import Task
+from evals.core.workspace_provider import TemplateWorkspaceProvider, WorkspacePool
+from pathlib import Path
+from types import SimpleNamespace
+
+
+class _Session:
+    """Stand-in for an MCP ClientSession with no tools."""
+
+    def __init__(self, read, write):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def initialize(self):
+        pass
+
+    async def list_tools(self):
+        return SimpleNamespace(tools=[])
+
+
+@contextlib.asynccontextmanager
+async def _connect(**kwargs):
+    yield None, None
+
+
+class _PooledTask(Task):
+    """Task that takes a workspace from a pool and fails during setup."""
+
+    def __init__(self, pool: WorkspacePool):
+        super().__init__(id='pooled')
+        self.pool = pool
+        self.workspace = None
+
+    def get_prompt(self, working_directory: Path) -> str:
+        return 'prompt'
+
+    def get_server_root_directory(self) -> Path:
+        return Path.cwd()
+
+    def get_server_file(self) -> Path:
+        return Path('server.py')
+
+    def get_working_directory(self) -> Path:
+        self.workspace = self.pool.acquire()
+        return self.workspace
+
+    def setup(self, working_directory: Path) -> None:
+        raise RuntimeError('setup failed')
+
+    def cleanup(self, working_directory: Path) -> None:
+        self.pool.release(working_directory)
+
+
+@pytest.fixture
+def pool(tmp_path):
+    (tmp_path / 'source').mkdir()
+    (tmp_path / 'source' / 'app.py').write_text('print(1)\n')
+    pool = WorkspacePool(TemplateWorkspaceProvider(tmp_path / 'source', clone_mode='copy'))
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(autouse=True)
+def no_server(monkeypatch):
+    monkeypatch.setattr(eval_runner, 'connect_to_mcp_server', _connect)
+    monkeypatch.setattr(eval_runner, 'ClientSession', _Session)
+
+
+def _run(task: Task, history_path: Path, skip_cleanup: bool):
+    runner = EvalRunner([task], history=TaskHistory(history_path))
+    return asyncio.run(runner._run_task(task, verbose=False, skip_cleanup=skip_cleanup))
+
+
+def test_failed_task_releases_its_workspace(pool, tmp_path):
+    task = _PooledTask(pool)
+
+    with pytest.raises(RuntimeError, match='setup failed'):
+        _run(task, tmp_path / 'history.json', skip_cleanup=False)
+
+    assert pool.acquire() == task.workspace
+
+
+def test_failed_task_keeps_its_workspace_with_skip_cleanup(pool, tmp_path):
+    task = _PooledTask(pool)
+
+    with pytest.raises(RuntimeError, match='setup failed'):
+        _run(task, tmp_path / 'history.json', skip_cleanup=True)
+
+    assert pool.acquire() != task.workspace
@@ -0,0 +1,126 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for log-bucketed latency histograms."""
+
+import json
+import math
+import pytest
+import random
+from evals.core.latency_histogram import (
+    DEFAULT_BUCKET_GROWTH,
+    LatencyHistogram,
+    format_latency_line,
+    merge_tool_latencies,
+)
+
+
+def _histogram(durations, bucket_growth=DEFAULT_BUCKET_GROWTH):
+    histogram = LatencyHistogram(bucket_growth)
+    for duration in durations:
+        histogram.record(duration)
+    return histogram
+
+
+def _exact_percentile(values, q):
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(len(ordered) * q / 100)) - 1]
+
+
+def test_empty_histogram_has_no_percentiles():
+    histogram = LatencyHistogram()
+
+    assert histogram.percentile(50) is None
+    assert histogram.summary() == {
+        'count': 0,
+        'total': 0.0,
+        'max': None,
+        'p50': None,
+        'p90': None,
+        'p99': None,
+    }
+
+
+@pytest.mark.parametrize('scale', [1e-4, 0.05, 3.0, 120.0])
+def test_percentiles_are_within_bucket_growth_of_exact_values(scale):
+    rng = random.Random(7)
+    durations = [scale * rng.lognormvariate(0, 1) for _ in range(2000)]
+    histogram = _histogram(durations)
+
+    for q in (1, 50, 90, 99, 100):
+        exact = _exact_percentile(durations, q)
+        assert histogram.percentile(q) == pytest.approx(exact, rel=DEFAULT_BUCKET_GROWTH)
+
+
+def test_percentiles_are_clamped_to_recorded_range():
+    histogram = _histogram([0.1, 0.1, 0.1])
+
+    assert histogram.percentile(0) == histogram.percentile(100) == 0.1
+    assert histogram.min == histogram.max == 0.1
+
+
+def test_tiny_durations_share_the_first_bucket():
+    histogram = _histogram([0.0, 1e-9, 1e-6])
+
+    assert histogram.buckets == {0: 3}
+    assert histogram.percentile(50) == 1e-6
+
+
+def test_merge_equals_recording_everything_in_one_histogram():
+    first, second = [0.01, 0.2, 3.5], [0.5, 0.002, 40.0, 0.2]
+    merged = _histogram(first)
+    merged.merge(_histogram(second))
+    merged.merge(LatencyHistogram())
+
+    combined = _histogram(first + second)
+    assert merged.buckets == combined.buckets
+    assert (merged.count, merged.min, merged.max) == (7, 0.002, 40.0)
+    assert merged.total == pytest.approx(combined.total)
+    assert merged.summary() == pytest.approx(combined.summary())
+
+
+def test_merge_into_empty_histogram_takes_min_and_max():
+    merged = LatencyHistogram()
+    merged.merge(_histogram([0.3, 0.7]))
+
+    assert (merged.count, merged.min, merged.max) == (2, 0.3, 0.7)
+
+
+def test_merge_rejects_different_bucket_growth():
+    with pytest.raises(ValueError, match='bucket growth'):
+        LatencyHistogram(0.02).merge(LatencyHistogram(0.05))
+
+
+def test_round_trip_through_json():
+    histogram = _histogram([0.004, 0.03, 0.03, 1.2, 9.0], bucket_growth=0.05)
+
+    restored = LatencyHistogram.from_dict(json.loads(json.dumps(histogram.to_dict())))
+
+    assert restored.bucket_growth == 0.05
+    assert restored.buckets == histogram.buckets
+    assert restored.to_dict() == histogram.to_dict()
+
+
+def test_merge_tool_latencies_combines_reports_per_tool():
+    reports = [
+        {'read': _histogram([0.1]).to_dict(), 'write': _histogram([0.5]).to_dict()},
+        {'read': _histogram([0.2, 0.3]).to_dict()},
+    ]
+
+    merged = merge_tool_latencies(reports)
+
+    assert {name: h.count for name, h in merged.items()} == {'read': 3, 'write': 1}
+    assert merged['read'].max == 0.3
+    line = format_latency_line('read', merged['read'].summary())
+    assert line.endswith('max 0.300s (3 calls, 0.60s total)')
@@ -0,0 +1,401 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for request matching, fault injection and mocked boto3 and botocore clients."""
+
+import boto3
+import pytest
+import random
+from botocore.client import BaseClient
+from botocore.exceptions import ClientError, ReadTimeoutError
+from evals.core import mcp_dependency_mocking_handler
+from evals.core.mcp_dependency_mocking_handler import (
+    Boto3DependencyMockingHandler,
+    BotocoreDependencyMockingHandler,
+    McpDependencyMockingHandler,
+    McpDependencyMockingHandlerRegistry,
+    MockBehavior,
+    MockFaultError,
+    RequestMatcher,
+    UnmockedMethodError,
+)
+
+
+def _pairs(*requests):
+    return [{'request': request, 'response': index} for index, request in enumerate(requests)]
+
+
+def _linear_match(pairs, params):
+    """Reference semantics: the first pair whose request params all match wins."""
+    for pair in pairs:
+        if all(params.get(name) == value for name, value in pair['request'].items()):
+            return pair['response']
+    raise ValueError('no match')
+
+
+class _PlainHandler(McpDependencyMockingHandler):
+    """Handler without library-specific exceptions."""
+
+    def get_library_name(self):
+        return 'plain'
+
+    def patch(self, mock_config):
+        pass
+
+    def unpatch(self):
+        pass
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record injected delays instead of sleeping, with a seeded random generator."""
+    delays = []
+    monkeypatch.setattr(mcp_dependency_mocking_handler.time, 'sleep', delays.append)
+    monkeypatch.setattr(mcp_dependency_mocking_handler, '_rng', random.Random(0))
+    return delays
+
+
+@pytest.fixture
+def boto3_handler():
+    handler = Boto3DependencyMockingHandler()
+    yield handler
+    handler.unpatch()
+
+
+@pytest.fixture
+def registry():
+    registry = McpDependencyMockingHandlerRegistry()
+    yield registry
+    registry.unpatch_all()
+
+
+@pytest.mark.parametrize(
+    'params, expected',
+    [
+        ({'A': 1}, 0),
+        ({'A': 1, 'B': 2}, 0),
+        ({'A': 2, 'B': 2}, 1),
+        ({'B': 2}, 2),
+        ({'B': 3}, 3),
+        ({'A': 2, 'B': 3}, 3),
+        ({'A': 3, 'B': 3}, 3),
+        ({'C': 1}, 3),
+        ({}, 3),
+    ],
+)
+def test_first_matching_pair_wins(params, expected):
+    pairs = _pairs({'A': 1}, {'A': 2, 'B': 2}, {'B': 2}, {}, {'A': 3})
+    assert RequestMatcher('Op', pairs).match(params) == expected == _linear_match(pairs, params)
+
+
+def test_wildcard_shadows_later_specific_pairs():
+    matcher = RequestMatcher('Op', _pairs({}, {'A': 1}))
+
+    assert matcher.match({'A': 1}) == 0
+
+
+def test_pairs_indexed_under_other_keys_are_not_missed():
+    # Pair 0 is indexed under B, pair 1 under A; a call matching both picks pair 0
+    pairs = _pairs({'B': 1, 'A': 1}, {'A': 1}, {'A': 1, 'B': 2})
+    matcher = RequestMatcher('Op', pairs)
+
+    assert matcher.match({'A': 1, 'B': 1}) == 0
+    assert matcher.match({'A': 1, 'B': 2}) == 1
+    assert matcher.match({'A': 1}) == 1
+
+
+def test_unhashable_and_nested_values_match_by_equality():
+    pairs = _pairs(
+        {'Filters': [{'Name': 'x', 'Values': ['1']}]},
+        {'Query': {'b': 2, 'a': [1, 2]}},
+    )
+    matcher = RequestMatcher('Op', pairs)
+
+    assert matcher.match({'Filters': [{'Values': ['1'], 'Name': 'x'}]}) == 0
+    assert matcher.match({'Query': {'a': [1, 2], 'b': 2}}) == 1
+    with pytest.raises(ValueError, match='No mock response found for Op'):
+        matcher.match({'Query': {'a': (1, 2), 'b': 2, 'c': 3}})
+
+
+def test_no_match_raises_with_available_patterns():
+    matcher = RequestMatcher('GetThing', _pairs({'Id': 'a'}, {'Id': 'b'}))
+
+    with pytest.raises(ValueError) as excinfo:
+        matcher.match({'Id': 'c'})
+
+    assert "Available request patterns: [{'Id': 'a'}, {'Id': 'b'}]" in str(excinfo.value)
+
+
+def test_matcher_agrees_with_linear_scan_on_many_calls():
+    pairs = _pairs(
+        *[{'Name': f'n{i % 7}', 'Region': f'r{i % 3}'} for i in range(30)],
+        *[{'Region': f'r{i}'} for i in range(2)],
+        {},
+    )
+    matcher = RequestMatcher('Op', pairs)
+
+    for name in range(8):
+        for region in range(4):
+            params = {'Name': f'n{name}', 'Region': f'r{region}'}
+            assert matcher.match(params) == _linear_match(pairs, params)
+
+
+def test_stub_clients_answer_mocked_operations(boto3_handler):
+    boto3_handler.patch(
+        {
+            'logs': {
+                'describe_log_groups': [
+                    {'request': {'logGroupNamePrefix': '/aws'}, 'response': {'logGroups': [1]}},
+                    {'request': {}, 'response': {'logGroups': []}},
+                ]
+            }
+        }
+    )
+
+    client = boto3.client('logs', region_name='us-east-1')
+
+    assert type(client).__name__ == 'LogsStubClient'
+    assert client.describe_log_groups(logGroupNamePrefix='/aws') == {'logGroups': [1]}
+    assert client.describe_log_groups() == {'logGroups': []}
+    with pytest.raises(UnmockedMethodError, match="'get_log_events'.*describe_log_groups"):
+        client.get_log_events(logGroupName='x')
+
+
+def test_stub_client_class_is_generated_once_per_service(boto3_handler):
+    boto3_handler.patch({'logs': {'describe_log_groups': [{'request': {}, 'response': {}}]}})
+
+    first = boto3.client('logs')
+    second = boto3.client('logs')
+    other = boto3.client('application-signals')
+
+    assert type(first) is type(second)
+    assert type(other).__name__ == 'ApplicationSignalsStubClient'
+    with pytest.raises(UnmockedMethodError):
+        other.list_services()
+
+
+def test_call_counting(boto3_handler):
+    boto3_handler.count_calls = True
+    boto3_handler.patch({'logs': {'describe_log_groups': [{'request': {}, 'response': {}}]}})
+
+    client = boto3.client('logs')
+    client.describe_log_groups()
+    boto3.client('logs').describe_log_groups(limit=1)
+
+    assert boto3_handler.call_counts == {('logs', 'describe_log_groups'): 2}
+
+
+def test_unpatch_restores_boto3_client(boto3_handler):
+    original = boto3.client
+    boto3_handler.patch({'logs': {}})
+    assert boto3.client != original
+
+    boto3_handler.unpatch()
+
+    assert boto3.client == original
+
+
+def test_botocore_patch_mocks_session_clients_and_paginators(registry):
+    registry.patch_all(
+        {
+            'botocore': {
+                'logs': {
+                    'describe_log_groups': [
+                        {'request': {'limit': 1}, 'response': {'logGroups': [{'n': 1}]}},
+                        {'request': {}, 'response': {'logGroups': [{'n': 2}]}},
+                    ]
+                }
+            }
+        }
+    )
+
+    client = boto3.Session(region_name='us-east-1').client('logs')
+    pages = client.get_paginator('describe_log_groups').paginate()
+
+    assert client.describe_log_groups(limit=1) == {'logGroups': [{'n': 1}]}
+    assert [page['logGroups'] for page in pages] == [[{'n': 2}]]
+    with pytest.raises(UnmockedMethodError, match="'get_log_events'"):
+        client.get_log_events(logGroupName='g', logStreamName='s')
+
+
+def test_boto3_config_also_mocks_clients_created_without_boto3_client(registry):
+    registry.patch_all(
+        {
+            'boto3': {'logs': {'describe_log_groups': [{'request': {}, 'response': {'a': 1}}]}},
+            'botocore': {'sts': {'get_caller_identity': [{'request': {}, 'response': {'b': 2}}]}},
+        }
+    )
+
+    session = boto3.Session(region_name='us-east-1')
+
+    assert boto3.client('logs').describe_log_groups() == {'a': 1}
+    assert session.client('logs').describe_log_groups() == {'a': 1}
+    assert session.client('sts').get_caller_identity() == {'b': 2}
+
+
+def test_unmocked_service_fails_instead_of_calling_aws(registry):
+    registry.patch_all({'botocore': {}})
+
+    client = boto3.Session(region_name='us-east-1').client('sts')
+
+    with pytest.raises(UnmockedMethodError, match='sts client'):
+        client.get_caller_identity()
+
+
+def test_botocore_unpatch_restores_make_api_call():
+    original = BaseClient._make_api_call
+    handler = BotocoreDependencyMockingHandler()
+
+    handler.patch({'logs': {}})
+    assert BaseClient._make_api_call is not original
+    handler.unpatch()
+
+    assert BaseClient._make_api_call is original
+    assert handler.matchers == {}
+
+
+@pytest.mark.parametrize(
+    'latency, low, high',
+    [
+        (None, 0.0, 0.0),
+        (0.25, 0.25, 0.25),
+        ({'distribution': 'fixed', 'seconds': 1}, 1.0, 1.0),
+        ({'distribution': 'uniform', 'min': 0.1, 'max': 0.5}, 0.1, 0.5),
+        ({'distribution': 'lognormal', 'median': 0.3, 'sigma': 2.0, 'max': 0.6}, 0.0, 0.6),
+    ],
+)
+def test_latency_samples_stay_within_configured_range(latency, low, high):
+    behavior = MockBehavior(latency=latency)
+    rng = random.Random(1)
+
+    samples = [behavior.sample_latency(rng) for _ in range(500)]
+
+    assert all(low <= sample <= high for sample in samples)
+
+
+def test_lognormal_latency_is_centered_on_median():
+    behavior = MockBehavior(latency={'distribution': 'lognormal', 'median': 0.3, 'sigma': 0.5})
+    rng = random.Random(2)
+
+    samples = sorted(behavior.sample_latency(rng) for _ in range(2001))
+
+    assert samples[1000] == pytest.approx(0.3, rel=0.1)
+
+
+@pytest.mark.parametrize(
+    'fault, fault_type, probability',
+    [
+        (None, None, 0.0),
+        ('timeout', 'timeout', 1.0),
+        ({'type': 'throttling'}, 'throttling', 1.0),
+        ({'type': 'server_error', 'probability': 0.25}, 'server_error', 0.25),
+    ],
+)
+def test_fault_settings_are_parsed(fault, fault_type, probability):
+    behavior = MockBehavior(fault=fault)
+
+    assert (behavior.fault_type, behavior.fault_probability) == (fault_type, probability)
+
+
+@pytest.mark.parametrize(
+    'settings, message',
+    [
+        ({'latency': '1s'}, 'Invalid latency'),
+        ({'latency': {'distribution': 'normal'}}, 'Invalid latency'),
+        ({'latency': {'distribution': 'uniform', 'min': 0.1}}, "missing \\['max'\\]"),
+        ({'latency': {'distribution': 'lognormal', 'median': 0, 'sigma': 1}}, 'positive'),
+        ({'fault': 'crash'}, 'Invalid fault'),
+        ({'fault': {'probability': 0.5}}, 'Invalid fault'),
+        ({'fault': {'type': 'timeout', 'probability': 2}}, 'between 0 and 1'),
+    ],
+)
+def test_malformed_behavior_is_rejected(settings, message):
+    with pytest.raises(ValueError, match=message):
+        MockBehavior(**settings)
+
+
+def test_fault_probability_controls_injection_rate():
+    rng = random.Random(3)
+    behavior = MockBehavior(fault={'type': 'unavailable', 'probability': 0.3})
+
+    faults = [behavior.apply(rng) for _ in range(2000)]
+
+    assert set(faults) == {None, 'unavailable'}
+    assert faults.count('unavailable') / len(faults) == pytest.approx(0.3, abs=0.05)
+    assert MockBehavior(fault={'type': 'unavailable', 'probability': 0}).apply(rng) is None
+
+
+def test_behavior_is_attached_only_to_pairs_that_configure_it():
+    handler = _PlainHandler()
+
+    plain, slow = handler.resolve_method_mock_configs(
+        [
+            {'request': {}, 'response': {'a': 1}},
+            {'request': {}, 'response': {'a': 2}, 'latency': 0.5},
+        ]
+    )
+
+    assert '_behavior' not in plain
+    assert slow['_behavior'].sample_latency(random.Random()) == 0.5
+    with pytest.raises(ValueError, match='Invalid fault'):
+        handler.resolve_method_mock_config({'request': {}, 'response': {}, 'fault': 'crash'})
+
+
+def test_respond_delays_and_raises_default_fault_error(sleeps):
+    handler = _PlainHandler()
+    pairs = handler.resolve_method_mock_configs(
+        [
+            {'request': {'Id': 'slow'}, 'response': {'ok': True}, 'latency': 0.2},
+            {'request': {'Id': 'down'}, 'response': {}, 'fault': 'server_error'},
+        ]
+    )
+    matcher = RequestMatcher('get_thing', pairs)
+
+    assert handler.respond('svc', 'get_thing', matcher, {'Id': 'slow'}) == {'ok': True}
+    assert sleeps == [0.2]
+    with pytest.raises(MockFaultError) as excinfo:
+        handler.respond('svc', 'get_thing', matcher, {'Id': 'down'})
+    assert (excinfo.value.service_name, excinfo.value.fault_type) == ('svc', 'server_error')
+
+
+@pytest.mark.parametrize(
+    'fault, status, code',
+    [
+        ('throttling', 400, 'ThrottlingException'),
+        ('server_error', 500, 'InternalServerError'),
+        ('unavailable', 503, 'ServiceUnavailableException'),
+    ],
+)
+def test_boto3_faults_raise_client_errors(boto3_handler, sleeps, fault, status, code):
+    boto3_handler.patch(
+        {'logs': {'describe_log_groups': [{'request': {}, 'response': {}, 'fault': fault}]}}
+    )
+
+    with pytest.raises(ClientError) as excinfo:
+        boto3.client('logs').describe_log_groups()
+
+    error = excinfo.value.response
+    assert error['Error']['Code'] == code
+    assert error['ResponseMetadata']['HTTPStatusCode'] == status
+    assert excinfo.value.operation_name == 'DescribeLogGroups'
+
+
+def test_botocore_timeout_fault_raises_read_timeout(registry, sleeps):
+    pairs = [{'request': {}, 'response': {}, 'fault': 'timeout'}]
+    registry.patch_all({'botocore': {'sts': {'get_caller_identity': pairs}}})
+
+    client = boto3.Session(region_name='us-east-1').client('sts')
+
+    with pytest.raises(ReadTimeoutError):
+        client.get_caller_identity()
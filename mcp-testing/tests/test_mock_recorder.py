@@ -0,0 +1,61 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for request pattern stripping in record mode."""
+
+import datetime
+from evals.core.mock_recorder import strip_volatile_request, timestamp_members
+from types import SimpleNamespace
+
+
+def _shape(type_name, **fields):
+    """Return a stand-in for a botocore shape."""
+    return SimpleNamespace(type_name=type_name, **fields)
+
+
+def _input_shape():
+    timestamp = _shape('timestamp')
+    window = _shape('structure', members={'From': timestamp, 'To': timestamp})
+    recursive = _shape('structure', members={})
+    recursive.members['Child'] = recursive
+    return _shape(
+        'structure',
+        members={
+            'ServiceName': _shape('string'),
+            'StartTime': timestamp,
+            'Windows': _shape('list', member=window),
+            'Tags': _shape('map', value=_shape('string')),
+            'Tree': recursive,
+        },
+    )
+
+
+def test_timestamp_members_follow_nested_shapes():
+    assert timestamp_members(_input_shape()) == {'StartTime', 'Windows'}
+    assert timestamp_members(None) == frozenset()
+
+
+def test_strip_volatile_request_drops_timestamps_in_any_representation():
+    members = timestamp_members(_input_shape())
+    for start_time in (1718000000, '2024-06-10T06:13:20Z', datetime.datetime(2024, 6, 10)):
+        params = {'ServiceName': 'checkout', 'StartTime': start_time, 'Tags': {'a': 'b'}}
+        assert strip_volatile_request(params, members) == {
+            'ServiceName': 'checkout',
+            'Tags': {'a': 'b'},
+        }
+
+
+def test_strip_volatile_request_drops_datetimes_without_shape():
+    params = {'ServiceName': 'checkout', 'EndTime': datetime.datetime(2024, 6, 10)}
+    assert strip_volatile_request(params) == {'ServiceName': 'checkout'}
@@ -0,0 +1,43 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for cached mock bundles."""
+
+import os
+from evals.core.mock_transport import build_mock_bundle, decode_mock_bundle
+
+
+def _mock_config(fixture):
+    return {'boto3': {'s3': {'list_buckets': [{'request': {}, 'response': str(fixture)}]}}}
+
+
+def test_bundle_is_cached_until_a_fixture_changes(tmp_path):
+    fixture = tmp_path / 'buckets.json'
+    fixture.write_text('{"Buckets": []}')
+    mock_config = _mock_config(fixture)
+
+    bundle = build_mock_bundle(mock_config)
+    assert build_mock_bundle(dict(mock_config)) is bundle
+    assert decode_mock_bundle(bundle) == {
+        'boto3': {'s3': {'list_buckets': [{'request': {}, 'response': {'Buckets': []}}]}}
+    }
+
+    fixture.write_text('{"Buckets": [{"Name": "b"}]}')
+    mtime = os.stat(fixture).st_mtime_ns + 1_000_000
+    os.utime(fixture, ns=(mtime, mtime))
+
+    rebuilt = build_mock_bundle(mock_config)
+    assert rebuilt is not bundle
+    response = decode_mock_bundle(rebuilt)['boto3']['s3']['list_buckets'][0]['response']
+    assert response == {'Buckets': [{'Name': 'b'}]}
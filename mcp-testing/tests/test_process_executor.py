@@ -0,0 +1,92 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for async process execution."""
+
+import asyncio
+import os
+import pytest
+import subprocess
+import threading
+import time
+from evals.core import eval_config
+from evals.core.process_executor import AsyncProcessExecutor, ProcessExecutor, ProcessResult
+
+
+pytestmark = pytest.mark.skipif(os.name != 'posix', reason='requires a POSIX shell')
+
+
+class _RecordingExecutor(ProcessExecutor):
+    """Executor that only implements run(), like test doubles."""
+
+    def __init__(self):
+        self.threads = []
+
+    def run(self, cmd, cwd=None, timeout=None) -> ProcessResult:
+        self.threads.append(threading.current_thread())
+        return ProcessResult(returncode=0, stdout=' '.join(cmd), stderr='')
+
+
+def test_default_run_async_runs_run_in_a_worker_thread():
+    executor = _RecordingExecutor()
+
+    result = asyncio.run(executor.run_async(['echo', 'hi']))
+
+    assert result.stdout == 'echo hi'
+    assert executor.threads[0] is not threading.main_thread()
+
+
+def test_run_async_returns_exit_code_and_output(tmp_path):
+    result = asyncio.run(
+        AsyncProcessExecutor().run_async(
+            ['sh', '-c', 'pwd; echo err >&2; exit 3'], cwd=str(tmp_path)
+        )
+    )
+
+    assert result.returncode == 3
+    assert result.stdout.strip() == str(tmp_path.resolve())
+    assert result.stderr == 'err\n'
+
+
+def test_timeout_kills_the_process_group(tmp_path):
+    pid_file = tmp_path / 'child.pid'
+    command = ['sh', '-c', f'sleep 60 >/dev/null 2>&1 & echo $! > {pid_file}; wait']
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        asyncio.run(AsyncProcessExecutor().run_async(command, timeout=1))
+
+    pid = int(pid_file.read_text())
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            break
+        time.sleep(0.05)
+    else:
+        pytest.fail('background child of the timed out command is still running')
+
+
+def test_concurrent_processes_are_limited(tmp_path, monkeypatch):
+    monkeypatch.setattr(eval_config, 'MAX_SUBPROCESSES', 1)
+    # mkdir fails if another command holds the lock directory
+    command = ['sh', '-c', 'mkdir lock || exit 9; sleep 0.1; rmdir lock']
+    executor = AsyncProcessExecutor()
+
+    async def run_all():
+        return await asyncio.gather(
+            *[executor.run_async(command, cwd=str(tmp_path)) for _ in range(3)]
+        )
+
+    assert [result.returncode for result in asyncio.run(run_all())] == [0, 0, 0]
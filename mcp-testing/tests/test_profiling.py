@@ -0,0 +1,57 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the sampling profiler's attribution of CPU time to threads."""
+
+import pytest
+import threading
+import time
+from evals.core.profiling import SamplingProfiler
+
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(time, 'pthread_getcpuclockid'), reason='requires per-thread CPU clocks'
+)
+
+
+def _spin(seconds: float) -> None:
+    deadline = time.thread_time() + seconds
+    while time.thread_time() < deadline:
+        pass
+
+
+def _worker_spin() -> None:
+    _spin(0.3)
+
+
+def test_worker_thread_cpu_is_not_charged_to_the_waiting_main_thread():
+    profiler = SamplingProfiler(interval=0.005)
+    profiler.start()
+    try:
+        with profiler.section('task'):
+            worker = threading.Thread(target=_worker_spin)
+            worker.start()
+            worker.join()
+            _spin(0.1)
+    finally:
+        profiler.stop()
+
+    task_samples = sum(profiler.stacks('task').values())
+    worker_samples = sum(
+        count for stack, count in profiler.worker_samples.items() if '_worker_spin' in stack
+    )
+    assert 10 <= task_samples <= 30
+    assert worker_samples >= 40
+    assert all(stack.startswith('worker-threads;') for stack in profiler.worker_samples)
+    assert set(profiler.worker_samples) <= set(profiler.merged_stacks())
@@ -0,0 +1,144 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for comparing two eval runs."""
+
+import json
+import pytest
+from evals.core.run_comparison import TaskComparison, TaskRunStats, compare_runs, read_run_stats
+
+
+def _write_results(path, records):
+    path.write_text(''.join(json.dumps(record) + '\n' for record in records))
+    return path
+
+
+def _stats(*records):
+    stats = TaskRunStats()
+    for record in records:
+        stats.add(record)
+    return stats
+
+
+def test_read_run_stats_aggregates_trials_and_skips_bad_lines(tmp_path):
+    results = tmp_path / 'results.jsonl'
+    _write_results(
+        results,
+        [
+            {'task_id': 'a', 'success': True, 'metrics': {'task_duration': 10, 'hit_rate': 1.0}},
+            {'task_id': 'b', 'success': False, 'error': 'boom', 'metrics': None},
+            {'task_id': 'a', 'success': False, 'metrics': {'task_duration': 30, 'hit_rate': None}},
+            {'success': True},
+        ],
+    )
+    with open(results, 'a') as f:
+        f.write('not json\n\n')
+
+    stats = read_run_stats(results)
+
+    assert list(stats) == ['a', 'b']
+    a, b = stats['a'], stats['b']
+    assert (a.runs, a.passes, a.errors, a.status) == (2, 1, 0, 'flaky')
+    assert a.mean('task_duration') == 20.0
+    assert a.mean('hit_rate') == 1.0
+    assert a.mean('turn_count') is None
+    assert (b.runs, b.passes, b.errors, b.status) == (1, 0, 1, 'fail')
+
+
+@pytest.mark.parametrize(
+    'baseline, candidate, expected',
+    [
+        ({'task_duration': 100}, {'task_duration': 111}, ['task_duration']),
+        ({'task_duration': 100}, {'task_duration': 109}, []),
+        ({'task_duration': 100}, {'task_duration': 50}, []),
+        ({'hit_rate': 0.8}, {'hit_rate': 0.7}, ['hit_rate']),
+        ({'hit_rate': 0.8}, {'hit_rate': 1.0}, []),
+        ({'turn_count': 0}, {'turn_count': 0}, []),
+        ({'turn_count': 0}, {'turn_count': 1}, ['turn_count']),
+        ({'tool_call_count': 4}, {}, []),
+        (
+            {'turn_count': 10, 'tool_call_count': 10},
+            {'turn_count': 12, 'tool_call_count': 12},
+            ['turn_count', 'tool_call_count'],
+        ),
+    ],
+)
+def test_regressed_metrics(baseline, candidate, expected):
+    comparison = TaskComparison(
+        't',
+        _stats({'success': True, 'metrics': baseline}),
+        _stats({'success': True, 'metrics': candidate}),
+    )
+
+    assert comparison.regressed_metrics() == expected
+
+
+def test_regressed_metrics_respects_threshold():
+    comparison = TaskComparison(
+        't',
+        _stats({'success': True, 'metrics': {'task_duration': 100}}),
+        _stats({'success': True, 'metrics': {'task_duration': 130}}),
+    )
+
+    assert comparison.regressed_metrics(threshold=0.5) == []
+    assert comparison.regressed_metrics(threshold=0.2) == ['task_duration']
+
+
+@pytest.mark.parametrize(
+    'baseline, candidate, flip',
+    [
+        ([True], [False], 'regressed'),
+        ([True, True], [True, False], 'regressed'),
+        ([False], [True, False], 'fixed'),
+        ([True, False], [False, True], None),
+    ],
+)
+def test_flip_compares_pass_status(baseline, candidate, flip):
+    comparison = TaskComparison(
+        't',
+        _stats(*({'success': success} for success in baseline)),
+        _stats(*({'success': success} for success in candidate)),
+    )
+
+    assert comparison.flip == flip
+
+
+def test_compare_runs_joins_by_task_id(tmp_path):
+    baseline = _write_results(
+        tmp_path / 'baseline.jsonl',
+        [
+            {'task_id': 'a', 'success': True, 'metrics': {'task_duration': 20}},
+            {'task_id': 'b', 'success': True, 'metrics': {'task_duration': 10}},
+            {'task_id': 'old', 'success': True},
+        ],
+    )
+    candidate = _write_results(
+        tmp_path / 'candidate.jsonl',
+        [
+            {'task_id': 'new', 'success': True},
+            {'task_id': 'b', 'success': False, 'metrics': {'task_duration': 5}},
+            {'task_id': 'a', 'success': True, 'metrics': {'task_duration': 5}},
+        ],
+    )
+
+    comparison = compare_runs(baseline, candidate)
+
+    assert [t.task_id for t in comparison.tasks] == ['a', 'b']
+    assert comparison.only_in_baseline == ['old']
+    assert comparison.only_in_candidate == ['new']
+    assert comparison.totals('task_duration') == (30.0, 10.0)
+    assert comparison.has_regressions()
+    report = comparison.format_report()
+    assert 'REGRESSED: b (1/1 -> 0/1)' in report
+    assert '(3.00x speedup)' in report
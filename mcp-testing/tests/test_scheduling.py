@@ -0,0 +1,125 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for task sharding, ordering and task history."""
+
+import json
+import pytest
+from evals.core.scheduling import (
+    TaskHistory,
+    load_task_durations,
+    order_longest_first,
+    parse_shard,
+    partition_tasks,
+)
+
+
+@pytest.mark.parametrize('value, expected', [('1/1', (1, 1)), ('2/4', (2, 4)), ('4/4', (4, 4))])
+def test_parse_shard(value, expected):
+    assert parse_shard(value) == expected
+
+
+@pytest.mark.parametrize('value', ['', '1', '1/', 'a/4', '1/2/3', '0/4', '5/4', '1/0', '-1/4'])
+def test_parse_shard_rejects_invalid_values(value):
+    with pytest.raises(ValueError, match='Invalid shard'):
+        parse_shard(value)
+
+
+def test_partition_balances_expected_durations():
+    durations = {'a': 8.0, 'b': 7.0, 'c': 6.0, 'd': 5.0, 'e': 4.0}
+
+    shards = partition_tasks(list(durations), durations, 2)
+
+    # LPT: a->0, b->1, c->1, d->0, e->0 (ties go to the lower shard)
+    assert shards == [['a', 'd', 'e'], ['b', 'c']]
+    assert [sum(durations[key] for key in shard) for shard in shards] == [17.0, 13.0]
+
+
+def test_partition_keeps_declared_order_and_covers_every_task_once():
+    keys = [f'task-{i}' for i in range(10)]
+    durations = {key: float(i % 4 + 1) for i, key in enumerate(keys)}
+
+    shards = partition_tasks(keys, durations, 3)
+
+    assert sorted(key for shard in shards for key in shard) == sorted(keys)
+    for shard in shards:
+        assert shard == [key for key in keys if key in shard]
+
+
+def test_partition_is_independent_of_declared_order():
+    durations = {'a': 3.0, 'b': 3.0, 'c': 3.0, 'd': 1.0}
+
+    forward = partition_tasks(['a', 'b', 'c', 'd'], durations, 2)
+    backward = partition_tasks(['d', 'c', 'b', 'a'], durations, 2)
+
+    assert [sorted(shard) for shard in forward] == [sorted(shard) for shard in backward]
+
+
+def test_partition_uses_median_duration_for_unseen_tasks():
+    # 'new' is expected to take the median (2.0): a->0, b->1, new->1, c->0
+    shards = partition_tasks(['new', 'a', 'b', 'c'], {'a': 4.0, 'b': 2.0, 'c': 1.0}, 2)
+
+    assert shards == [['a', 'c'], ['new', 'b']]
+
+
+def test_partition_without_history_deals_tasks_round_robin_by_id():
+    assert partition_tasks(['d', 'c', 'b', 'a'], {}, 2) == [['c', 'a'], ['d', 'b']]
+
+
+def test_load_task_durations_averages_runs_and_skips_bad_lines(tmp_path):
+    results = tmp_path / 'results.jsonl'
+    lines = [
+        {'task_id': 'a', 'metrics': {'task_duration': 10.0}},
+        {'task_id': 'a', 'metrics': {'task_duration': 20.0}},
+        {'task_id': 'b', 'metrics': None},
+        {'metrics': {'task_duration': 5.0}},
+    ]
+    results.write_text('\n'.join([json.dumps(line) for line in lines] + ['not json', '']))
+
+    assert load_task_durations(results) == {'a': 15.0}
+
+
+def test_unseen_tasks_start_first_in_declared_order():
+    keys = ['short', 'new-1', 'long', 'new-2', 'medium']
+    durations = {'short': 5.0, 'long': 300.0, 'medium': 60.0}
+
+    assert order_longest_first(keys, durations) == [
+        'new-1',
+        'new-2',
+        'long',
+        'medium',
+        'short',
+    ]
+
+
+def test_declared_order_is_kept_without_history_and_for_ties():
+    assert order_longest_first(['c', 'a', 'b'], {}) == ['c', 'a', 'b']
+    assert order_longest_first(['c', 'a', 'b'], {'c': 1.0, 'a': 2.0, 'b': 1.0}) == [
+        'a',
+        'c',
+        'b',
+    ]
+
+
+def test_history_estimates_durations_and_survives_reload(tmp_path):
+    path = tmp_path / 'history.json'
+    history = TaskHistory(path)
+    history.record('timed', {'task_duration': 40.0, 'turn_count': 4})
+    history.record('timed', {'task_duration': 20.0, 'turn_count': 2})
+    history.record('turns-only', {'turn_count': 5})
+    history.save()
+
+    durations = TaskHistory(path).expected_durations(['timed', 'turns-only', 'unseen'])
+
+    assert durations == {'timed': 30.0, 'turns-only': 50.0}
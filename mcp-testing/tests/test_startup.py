@@ -0,0 +1,111 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Startup regression tests for the eval CLI and the lazy evals.core exports."""
+
+import ast
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+CORE_INIT = ROOT / 'evals' / 'core' / '__init__.py'
+
+# Modules that `--list` must not import (loaded only when tasks run)
+HEAVY_MODULES = ('mcp', 'boto3', 'botocore', 'unittest.mock')
+
+# Total import time of `python -m evals tasks --list` (sum of per-module self times)
+IMPORT_TIME_BUDGET_SECONDS = 0.75
+
+
+def _import_times(*args: str) -> dict:
+    """Run the CLI with -X importtime and return self import time (us) per module."""
+    env = {**os.environ, 'MCP_SERVER_ROOT': os.environ.get('MCP_SERVER_ROOT', str(ROOT))}
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-m', 'evals', *args],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:') :].split('|')
+        times[name.strip()] = int(self_us)
+    return times
+
+
+def test_list_does_not_import_heavy_modules():
+    times = _import_times('tasks', '--list')
+
+    assert 'evals.core' in times
+    imported = [name for name in times if name in HEAVY_MODULES or name.startswith('mcp.')]
+    assert imported == []
+
+
+def test_list_stays_within_import_time_budget():
+    times = _import_times('tasks', '--list')
+
+    total_seconds = sum(times.values()) / 1e6
+    slowest = sorted(times.items(), key=lambda item: -item[1])[:10]
+    assert total_seconds < IMPORT_TIME_BUDGET_SECONDS, f'slowest imports (us): {slowest}'
+
+
+def _core_exports():
+    """Return (_LAZY_IMPORTS, TYPE_CHECKING imports, __all__) from evals/core/__init__.py."""
+    tree = ast.parse(CORE_INIT.read_text())
+    lazy, type_checking, exported = {}, {}, []
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name):
+            name = node.targets[0].id
+            if name == '_LAZY_IMPORTS':
+                lazy = ast.literal_eval(node.value)
+            elif name == '__all__':
+                exported = ast.literal_eval(node.value)
+        elif isinstance(node, ast.If) and getattr(node.test, 'id', None) == 'TYPE_CHECKING':
+            for stmt in node.body:
+                if isinstance(stmt, ast.ImportFrom):
+                    for alias in stmt.names:
+                        type_checking[alias.name] = '.' + stmt.module
+    return lazy, type_checking, exported
+
+
+def test_core_export_lists_stay_in_sync():
+    lazy, type_checking, exported = _core_exports()
+
+    assert len(exported) == len(set(exported))
+    assert set(exported) == set(lazy)
+    assert type_checking == lazy
+
+
+def test_lazy_exports_are_defined_in_their_modules():
+    lazy, _, _ = _core_exports()
+
+    for name, module in lazy.items():
+        tree = ast.parse((CORE_INIT.parent / f'{module[1:]}.py').read_text())
+        defined = set()
+        for node in tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                defined.add(node.name)
+            elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+                targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+                defined.update(t.id for t in targets if isinstance(t, ast.Name))
+        assert name in defined, f'{name} is not defined in evals.core{module}'
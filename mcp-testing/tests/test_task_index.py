@@ -0,0 +1,114 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the cached task index."""
+
+import os
+import pytest
+import sys
+import uuid
+from evals.core.task_index import TaskIndex
+
+
+TASK_MODULE = """
+from evals.core.task import Task
+from {package}.config import TASK_IDS
+
+
+class SampleTask(Task):
+    def get_prompt(self, working_directory):
+        return 'prompt'
+
+    def get_server_root_directory(self):
+        return None
+
+    def get_server_file(self):
+        return None
+
+
+TASKS = [SampleTask(id=task_id) for task_id in TASK_IDS]
+"""
+
+
+@pytest.fixture
+def task_dir(tmp_path, monkeypatch):
+    """Task directory with a uniquely named package, so tests do not share sys.modules."""
+    monkeypatch.setattr(sys, 'path', list(sys.path))
+    package = f'pkg_{uuid.uuid4().hex}'
+    (tmp_path / 'tasks' / package).mkdir(parents=True)
+    (tmp_path / 'tasks' / package / 'config.py').write_text("TASK_IDS = ['a', 'b']\n")
+    (tmp_path / 'tasks' / package / 'sample_tasks.py').write_text(
+        TASK_MODULE.format(package=package)
+    )
+    (tmp_path / 'tasks' / package / 'broken_tasks.py').write_text('raise ImportError("no")\n')
+    yield tmp_path / 'tasks', package
+    for name in [name for name in sys.modules if name.startswith(package)]:
+        del sys.modules[name]
+
+
+def _forget_modules(package):
+    """Simulate a new process: drop the task modules imported so far."""
+    for name in [name for name in sys.modules if name.startswith(package)]:
+        del sys.modules[name]
+
+
+def test_later_runs_list_tasks_without_importing(task_dir, tmp_path):
+    task_dir, package = task_dir
+    index_path = tmp_path / 'index.json'
+    assert TaskIndex(task_dir, index_path).get_task_ids() == {
+        f'{package}.sample_tasks': ['a', 'b']
+    }
+
+    _forget_modules(package)
+    assert TaskIndex(task_dir, index_path).get_task_ids() == {
+        f'{package}.sample_tasks': ['a', 'b']
+    }
+    assert f'{package}.sample_tasks' not in sys.modules
+
+
+def test_changed_helper_module_triggers_reindex(task_dir, tmp_path):
+    task_dir, package = task_dir
+    index_path = tmp_path / 'index.json'
+    TaskIndex(task_dir, index_path).get_task_ids()
+
+    _forget_modules(package)
+    config = task_dir / package / 'config.py'
+    config.write_text("TASK_IDS = ['a', 'b', 'c']\n")
+    mtime_ns = config.stat().st_mtime_ns + 10**9
+    os.utime(config, ns=(mtime_ns, mtime_ns))
+
+    assert TaskIndex(task_dir, index_path).get_task_ids() == {
+        f'{package}.sample_tasks': ['a', 'b', 'c']
+    }
+
+
+def test_load_tasks_imports_only_selected_modules(task_dir, tmp_path):
+    task_dir, package = task_dir
+    index_path = tmp_path / 'index.json'
+    TaskIndex(task_dir, index_path).get_task_ids()
+    _forget_modules(package)
+
+    (task_dir / package / 'other_tasks.py').write_text(
+        TASK_MODULE.format(package=package)
+    )
+    index = TaskIndex(task_dir, index_path)
+    assert set(index.get_task_ids()) == {f'{package}.sample_tasks', f'{package}.other_tasks'}
+    _forget_modules(package)
+
+    tasks = index.load_tasks([f'{package}.sample_tasks', f'{package}.broken_tasks'])
+
+    assert {name: [task.id for task in found] for name, found in tasks.items()} == {
+        f'{package}.sample_tasks': ['a', 'b']
+    }
+    assert f'{package}.other_tasks' not in sys.modules
@@ -0,0 +1,136 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for tool call patterns and the investigation tasks that use them."""
+
+import pytest
+from evals.core.tool_call_pattern import (
+    MAX_UNORDERED_GROUP_SIZE,
+    ToolCallPattern,
+    ToolCallPatternError,
+    compile_tool_call_pattern,
+)
+from evals.tasks.applicationsignals.investigations.investigation_tasks import (
+    TASKS,
+    InvestigationTask,
+)
+
+
+@pytest.mark.parametrize(
+    'pattern, calls, matches',
+    [
+        ('a b', ['a', 'b'], True),
+        ('a b', ['b', 'a'], False),
+        ('a b?', ['a'], True),
+        ('a b?', ['a', 'b'], True),
+        ('a b?', ['a', 'b', 'b'], False),
+        ('a b*', ['a'], True),
+        ('a b*', ['a', 'b', 'b', 'b'], True),
+        ('a b+', ['a'], False),
+        ('a b+', ['a', 'b', 'b'], True),
+        ('(a b)+', ['a', 'b', 'a', 'b'], True),
+        ('(a b)+', ['a', 'b', 'a'], False),
+        ('a | b c', ['a'], True),
+        ('a | b c', ['b', 'c'], True),
+        ('a | b c', ['a', 'c'], False),
+    ],
+)
+def test_sequence_alternation_optional_and_repeat(pattern, calls, matches):
+    assert ToolCallPattern(pattern).matches(calls) is matches
+
+
+@pytest.mark.parametrize(
+    'calls, matches',
+    [
+        (['a', 'b', 'c', 'd'], True),
+        (['a', 'c', 'b', 'd'], True),
+        (['a', 'c', 'd', 'b'], False),
+        (['a', 'b', 'd'], False),
+        (['a', 'b', 'b', 'd'], False),
+    ],
+)
+def test_unordered_group_requires_each_item_exactly_once(calls, matches):
+    assert ToolCallPattern('a {b, c} d').matches(calls) is matches
+
+
+def test_unordered_group_items_can_be_patterns():
+    pattern = ToolCallPattern('{a+, b?}')
+
+    assert pattern.matches(['a', 'a'])
+    assert pattern.matches(['b', 'a'])
+    assert not pattern.matches(['b'])
+
+
+def test_any_matches_tools_named_and_not_named_in_the_pattern():
+    pattern = ToolCallPattern('a . b')
+
+    assert pattern.matches(['a', 'a', 'b'])
+    assert pattern.matches(['a', 'unknown_tool', 'b'])
+    assert not pattern.matches(['a', 'b'])
+
+
+def test_other_tools_are_rejected_unless_the_pattern_allows_them():
+    assert not ToolCallPattern('a b').matches(['a', 'unknown_tool', 'b'])
+    assert ToolCallPattern('a .* b').matches(['a', 'x', 'y', 'b'])
+
+
+@pytest.mark.parametrize(
+    'calls, index',
+    [
+        (['list_slos', 'audit_slos'], None),
+        (['get_slo'], 0),
+        (['list_slos', 'audit_slos', 'audit_slos'], 2),
+        (['list_slos'], 1),
+        ([], 0),
+    ],
+)
+def test_find_mismatch_reports_first_rejected_call(calls, index):
+    pattern = ToolCallPattern('list_slos (audit_slos | audit_slos? get_slo audit_slos)')
+
+    assert pattern.find_mismatch(calls) == index
+
+
+@pytest.mark.parametrize(
+    'pattern',
+    ['', '   ', '| a', 'a |', '(a', 'a)', '{a, b', '{}', '*a', 'a & b', 'a ,b'],
+)
+def test_malformed_patterns_are_rejected(pattern):
+    with pytest.raises(ToolCallPatternError):
+        ToolCallPattern(pattern)
+
+
+def test_unordered_group_size_is_bounded():
+    items = ', '.join(f't{i}' for i in range(MAX_UNORDERED_GROUP_SIZE + 1))
+
+    with pytest.raises(ToolCallPatternError, match='at most'):
+        ToolCallPattern(f'{{{items}}}')
+
+
+def test_compiled_patterns_are_reused():
+    assert compile_tool_call_pattern('a b*') is compile_tool_call_pattern('a b*')
+
+
+def test_investigation_task_patterns_compile():
+    for task in TASKS:
+        if task.expected_tool_pattern is not None:
+            ToolCallPattern(task.expected_tool_pattern)
+
+
+@pytest.mark.parametrize(
+    'expectations',
+    [{}, {'expected_tool_calls': [['a']], 'expected_tool_pattern': 'a'}],
+)
+def test_investigation_task_requires_exactly_one_tool_expectation(expectations):
+    with pytest.raises(ValueError, match='exactly one'):
+        InvestigationTask(id='task', prompt='prompt', validation_rubric=[], **expectations)
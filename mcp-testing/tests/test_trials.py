@@ -0,0 +1,88 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for pass rate intervals and trial summaries."""
+
+import pytest
+from evals.core.task_result import TaskResult
+from evals.core.trials import TrialSummary, is_decided, percentile, wilson_interval
+
+
+@pytest.mark.parametrize(
+    'successes, trials, expected',
+    [
+        (8, 10, (0.4902, 0.9433)),
+        (5, 10, (0.2366, 0.7634)),
+        (0, 10, (0.0, 0.2775)),
+        (10, 10, (0.7225, 1.0)),
+        (1, 1, (0.2065, 1.0)),
+    ],
+)
+def test_wilson_interval_matches_reference_values(successes, trials, expected):
+    low, high = wilson_interval(successes, trials)
+
+    assert low == pytest.approx(expected[0], abs=1e-4)
+    assert high == pytest.approx(expected[1], abs=1e-4)
+
+
+def test_wilson_interval_without_trials_is_uninformative():
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+
+
+def test_wilson_interval_widens_with_confidence():
+    narrow = wilson_interval(7, 10, confidence=0.8)
+    wide = wilson_interval(7, 10, confidence=0.99)
+
+    assert wide[0] < narrow[0] < 0.7 < narrow[1] < wide[1]
+
+
+@pytest.mark.parametrize(
+    'successes, trials, threshold, decided',
+    [
+        (0, 0, 0.5, False),
+        (3, 3, 0.5, False),  # interval (0.44, 1.0) still contains 0.5
+        (5, 5, 0.5, True),  # interval (0.57, 1.0) lies above 0.5
+        (0, 5, 0.5, True),  # interval (0.0, 0.43) lies below 0.5
+        (5, 10, 0.5, False),
+        (10, 10, 0.8, False),  # interval (0.72, 1.0) still contains 0.8
+    ],
+)
+def test_is_decided(successes, trials, threshold, decided):
+    assert is_decided(successes, trials, threshold) is decided
+
+
+def test_percentile_interpolates_between_values():
+    assert percentile([], 50) is None
+    assert percentile([3.0], 95) == 3.0
+    assert percentile([4.0, 1.0, 3.0, 2.0], 50) == 2.5
+    assert percentile([1.0, 2.0, 3.0, 4.0, 5.0], 95) == pytest.approx(4.8)
+
+
+def test_trial_summary_counts_errors_as_failures():
+    results = [
+        TaskResult('t', True, metrics={'task_duration': 10.0, 'turn_count': 2}),
+        TaskResult('t', False, metrics={'task_duration': 20.0, 'turn_count': 4}),
+        TaskResult.from_error('t', 'boom'),
+        TaskResult('t', True, metrics={'task_duration': 30.0, 'tool_call_count': 5}),
+    ]
+
+    summary = TrialSummary.from_results('t', results, stopped_early=True)
+
+    assert (summary.trials, summary.passes, summary.errors) == (4, 2, 1)
+    assert summary.pass_rate == 0.5
+    assert (summary.ci_low, summary.ci_high) == wilson_interval(2, 4)
+    assert summary.duration_p50 == 20.0
+    assert summary.mean_turns == 3.0
+    assert summary.mean_tool_calls == 5.0
+    assert str(summary).endswith('1 error(s) [stopped early]')
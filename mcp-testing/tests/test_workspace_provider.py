@@ -0,0 +1,62 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for workspace templates built from the eval samples."""
+
+import pytest
+import shutil
+import subprocess
+from evals.core.workspace_provider import TemplateWorkspaceProvider
+from evals.core.workspace_snapshot import DEPENDENCY_AND_BUILD_DIRS
+from pathlib import Path
+
+
+SAMPLES_DIR = (
+    Path(__file__).resolve().parents[1]
+    / 'evals/tasks/applicationsignals/samples/get-enablement-guide-samples'
+)
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason='requires git')
+
+
+def _tracked_files(directory: Path) -> list:
+    result = subprocess.run(
+        ['git', 'ls-files', '-z'], cwd=directory, capture_output=True, text=True, check=True
+    )
+    return [path for path in result.stdout.split('\0') if path]
+
+
+def test_enablement_template_contains_every_tracked_sample_file():
+    provider = TemplateWorkspaceProvider(SAMPLES_DIR, excluded_dirs=DEPENDENCY_AND_BUILD_DIRS)
+
+    tracked = _tracked_files(SAMPLES_DIR)
+    assert 'infrastructure/lambda/cdk/bin/cdk.ts' in tracked
+    missing = [
+        path
+        for path in tracked
+        if (SAMPLES_DIR / path).is_file() and not (provider.template_dir / path).is_file()
+    ]
+    assert missing == []
+
+
+def test_template_rejects_exclusions_that_drop_tracked_files(tmp_path):
+    (tmp_path / 'bin').mkdir()
+    (tmp_path / 'bin' / 'cdk.ts').write_text('app.synth();\n')
+    subprocess.run(['git', 'init', '-q'], cwd=tmp_path, check=True)
+    subprocess.run(['git', 'add', '.'], cwd=tmp_path, check=True)
+
+    provider = TemplateWorkspaceProvider(tmp_path, excluded_dirs=frozenset({'.git', 'bin'}))
+
+    with pytest.raises(ValueError, match='bin/cdk.ts'):
+        provider.template_dir
@@ -0,0 +1,115 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for in-process workspace snapshots and diffs."""
+
+import os
+import pytest
+import shutil
+import subprocess
+import time
+from evals.core.workspace_snapshot import WorkspaceSnapshot
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    (tmp_path / 'src').mkdir()
+    (tmp_path / 'src' / 'app.py').write_text('def handler():\n    return 1\n')
+    (tmp_path / 'src' / 'old.py').write_text('x = 1\n')
+    (tmp_path / 'README.md').write_text('# App\n')
+    (tmp_path / 'node_modules').mkdir()
+    (tmp_path / 'node_modules' / 'dep.js').write_text('module.exports = 1;\n')
+    return tmp_path
+
+
+def test_changes_reports_added_modified_and_deleted_files(workspace):
+    snapshot = WorkspaceSnapshot.capture(workspace, excluded_dirs=frozenset({'node_modules'}))
+
+    (workspace / 'src' / 'app.py').write_text('def handler():\n    return 2\n')
+    (workspace / 'src' / 'old.py').unlink()
+    (workspace / 'src' / 'new.py').write_text('y = 2\n')
+    (workspace / 'node_modules' / 'dep.js').write_text('module.exports = 2;\n')
+
+    changes = snapshot.changes()
+    assert changes.added == ['src/new.py']
+    assert changes.modified == ['src/app.py']
+    assert changes.deleted == ['src/old.py']
+
+
+def test_rewrite_with_identical_content_is_not_a_change(workspace):
+    snapshot = WorkspaceSnapshot.capture(workspace)
+
+    (workspace / 'README.md').write_text('# App\n')
+
+    assert not snapshot.changes()
+    assert snapshot.diff() == ''
+
+
+def test_edit_during_capture_is_detected_despite_same_size_and_mtime(workspace):
+    path = workspace / 'src' / 'app.py'
+    # An mtime at or after capture time means the file may have changed while capturing
+    mtime_ns = time.time_ns() + 10**10
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    snapshot = WorkspaceSnapshot.capture(workspace)
+
+    path.write_text('def handler():\n    return 3\n')
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    assert snapshot.changes().modified == ['src/app.py']
+
+
+def test_restrict_limits_changes_to_paths(workspace):
+    snapshot = WorkspaceSnapshot.capture(workspace).restrict(['src'])
+
+    (workspace / 'README.md').write_text('# Changed\n')
+    (workspace / 'src' / 'app.py').write_text('changed\n')
+
+    assert snapshot.changes().all_paths == ['src/app.py']
+
+
+def test_diff_reports_new_deleted_binary_and_large_files(workspace):
+    (workspace / 'large.txt').write_text('a' * 100)
+    snapshot = WorkspaceSnapshot.capture(workspace, max_diff_file_size=50)
+
+    (workspace / 'src' / 'new.py').write_text('y = 2')
+    (workspace / 'src' / 'old.py').unlink()
+    (workspace / 'image.bin').write_bytes(b'\0\1\2')
+    (workspace / 'large.txt').write_text('b' * 100)
+
+    diff = snapshot.diff()
+    assert 'diff --git a/src/new.py b/src/new.py\nnew file mode 100644\n' in diff
+    assert '+y = 2\n\\ No newline at end of file\n' in diff
+    assert 'deleted file mode 100644\n--- a/src/old.py\n+++ /dev/null\n' in diff
+    assert 'Binary files /dev/null and b/image.bin differ\n' in diff
+    assert 'File large.txt changed but is too large to diff\n' in diff
+
+
+@pytest.mark.skipif(shutil.which('git') is None, reason='requires git')
+def test_diff_of_modified_file_matches_git_diff(workspace):
+    subprocess.run(['git', 'init', '-q'], cwd=workspace, check=True)
+    subprocess.run(['git', 'add', 'src'], cwd=workspace, check=True)
+    snapshot = WorkspaceSnapshot.capture(workspace, ['src'])
+
+    (workspace / 'src' / 'app.py').write_text('def handler():\n    return 2\n\n# done\n')
+
+    expected = subprocess.run(
+        ['git', 'diff', '--no-color', '--', 'src'],
+        cwd=workspace,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    # git adds an index line with blob hashes, which the snapshot does not compute
+    expected_lines = [line for line in expected.splitlines() if not line.startswith('index ')]
+    assert snapshot.diff().splitlines() == expected_lines